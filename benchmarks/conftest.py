@@ -0,0 +1,18 @@
+"""Session fixtures for the speed benchmarks (see README "Benchmarks")."""
+import numpy as np
+import pytest
+
+from benchmarks.synthetic import SEED, fat_tailed_closes
+
+
+@pytest.fixture(scope="session")
+def daily_returns():
+    closes = fat_tailed_closes(25)
+    return np.log(closes / closes.shift(1)).dropna()
+
+
+@pytest.fixture(scope="session")
+def power_law_lengths():
+    """~2,000 discrete power-law draws (alpha ~2.5, x_min 5)."""
+    rng = np.random.default_rng(SEED)
+    return np.floor(5 * (1 - rng.random(2000)) ** (-1 / 1.5)).astype(int)
@@ -0,0 +1,217 @@
+"""A stand-in for Yahoo: canned histories and option chains behind the
+``yfinance`` surface this repo uses, with configurable latency and failures.
+
+The daily run only talks to Yahoo through ``yfinance`` (``ReturnsRepository``,
+``option_quotes.fetch_spot``, ``tail_plot``), so the benchmark swaps that one
+module rather than standing up an HTTP server::
+
+    market = FakeMarket(latency=0.2, failure_rate=0.1)
+    with market.installed():
+        orchestrate_daily.main(["--no-show"])
+    market.requests   # {"history": 6, "options": 1, "option_chain": 1, ...}
+
+Served API (what the code under test calls):
+
+* ``Ticker(symbol, session=None)`` — ``.history(period)`` (``"max"`` or
+  ``"1d"``; tz-aware index like the real feed), ``.options`` (expiry
+  strings), ``.option_chain(expiry)`` (``.calls`` / ``.puts`` with strike,
+  bid, ask, impliedVolatility).
+* ``download(tickers, start=None, end=None, period=None, ...)`` — a
+  (Price, Ticker) column frame for one or many tickers.
+
+Every call sleeps ``latency`` (+ uniform ``jitter``) seconds and then fails
+with probability ``failure_rate``, the way Yahoo does: ``Ticker`` endpoints
+raise, ``download`` returns an empty frame. Prices are seeded Student-t
+paths ending today, so runs are reproducible; ``shock`` pins a symbol's last
+daily move (default: USO +6%, so the run prints one SIGNAL and exercises the
+high/low levels branch).
+"""
+from __future__ import annotations
+
+import contextlib
+import sys
+import threading
+import time
+import types
+import zlib
+from collections import Counter
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+TRADING_DAYS = 252
+VOL_INDICES = {"^VIX": 19.0, "^VXN": 24.0}  # long-run level of the vol indices
+START_PRICE = {"QQQ": 480.0, "TQQQ": 70.0, "USO": 75.0, "IAU": 55.0, "BRK-B": 450.0}
+DEFAULT_SHOCK = {"USO": 0.06}
+OPTION_DAYS = (30, 60, 91, 120, 182)  # listed expiries, calendar days out
+STRIKE_STEP = 5.0
+
+
+class FakeFeedError(ConnectionError):
+    """An injected Yahoo failure."""
+
+
+def _seed(symbol, seed):
+    return zlib.crc32(symbol.encode()) ^ seed
+
+
+def _vol_index_path(level, n, rng):
+    """Mean-reverting log path around `level` (VIX-like, stays positive)."""
+    log_level, x = np.log(level), np.empty(n)
+    x[0] = log_level
+    shocks = rng.standard_t(4, n) * 0.06
+    for i in range(1, n):
+        x[i] = x[i - 1] + 0.03 * (log_level - x[i - 1]) + shocks[i]
+    return np.exp(x)
+
+
+def _price_path(start, n, rng, last_move):
+    returns = rng.standard_t(3, n) * 0.012 / np.sqrt(3.0)
+    if last_move is not None:
+        returns[-1] = np.log1p(last_move)
+    return start * np.exp(np.cumsum(returns))
+
+
+class FakeMarket:
+    """Seeded canned market data plus the latency / failure / request-count
+    bookkeeping; see the module docstring."""
+
+    def __init__(self, latency=0.0, jitter=0.0, failure_rate=0.0, seed=0,
+                 years=30, shock=None, today=None):
+        self.latency, self.jitter, self.failure_rate = latency, jitter, failure_rate
+        self.seed, self.years = seed, years
+        self.shock = DEFAULT_SHOCK if shock is None else shock
+        self.today = today or date.today()
+        self.requests, self.failures = Counter(), Counter()
+        self._rng = np.random.default_rng(seed)
+        self._lock = threading.Lock()
+        self._frames = {}
+
+    # --- canned data -------------------------------------------------------
+
+    def frame(self, symbol):
+        """Full daily OHLCV history of `symbol` (tz-naive, cached)."""
+        with self._lock:
+            if symbol not in self._frames:
+                self._frames[symbol] = self._build_frame(symbol)
+            return self._frames[symbol]
+
+    def _build_frame(self, symbol):
+        rng = np.random.default_rng(_seed(symbol, self.seed))
+        index = pd.bdate_range(end=pd.Timestamp(self.today), periods=self.years * TRADING_DAYS)
+        if symbol in VOL_INDICES:
+            close = _vol_index_path(VOL_INDICES[symbol], len(index), rng)
+        else:
+            close = _price_path(START_PRICE.get(symbol, 100.0), len(index), rng,
+                                self.shock.get(symbol))
+        spread = np.abs(rng.standard_t(3, len(index))) * 0.004
+        open_ = np.concatenate([[close[0]], close[:-1]])
+        return pd.DataFrame({
+            "Open": open_,
+            "High": np.maximum(open_, close) * (1 + spread),
+            "Low": np.minimum(open_, close) * (1 - spread),
+            "Close": close,
+            "Volume": rng.integers(1_000_000, 50_000_000, len(index)),
+        }, index=pd.DatetimeIndex(index, name="Date"))
+
+    def expiries(self):
+        return [(self.today + timedelta(days=d)).isoformat() for d in OPTION_DAYS]
+
+    def chain(self, symbol, expiry):
+        """Calls/puts every STRIKE_STEP from 50% to 150% of spot, priced off a
+        skewed smile so the OTM wing is dearer in vol than the body."""
+        from py_vollib.black_scholes import black_scholes
+
+        spot = float(self.frame(symbol)["Close"].iloc[-1])
+        t = max((date.fromisoformat(expiry) - self.today).days, 1) / 365.0
+        strikes = np.arange(round(spot * 0.5 / STRIKE_STEP), round(spot * 1.5 / STRIKE_STEP) + 1)
+        strikes = strikes * STRIKE_STEP
+        atm_vol = VOL_INDICES["^VXN"] / 100.0
+        sides = {}
+        for flag in ("c", "p"):
+            vols = atm_vol + 0.6 * np.clip(1.0 - strikes / spot, 0.0, None)
+            prices = np.array([black_scholes(flag, spot, k, t, 0.0, v)
+                               for k, v in zip(strikes, vols)])
+            half_spread = np.maximum(prices * 0.02, 0.01)
+            sides[flag] = pd.DataFrame({
+                "strike": strikes, "bid": np.maximum(prices - half_spread, 0.0),
+                "ask": prices + half_spread, "impliedVolatility": vols})
+        return types.SimpleNamespace(calls=sides["c"], puts=sides["p"])
+
+    # --- the wire ----------------------------------------------------------
+
+    def _request(self, endpoint):
+        """Count, wait, maybe fail — one simulated round trip."""
+        with self._lock:
+            self.requests[endpoint] += 1
+            delay = self.latency + self.jitter * self._rng.random()
+            failed = self._rng.random() < self.failure_rate
+            if failed:
+                self.failures[endpoint] += 1
+        if delay:
+            time.sleep(delay)
+        return not failed
+
+    def history(self, symbol, period="max"):
+        if not self._request("history"):
+            raise FakeFeedError(f"{symbol}: possibly delisted; no price data found")
+        frame = self.frame(symbol)
+        frame = frame.iloc[-1:] if period == "1d" else frame
+        return frame.tz_localize("America/New_York")
+
+    def download(self, tickers, start=None, end=None, period=None, **_kwargs):
+        symbols = [tickers] if isinstance(tickers, str) else list(tickers)
+        if not self._request("download"):
+            return pd.DataFrame()
+        frames = {}
+        for symbol in symbols:
+            frame = self.frame(symbol).drop(columns="Volume")
+            if start is not None:
+                frame = frame.loc[pd.Timestamp(start):]
+            if end is not None:  # yfinance's end is exclusive
+                frame = frame.loc[:pd.Timestamp(end) - pd.Timedelta(days=1)]
+            frames[symbol] = frame
+        wide = pd.concat(frames, axis=1).swaplevel(axis=1).sort_index(axis=1)
+        wide.columns.names = ["Price", "Ticker"]
+        return wide
+
+    # --- the yfinance module ----------------------------------------------
+
+    def module(self):
+        """A module object standing in for ``yfinance``."""
+        market = self
+
+        class Ticker:
+            def __init__(self, symbol, session=None):
+                self.ticker = symbol
+
+            def history(self, period="max", **_kwargs):
+                return market.history(self.ticker, period)
+
+            @property
+            def options(self):
+                if not market._request("options"):
+                    raise FakeFeedError(f"{self.ticker}: no options")
+                return tuple(market.expiries())
+
+            def option_chain(self, expiry):
+                if not market._request("option_chain"):
+                    raise FakeFeedError(f"{self.ticker}: chain unavailable")
+                return market.chain(self.ticker, expiry)
+
+        fake = types.ModuleType("yfinance")
+        fake.Ticker, fake.download = Ticker, self.download
+        return fake
+
+    @contextlib.contextmanager
+    def installed(self):
+        """Route every ``import yfinance`` (and tail_plot's module-level
+        ``yf``) to this market for the duration of the block."""
+        from fentu.pricingservices import tail_plot  # before the swap: real imports
+
+        fake = self.module()
+        with patch.dict(sys.modules, {"yfinance": fake}), \
+                patch.object(tail_plot, "yf", fake):
+            yield self
@@ -0,0 +1,184 @@
+"""End-to-end benchmark of ``orchestrate_daily --no-show`` against FakeMarket.
+
+Runs the whole daily orchestration (portfolio scan, SIGNAL levels, QQQ option
+chain + ^VXN/QQQ history, tail reconstruction, savefig) with Yahoo replaced by
+``fake_market.FakeMarket``, so concurrency / caching / coalescing changes can
+be measured repeatably and offline. Reports, per run:
+
+* total wall time and each task-graph phase (from the ``phase`` spans),
+* time per span category (network / compute / render),
+* request counts (and injected failures) per endpoint,
+* peak RSS of the process.
+
+The chart is written to a temporary directory, never to ``figures/``. Runs
+fetch live (``--no-cache``) unless ``--warm``: then ``prefetch`` first fills a
+scratch market cache (not counted) and the measured run reads from it. Warm
+runs read the cache clock as ``AFTER_CLOSE`` (the cache serves nothing while
+the US session is open), so they are served from disk at any time of day.
+
+CLI
+---
+* ``uv run python -m benchmarks.orchestrate_e2e [--latency S] [--jitter S]``
+  ``[--failure-rate P] [--seed N] [--repeat N] [--skip-tail] [--json PATH]``
+  ``[--warm] [--show-output]``
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from benchmarks.fake_market import FakeMarket
+from fentu.instrumentation import spans
+
+ENV_CACHE = "FENTU_MARKET_CACHE"
+AFTER_CLOSE = datetime(2026, 10, 19, 20, 30, tzinfo=timezone.utc)  # Mon 16:30 ET
+
+
+def after_close():
+    """The benchmark's cache clock: ``AFTER_CLOSE``, whatever the time."""
+    return AFTER_CLOSE
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process so far (MB)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024.0 ** 2 if sys.platform == "darwin" else 1024.0)  # bytes vs KB
+
+
+@contextlib.contextmanager
+def cache_clock(now):
+    """Every MarketCache built inside reads `now()` as the time (None: the
+    real clock)."""
+    from fentu.explatoryservices import market_cache
+
+    real = market_cache.utc_now
+    market_cache.utc_now = now or real
+    try:
+        yield
+    finally:
+        market_cache.utc_now = real
+
+
+def warm_cache(market, cache_dir, now=None):
+    """Prefetch the US jobs into `cache_dir`, then zero the request counts."""
+    from fentu.explatoryservices.market_cache import MarketCache
+    from fentu.orchestrator import prefetch
+
+    with market.installed():
+        prefetch.prefetch("US", MarketCache(cache_dir, now=now))
+    market.requests.clear()
+    market.failures.clear()
+
+
+def run(market, skip_tail=False, workdir=None, cache_dir=None, now=None):
+    """One orchestration run under `market`; the measurements as a dict.
+
+    With `cache_dir` the run reads that market cache, with the cache clock
+    at `now()` when given; otherwise it is live.
+    """
+    from fentu.orchestrator import orchestrate_daily
+
+    argv = ["--no-show"] + (["--skip-tail"] if skip_tail else [])
+    if cache_dir is None:
+        argv.append("--no-cache")
+    else:
+        os.environ[ENV_CACHE] = os.path.abspath(cache_dir)
+    output = io.StringIO()
+    spans.reset()
+    spans.enable()
+    previous = os.getcwd()
+    try:
+        with tempfile.TemporaryDirectory() as scratch, market.installed(), cache_clock(now):
+            os.chdir(workdir or scratch)
+            os.makedirs("figures", exist_ok=True)
+            started = time.perf_counter()
+            with contextlib.redirect_stdout(output):
+                orchestrate_daily.main(argv)
+            wall = time.perf_counter() - started
+    finally:
+        os.chdir(previous)
+        spans.disable()
+        os.environ.pop(ENV_CACHE, None)
+    timing = spans.report()
+    return {
+        "wall_s": wall,
+        "phases": {name: entry["total_s"] for name, entry in timing["spans"].items()
+                   if entry["category"] == "phase"},
+        "categories": timing["categories"],
+        "requests": dict(market.requests),
+        "failures": dict(market.failures),
+        "peak_rss_mb": peak_rss_mb(),
+        "output": output.getvalue(),
+    }
+
+
+def format_result(result):
+    """A few readable lines per run."""
+    phases = " | ".join(f"{name} {s:.2f}s" for name, s in result["phases"].items())
+    categories = " | ".join(f"{cat} {s:.2f}s" for cat, s in result["categories"].items()
+                            if cat != "phase")
+    requests = ", ".join(f"{endpoint} {n}" for endpoint, n in sorted(result["requests"].items()))
+    failed = sum(result["failures"].values())
+    return "\n".join([
+        f"wall {result['wall_s']:.2f}s | peak RSS {result['peak_rss_mb']:.0f} MB",
+        f"  phases: {phases}",
+        f"  spans:  {categories}",
+        f"  requests: {requests} ({sum(result['requests'].values())} total, {failed} failed)",
+    ])
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.25,
+                        help="seconds per simulated request (default 0.25)")
+    parser.add_argument("--jitter", type=float, default=0.0,
+                        help="extra uniform random seconds per request")
+    parser.add_argument("--failure-rate", type=float, default=0.0,
+                        help="probability a request fails (0-1)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3, help="runs to make")
+    parser.add_argument("--skip-tail", action="store_true")
+    parser.add_argument("--json", help="also write every run's measurements here")
+    parser.add_argument("--warm", action="store_true",
+                        help="prefetch into a scratch cache first; time the cached run")
+    parser.add_argument("--show-output", action="store_true",
+                        help="print the orchestration report of the last run")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    results = []
+    for attempt in range(args.repeat):
+        market = FakeMarket(latency=args.latency, jitter=args.jitter,
+                            failure_rate=args.failure_rate, seed=args.seed + attempt)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            if args.warm:
+                warm_cache(market, cache_dir, now=after_close)
+            results.append(run(market, skip_tail=args.skip_tail,
+                               cache_dir=cache_dir if args.warm else None,
+                               now=after_close if args.warm else None))
+        print(f"run {attempt + 1}: {format_result(results[-1])}")
+    walls = sorted(r["wall_s"] for r in results)
+    print(f"wall: min {walls[0]:.2f}s, median {walls[len(walls) // 2]:.2f}s, "
+          f"max {walls[-1]:.2f}s over {len(walls)} runs")
+    if args.show_output:
+        print(results[-1]["output"])
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump([{k: v for k, v in r.items() if k != "output"} for r in results],
+                      fh, indent=2)
+        print(f"measurements: {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
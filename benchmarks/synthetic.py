@@ -0,0 +1,39 @@
+"""Seeded, offline synthetic market data for the speed benchmarks.
+
+Student-t (df=3) daily log returns compound into closes, a VXN-like vol
+series wanders around 25 — fat tails like the real feed, no network.
+"""
+import numpy as np
+import pandas as pd
+
+TRADING_DAYS = 252
+SEED = 20260228
+
+
+def fat_tailed_closes(years, seed=SEED):
+    """Daily closes from Student-t(3) log returns, ~1.2% daily scale."""
+    rng = np.random.default_rng(seed)
+    n = int(years * TRADING_DAYS)
+    index = pd.bdate_range("2000-01-03", periods=n)
+    returns = rng.standard_t(3, n) * 0.012 / np.sqrt(3.0)
+    return pd.Series(300.0 * np.exp(np.cumsum(returns)), index=index, name="Close")
+
+
+def open_high_low_close(years, seed=SEED):
+    close = fat_tailed_closes(years, seed)
+    rng = np.random.default_rng(seed + 1)
+    spread = np.abs(rng.standard_t(3, len(close))) * 0.005
+    return pd.DataFrame({"Open": close.shift(1).fillna(close.iloc[0]),
+                         "High": close * (1 + spread), "Low": close * (1 - spread),
+                         "Close": close})
+
+
+def price_history(years, seed=SEED):
+    """tail_plot.PriceHistory over `years` of synthetic VXN + QQQ closes."""
+    from fentu.pricingservices.tail_plot import PriceHistory
+
+    qqq = fat_tailed_closes(years, seed)
+    rng = np.random.default_rng(seed + 2)
+    vxn = 25.0 * np.exp(np.cumsum(rng.normal(0, 0.05, len(qqq))) * 0.2)
+    return PriceHistory(qqq.index, pd.DataFrame({"Close": vxn}, index=qqq.index),
+                        qqq.to_frame())
@@ -0,0 +1,91 @@
+"""Speed benchmarks for the numeric hot paths (pytest-benchmark).
+
+Correctness lives in tests/; these only time. Kept out of the default
+``pytest`` run (pytest.ini ``testpaths = tests``) — run them explicitly:
+``uv run --group dev pytest benchmarks``.
+"""
+from datetime import date
+
+import numpy as np
+import pytest
+
+from benchmarks.synthetic import fat_tailed_closes, open_high_low_close, price_history
+
+SKEW = {0.20: 6.0, 0.25: 7.0, 0.30: 8.0}
+
+
+@pytest.mark.parametrize("engine", ["bsm", "student-t"])
+@pytest.mark.parametrize("years", [10, 25])
+def test_reconstruct_ratios(benchmark, years, engine):
+    from fentu.pricingservices.tail_plot import reconstruct_ratios
+
+    history = price_history(years)
+    ratios = benchmark(reconstruct_ratios, history, SKEW, 0.25, engine=engine)
+    assert len(ratios) == len(history.dates) * len(SKEW)
+
+
+def test_select_xmin(benchmark, power_law_lengths):
+    from fentu.metaprogramming.function_length_powerlaw import select_xmin
+
+    x_min, alpha, _, _ = benchmark(select_xmin, power_law_lengths)
+    assert x_min is not None and alpha > 1.0
+
+
+@pytest.mark.parametrize("n_bootstrap", [0, 20])
+def test_fit_power_law(benchmark, power_law_lengths, n_bootstrap):
+    from fentu.metaprogramming.function_length_powerlaw import fit_power_law
+
+    fit = benchmark.pedantic(fit_power_law, args=(power_law_lengths,),
+                             kwargs={"n_bootstrap": n_bootstrap}, rounds=3, iterations=1)
+    assert (fit["p"] is not None) == bool(n_bootstrap)
+
+
+def test_calculate_four_moments(benchmark, daily_returns):
+    from fentu.explatoryservices.plotting_service import calculate_four_moments
+
+    moments = benchmark(calculate_four_moments, daily_returns)
+    assert moments[4] > 0  # fat tails: positive excess kurtosis
+
+
+def test_compute_histogram_with_bins(benchmark, daily_returns):
+    from fentu.explatoryservices.see_power_law import (
+        compute_histogram_with_bins,
+        create_log_space_bins,
+    )
+
+    left_tail = np.abs(daily_returns[daily_returns < 0].to_numpy())
+    bins = create_log_space_bins(left_tail.min(), left_tail)
+    density, _, _ = benchmark(compute_histogram_with_bins, left_tail, bins, "manual_density")
+    assert np.isfinite(density).all()
+
+
+@pytest.mark.parametrize("period", ["daily", "weekly", "monthly", "yearly"])
+def test_period_returns(benchmark, period):
+    from fentu.explatoryservices.portfolio_monitor import PortfolioMonitor
+
+    monitor = PortfolioMonitor(period=period, repository=object())
+    returns = benchmark(monitor._period_returns, fat_tailed_closes(25))
+    assert not returns.empty
+
+
+def test_window_high_low(benchmark):
+    from fentu.explatoryservices.high_low_levels import window_high_low
+
+    frame = open_high_low_close(25)
+    end = frame.index[-1].date()
+    stats = benchmark(window_high_low, frame, date(end.year - 1, end.month, 1), end)
+    assert stats["high"] >= stats["low"]
+
+
+def test_range_extrema_lookback_scan(benchmark):
+    """Every 1-24 month lookback off one prebuilt index (the morning scan)."""
+    import pandas as pd
+
+    from fentu.explatoryservices.high_low_levels import RangeExtremaIndex
+
+    frame = open_high_low_close(25)
+    index = RangeExtremaIndex(frame)
+    end = frame.index[-1]
+    starts = [end - pd.DateOffset(months=m) for m in range(1, 25)]
+    scan = benchmark(index.windows_high_low, starts, end)
+    assert len(scan) == 24
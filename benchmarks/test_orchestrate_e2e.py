@@ -0,0 +1,48 @@
+"""End-to-end timing of the daily orchestration against the fake market.
+
+Small latency keeps the run short while still making the network the
+dominant cost, so a lost overlap between phases shows up in the mean.
+"""
+from benchmarks.fake_market import FakeMarket
+from benchmarks.orchestrate_e2e import after_close, format_result, run, warm_cache
+
+LATENCY = 0.05
+
+
+def test_orchestrate_daily_wall_time(benchmark, tmp_path):
+    markets = []
+
+    def one_run():
+        markets.append(FakeMarket(latency=LATENCY))
+        return run(markets[-1], workdir=tmp_path)
+
+    result = benchmark.pedantic(one_run, rounds=3, iterations=1, warmup_rounds=1)
+    benchmark.extra_info.update(requests=result["requests"], phases=result["phases"],
+                                peak_rss_mb=result["peak_rss_mb"])
+    assert set(result["phases"]) == {"portfolio", "levels", "tail_quotes", "tail_history"}
+    assert "USO SIGNAL today" in result["output"]
+    assert "QQQ: 25% OTM put / ATM straddle today" in result["output"]
+    assert list(tmp_path.glob("figures/tail_cheapness_*.png"))
+    # portfolio (4) + one per SIGNAL ticker + the spot quote
+    signals = result["output"].count("SIGNAL today")
+    assert result["requests"]["history"] == 4 + signals + 1
+    assert result["requests"]["download"] == 2
+
+
+def test_orchestrate_daily_survives_a_flaky_feed(tmp_path):
+    market = FakeMarket(failure_rate=0.5, seed=3)
+    result = run(market, workdir=tmp_path)
+
+    assert sum(result["failures"].values()) > 0
+    assert "phase timings:" in result["output"]
+    assert "failed)" in format_result(result)
+
+
+def test_warm_cache_run_makes_no_requests(tmp_path):
+    market = FakeMarket(latency=LATENCY)
+    warm_cache(market, str(tmp_path / "cache"), now=after_close)
+    result = run(market, workdir=tmp_path, cache_dir=str(tmp_path / "cache"),
+                 now=after_close)
+
+    assert result["requests"] == {}
+    assert "QQQ: 25% OTM put / ATM straddle today" in result["output"]
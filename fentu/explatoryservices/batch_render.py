@@ -0,0 +1,209 @@
+"""Headless batch renderer — the morning chart pack in one process tree.
+
+``see_change`` ends every figure in ``plt.show()``: one interactive window per
+ticker x period. This renders the whole pack to files instead:
+
+* every instrument x every period (daily / weekly / monthly / yearly) of the
+  ``VolatilityFacade`` percentage-change figure, and optionally
+* the ``PortfolioMonitor`` 2x2 signal panel for each period,
+
+on the Agg backend, written as PNG and/or SVG, plus an ``index.json`` listing
+every chart (or the error that replaced it — one bad ticker never sinks the
+pack, same discipline as ``morning_brief``).
+
+Reuse, not rebuild: each worker process builds ONE percentage-change layout
+and ONE 2x2 portfolio figure, then clears and redraws them for every render.
+Each worker also memoizes its fetches, so the four periods of a ticker cost
+one price fetch and the VIX panel one ^VIX fetch per worker. Instruments are
+spread across a process pool because matplotlib drawing is CPU-bound (and
+GIL-bound inside one process).
+
+CLI
+---
+* ``python -m fentu.explatoryservices.batch_render QQQ SPY TLT --portfolio``
+  ``[--out figures/batch] [--format png svg] [--jobs N]``
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+matplotlib.use("Agg")  # headless: never open a window
+
+from fentu.explatoryservices.portfolio_monitor import PERIOD_INFO, PortfolioMonitor
+from fentu.explatoryservices.volcalculator import ReturnsRepository, VolatilityFacade
+from fentu.instrumentation.spans import span
+
+PERIODS = tuple(PERIOD_INFO)  # daily, weekly, monthly, yearly
+DEFAULT_OUT_DIR = os.path.join("figures", "batch")
+DEFAULT_FORMATS = ("png",)
+INDEX_FILE = "index.json"
+DPI = 120
+
+_WORKER = {}  # per-process state: repository + reusable figures
+
+
+class MemoRepository(ReturnsRepository):
+    """ReturnsRepository that fetches each instrument at most once.
+
+    The facade asks for prices once per period and for ^VIX once per render;
+    within one batch those are the same frames.
+    """
+
+    def __init__(self, start_date=None, end_date=None):
+        super().__init__(start_date=start_date, end_date=end_date)
+        self._frames = {}
+
+    def _raw_open_high_low_close(self, instrument):
+        if instrument not in self._frames:
+            self._frames[instrument] = super()._raw_open_high_low_close(instrument)
+        return self._frames[instrument]
+
+
+def _init_worker(repository=None):
+    """Process-pool initializer: one repository and lazily built figures."""
+    _WORKER.clear()
+    _WORKER["repository"] = repository if repository is not None else MemoRepository()
+
+
+def _layout(facade):
+    """The reusable percentage-change (fig, axes), built once per worker and
+    cleared before every render."""
+    if "layout" not in _WORKER:
+        fig, *axes = facade._build_percentage_change_figure_layout()
+        _WORKER["layout"] = (fig, axes)
+    fig, axes = _WORKER["layout"]
+    for ax in axes:
+        ax.cla()
+    return fig, axes
+
+
+def chart_stem(name, period):
+    """Filesystem-safe file stem, e.g. '^VIX' daily -> '_VIX_daily'."""
+    return re.sub(r"[^A-Za-z0-9._-]", "_", f"{name}_{period}")
+
+
+def _save(fig, out_dir, stem, formats):
+    paths = []
+    for fmt in formats:
+        path = os.path.join(out_dir, f"{stem}.{fmt}")
+        with span("savefig", "render", path=path):
+            fig.savefig(path, format=fmt, dpi=DPI)
+        paths.append(path)
+    return paths
+
+
+def _entry(kind, name, period, render, out_dir, formats):
+    """Run one render; an exception becomes an index entry, not a crash."""
+    entry = {"kind": kind, "instrument": name, "period": period}
+    try:
+        entry["files"] = _save(render(), out_dir, chart_stem(name, period), formats)
+    except Exception as exc:  # noqa: BLE001 — one bad chart must not sink the pack
+        entry["error"] = f"{type(exc).__name__}: {exc}"
+    return entry
+
+
+def render_instrument(instrument, periods, out_dir, formats, tail_percent=0.10):
+    """All periods of one instrument's percentage-change figure (worker job)."""
+    facade = VolatilityFacade(instrument, repository=_WORKER["repository"])
+
+    def render(period):
+        fig, axes = _layout(facade)
+        return facade.render_percentage_change(fig, axes, period, tail_percent)
+
+    return [_entry("percentage_change", instrument, period,
+                   lambda period=period: render(period), out_dir, formats)
+            for period in periods]
+
+
+def render_portfolio(periods, out_dir, formats):
+    """The 2x2 portfolio signal panel for each period, on one reused figure."""
+    entries = []
+    for period in periods:
+        monitor = PortfolioMonitor(period=period, repository=_WORKER["repository"])
+
+        def render(monitor=monitor):
+            _WORKER["portfolio_fig"] = monitor.render(fig=_WORKER.get("portfolio_fig"))
+            return _WORKER["portfolio_fig"]
+
+        entries.append(_entry("portfolio", "portfolio", period, render,
+                              out_dir, formats))
+    return entries
+
+
+def _run_inline(jobs_spec, repository):
+    _init_worker(repository)
+    return [entry for fn, args in jobs_spec for entry in fn(*args)]
+
+
+def _run_pool(jobs_spec, jobs, repository):
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                             initargs=(repository,)) as pool:
+        futures = [pool.submit(fn, *args) for fn, args in jobs_spec]
+        return [entry for future in futures for entry in future.result()]
+
+
+def render_batch(instruments, out_dir=DEFAULT_OUT_DIR, periods=PERIODS,
+                 formats=DEFAULT_FORMATS, portfolio=False, jobs=None,
+                 repository=None, tail_percent=0.10):
+    """Render the pack and write ``<out_dir>/index.json``; return its path.
+
+    `jobs` worker processes (default: one per core, never more than there
+    are jobs); ``jobs=1`` renders in this process. `repository` is
+    injectable (each worker gets its own copy).
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    jobs_spec = [(render_instrument, (instrument, periods, out_dir, formats, tail_percent))
+                 for instrument in instruments]
+    if portfolio:
+        jobs_spec.append((render_portfolio, (periods, out_dir, formats)))
+    jobs = min(jobs or os.cpu_count() or 1, max(len(jobs_spec), 1))
+    entries = (_run_inline(jobs_spec, repository) if jobs == 1
+               else _run_pool(jobs_spec, jobs, repository))
+    return write_index(out_dir, entries)
+
+
+def write_index(out_dir, entries):
+    path = os.path.join(out_dir, INDEX_FILE)
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump({"charts": entries}, fh, indent=2)
+    return path
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("instruments", nargs="*", help="yfinance tickers, e.g. QQQ SPY")
+    parser.add_argument("--portfolio", action="store_true",
+                        help="also render the 2x2 portfolio signal panel per period")
+    parser.add_argument("--out", default=DEFAULT_OUT_DIR, help="output directory")
+    parser.add_argument("--format", nargs="+", default=list(DEFAULT_FORMATS),
+                        choices=["png", "svg"], help="file format(s)")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="worker processes (default: one per core)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    if not args.instruments and not args.portfolio:
+        print("nothing to render: pass tickers and/or --portfolio")
+        return 1
+    index = render_batch([t.upper() for t in args.instruments], out_dir=args.out,
+                         formats=tuple(args.format), portfolio=args.portfolio,
+                         jobs=args.jobs)
+    with open(index, encoding="utf-8") as fh:
+        charts = json.load(fh)["charts"]
+    failed = [c for c in charts if "error" in c]
+    print(f"rendered {len(charts) - len(failed)}/{len(charts)} charts -> {index}")
+    for chart in failed:
+        print(f"  {chart['instrument']} {chart['period']}: {chart['error']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
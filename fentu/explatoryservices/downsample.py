@@ -0,0 +1,92 @@
+"""Point-budget downsampling for long line panels.
+
+The VIX panel plots every daily close since 1990 (~9,000 points) and the
+high/low chart the whole regime close; at screen resolution most of those
+points land on the same pixel column, yet they all cost render time and SVG
+bytes. A panel instead draws a fixed budget of points, whatever the history
+length.
+
+Two reducers, both returning indices into the original series (so the kept
+points are real prints, never interpolated):
+
+* ``minmax`` (default) — split the series into ``budget // 2`` equal buckets
+  (~one per pixel column) and keep each bucket's min AND max. Every spike
+  survives exactly: the 2008 and 2020 VIX peaks are the max of their bucket,
+  so the drawn envelope is the true one.
+* ``lttb`` — Largest-Triangle-Three-Buckets (Steinarsson 2013): one point per
+  bucket, the one forming the largest triangle with its neighbours. Visually
+  smoother; the global max/min are added back so the extremes still survive.
+
+First and last points are always kept, so the x-range never shrinks.
+"""
+import numpy as np
+import pandas as pd
+
+POINT_BUDGET = 2000  # ~2 points per pixel column on a 12in x 100dpi panel
+
+
+def _numeric(x):
+    """Float x coordinates; datetimes become ns since the epoch."""
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        return x.astype("datetime64[ns]").astype(np.int64).astype(float)
+    return x.astype(float)
+
+
+def _with_ends_and_extremes(indices, y):
+    finite = np.isfinite(y)
+    extremes = []
+    if finite.any():
+        masked = np.where(finite, y, np.nan)
+        extremes = [np.nanargmin(masked), np.nanargmax(masked)]
+    return np.unique(np.concatenate([indices, [0, len(y) - 1], extremes]).astype(np.int64))
+
+
+def minmax_indices(y, budget=POINT_BUDGET):
+    """Indices of each bucket's min and max (``budget // 2`` buckets)."""
+    y = np.asarray(y, dtype=float)
+    n_buckets = max(budget // 2, 1)
+    size = -(-len(y) // n_buckets)  # ceil
+    padded = np.full(n_buckets * size, np.nan)
+    padded[:len(y)] = y
+    buckets = padded.reshape(n_buckets, size)
+    offsets = np.arange(n_buckets) * size
+    lows = np.argmin(np.where(np.isnan(buckets), np.inf, buckets), axis=1) + offsets
+    highs = np.argmax(np.where(np.isnan(buckets), -np.inf, buckets), axis=1) + offsets
+    indices = np.concatenate([lows, highs])
+    return _with_ends_and_extremes(indices[indices < len(y)], y)
+
+
+def lttb_indices(x, y, budget=POINT_BUDGET):
+    """Largest-Triangle-Three-Buckets selection of ~``budget`` indices."""
+    x, y = _numeric(x), np.asarray(y, dtype=float)
+    n = len(y)
+    edges = np.linspace(1, n - 1, max(budget - 2, 1) + 1).astype(np.int64)
+    chosen = [0]
+    for start, end, next_end in zip(edges[:-1], edges[1:], np.append(edges[2:], n)):
+        if end <= start:
+            continue
+        next_x = x[end:next_end].mean() if next_end > end else x[-1]
+        next_y = np.nanmean(y[end:next_end]) if next_end > end else y[-1]
+        a = chosen[-1]
+        area = np.abs((x[a] - next_x) * (y[start:end] - y[a])
+                      - (x[a] - x[start:end]) * (next_y - y[a]))
+        chosen.append(start + int(np.nanargmax(area)) if np.isfinite(area).any() else start)
+    return _with_ends_and_extremes(np.asarray(chosen), y)
+
+
+def downsample_indices(x, y, budget=POINT_BUDGET, method="minmax"):
+    """Indices to keep; all of them when the series already fits the budget."""
+    if len(y) <= budget:
+        return np.arange(len(y))
+    if method == "minmax":
+        return minmax_indices(y, budget)
+    if method == "lttb":
+        return lttb_indices(x, y, budget)
+    raise ValueError(f"method must be 'minmax' or 'lttb', got {method!r}")
+
+
+def downsample_series(series: pd.Series, budget=POINT_BUDGET, method="minmax"):
+    """The points of `series` a panel should draw (a subset, original order)."""
+    return series.iloc[downsample_indices(series.index.values, series.values,
+                                          budget, method)]
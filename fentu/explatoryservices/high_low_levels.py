@@ -29,9 +29,11 @@ from __future__ import annotations
 import sys
 from datetime import date
 
+import numpy as np
 import pandas as pd
 
-from fentu.explatoryservices.volcalculator import ReturnsRepository
+from fentu.explatoryservices.downsample import downsample_series
+from fentu.explatoryservices.volcalculator import OPEN_HIGH_LOW_CLOSE, ReturnsRepository
 
 DEFAULT_INSTRUMENT = "USO"
 WAR_START = date(2026, 2, 28)  # US-Iran war start
@@ -55,22 +57,122 @@ def stop_zone(level, side):
     raise ValueError(f"side must be 'buy' or 'sell', got {side!r}")
 
 
-def window_high_low(open_high_low_close, start, end):
-    """High/low prints and their dates for rows with start <= index <= end."""
-    window = open_high_low_close[(open_high_low_close.index >= pd.Timestamp(start)) & (open_high_low_close.index <= pd.Timestamp(end))]
-    if window.empty:
+def _sparse_table(values, prefer):
+    """Sparse table of arg-extreme positions: row k, column i covers
+    [i, i + 2**k) (columns past n - 2**k are padding). `prefer(a, b)` is True
+    where position a wins; ties keep the earlier position (first occurrence,
+    like idxmax/idxmin)."""
+    n = len(values)
+    table = [np.arange(n)]
+    width = 1
+    while 2 * width <= n:
+        prev = table[-1]
+        left, right = prev[:n - width], prev[width:]
+        row = np.where(prefer(values[left], values[right]), left, right)
+        table.append(np.concatenate([row[:n - 2 * width + 1],
+                                     np.zeros(2 * width - 1, dtype=row.dtype)]))
+        width *= 2
+    return np.vstack(table)
+
+
+class RangeExtremaIndex:
+    """O(1) high/low (and their first print dates) over any date window.
+
+    Built once per frame in O(n log n): sparse tables of argmax(High) and
+    argmin(Low). A window query is two searchsorted lookups plus two table
+    reads, so scanning every 1-24 month lookback across a watchlist costs
+    almost nothing after the build. NaN prints are skipped, as max/min do;
+    a window with no High and no Low print is empty, like one with no rows.
+    """
+
+    def __init__(self, open_high_low_close):
+        frame = open_high_low_close.sort_index()
+        self._dates = frame.index.values.astype("datetime64[ns]")
+        self._high = np.nan_to_num(frame["High"].to_numpy(float), nan=-np.inf)
+        self._low = np.nan_to_num(frame["Low"].to_numpy(float), nan=np.inf)
+        self._high_table = _sparse_table(self._high, np.greater_equal)
+        self._low_table = _sparse_table(self._low, np.less_equal)
+
+    def positions(self, start, end):
+        """(first, last) row positions inside [start, end]; arrays allowed."""
+        first = np.searchsorted(self._dates, np.asarray(start, "datetime64[ns]"), "left")
+        last = np.searchsorted(self._dates, np.asarray(end, "datetime64[ns]"), "right") - 1
+        return first, last
+
+    def _query(self, table, values, prefer, first, last):
+        level = np.log2(np.maximum(last - first + 1, 1)).astype(np.int64)
+        a = table[level, first]
+        b = table[level, last - np.left_shift(1, level) + 1]
+        return np.where(prefer(values[a], values[b]), a, b)
+
+    def argmax_high(self, first, last):
+        return self._query(self._high_table, self._high, np.greater_equal, first, last)
+
+    def argmin_low(self, first, last):
+        return self._query(self._low_table, self._low, np.less_equal, first, last)
+
+    def window_high_low(self, start, end):
+        """Same contract as module-level window_high_low, in O(1)."""
+        first, last = self.positions(pd.Timestamp(start), pd.Timestamp(end))
+        if last < first:
+            return None
+        high_at = int(self.argmax_high(first, last))
+        low_at = int(self.argmin_low(first, last))
+        return _window_stats(self._high[high_at], self._dates[high_at],
+                             self._low[low_at], self._dates[low_at])
+
+    def windows_high_low(self, starts, end):
+        """Vectorized scan: one row per start (e.g. every 1-24 month lookback),
+        all ending at `end`. Windows with no rows (or no prints) come back as
+        NaN/NaT."""
+        first, last = self.positions(pd.to_datetime(starts).values, pd.Timestamp(end))
+        empty = last < first
+        last = np.where(empty, first, last).clip(0, max(len(self._dates) - 1, 0))
+        first = np.minimum(first, last)
+        high_at, low_at = self.argmax_high(first, last), self.argmin_low(first, last)
+        no_high = empty | ~np.isfinite(self._high[high_at])
+        no_low = empty | ~np.isfinite(self._low[low_at])
+        return pd.DataFrame({
+            "start": pd.to_datetime(starts),
+            "high": np.where(no_high, np.nan, self._high[high_at]),
+            "high_date": np.where(no_high, np.datetime64("NaT"), self._dates[high_at]),
+            "low": np.where(no_low, np.nan, self._low[low_at]),
+            "low_date": np.where(no_low, np.datetime64("NaT"), self._dates[low_at]),
+        })
+
+
+def _window_stats(high, high_date, low, low_date):
+    """window_high_low's dict from the extreme prints (±inf = no print);
+    None when the window printed neither."""
+    if not np.isfinite(high) and not np.isfinite(low):
         return None
-    high = float(window["High"].max())
-    low = float(window["Low"].min())
     return {
-        "high": high,
-        "high_date": window["High"].idxmax().date(),
-        "low": low,
-        "low_date": window["Low"].idxmin().date(),
+        "high": float(high) if np.isfinite(high) else np.nan,
+        "high_date": pd.Timestamp(high_date).date() if np.isfinite(high) else None,
+        "low": float(low) if np.isfinite(low) else np.nan,
+        "low_date": pd.Timestamp(low_date).date() if np.isfinite(low) else None,
     }
 
 
-def _windows(today, instrument):
+def window_high_low(open_high_low_close, start, end):
+    """High/low prints and their dates for rows with start <= index <= end.
+
+    None when the window has no rows or no prints. One-off convenience: a
+    single scan of the window; to query several windows of the same frame
+    build a RangeExtremaIndex once and call its window_high_low.
+    """
+    if open_high_low_close.empty:
+        return None
+    window = open_high_low_close.sort_index().loc[pd.Timestamp(start):pd.Timestamp(end)]
+    if window.empty:
+        return None
+    high = np.nan_to_num(window["High"].to_numpy(float), nan=-np.inf)
+    low = np.nan_to_num(window["Low"].to_numpy(float), nan=np.inf)
+    high_at, low_at = int(np.argmax(high)), int(np.argmin(low))
+    return _window_stats(high[high_at], window.index[high_at], low[low_at], window.index[low_at])
+
+
+def lookback_windows(today, instrument):
     """(short_name, label, start) per decision window, both ending at `today`.
 
     Every instrument reports the trailing 2mo and 6mo windows; USO (the war
@@ -103,9 +205,10 @@ def levels_view(open_high_low_close, instrument=DEFAULT_INSTRUMENT, today=None):
     label joins the window names ("2mo+6mo high").
     """
     today = today if today is not None else date.today()
+    index = RangeExtremaIndex(open_high_low_close)
     entries = []
-    for short, _label, start in _windows(today, instrument):
-        stats = window_high_low(open_high_low_close, start, today)
+    for short, _label, start in lookback_windows(today, instrument):
+        stats = index.window_high_low(start, today)
         if stats is None:
             continue
         entries.append(_level_entry(short, "high", stats))
@@ -113,14 +216,20 @@ def levels_view(open_high_low_close, instrument=DEFAULT_INSTRUMENT, today=None):
     return _merge_coincident_levels(entries)
 
 
-def _level_entry(short, kind, stats):
-    stop_side = "buy" if kind == "high" else "sell"
-    price = stats[kind]
+def level_label(short, kind):
+    """'2mo high', 'war low', ...; the trailing 6mo levels are named
+    resistance/support for every ticker."""
     name = kind
     if short == "6mo":
         name = "resistance" if kind == "high" else "support"
+    return f"{short} {name}"
+
+
+def _level_entry(short, kind, stats):
+    stop_side = "buy" if kind == "high" else "sell"
+    price = stats[kind]
     return {
-        "label": f"{short} {name}",
+        "label": level_label(short, kind),
         "short": short,
         "kind": kind,
         "price": price,
@@ -161,8 +270,9 @@ def _report_from_open_high_low_close(open_high_low_close, instrument, today):
         return f"{instrument} unavailable"
     last = float(open_high_low_close["Close"].iloc[-1])
     lines = [f"{instrument} @ {last:.2f}"]
-    for _short, label, start in _windows(today, instrument):
-        lines.append(_window_line(label, window_high_low(open_high_low_close, start, today), last))
+    index = RangeExtremaIndex(open_high_low_close)
+    for _short, label, start in lookback_windows(today, instrument):
+        lines.append(_window_line(label, index.window_high_low(start, today), last))
     return "\n".join(lines)
 
 
@@ -202,6 +312,7 @@ def plot_high_low_levels(open_high_low_close, instrument, today=None, ax=None, s
     if regime.empty:
         regime = close
 
+    regime = downsample_series(regime)  # long regimes: fixed point budget
     ax.plot(regime.index, regime.values, color="black", lw=1.2, label="close")
     for entry in levels_view(open_high_low_close, instrument=instrument, today=today):
         style = _LEVEL_STYLE[(entry["short"], entry["kind"])]
@@ -232,7 +343,8 @@ def main(argv=None):
     want_plot = "--plot" in args
     tickers = [a for a in args if not a.startswith("-")]
     instrument = tickers[0] if tickers else DEFAULT_INSTRUMENT
-    open_high_low_close = ReturnsRepository().try_fetch_open_high_low_close(instrument)
+    repository = ReturnsRepository(columns=OPEN_HIGH_LOW_CLOSE)
+    open_high_low_close = repository.try_fetch_open_high_low_close(instrument)
     print(_report_from_open_high_low_close(open_high_low_close, instrument, date.today()))
     if want_plot and open_high_low_close is not None and not open_high_low_close.empty:
         plot_high_low_levels(open_high_low_close, instrument)
@@ -0,0 +1,231 @@
+"""Live CHUTE monitor — the morning brief's MAD gate, tick by tick.
+
+``morning_brief`` scores one number a day: the last close against the prior
+60-day calm. During the session the question is the same but it is asked
+every minute: how many MADs below yesterday's close is this name trading
+*now*, and has it just fallen through the ``CHUTE_THRESHOLD`` gate?
+
+The calibration is taken once, before the first tick, from completed daily
+closes only (the session's own bars never calibrate their denominator) and
+then frozen for the session. Each tracker keeps the prior close and one
+precomputed scale, so a tick costs one subtraction and one multiplication:
+
+    mad_multiple = (price - prior_close) * 100 / (prior_close * MAD)
+
+An alert fires on the tick that crosses below ``-CHUTE_THRESHOLD`` and
+re-arms once the name trades back above it, so a name sitting in the chute
+does not alert every minute. Nothing is retained per tick — no bar history,
+no growing lists — so memory is constant however long the session runs:
+the poll refetches the day's 1-minute bars (a transient frame of at most
+~400 rows) and only bars at or after the last one seen are scored; a replay
+streams its CSV one row at a time.
+
+CLI
+---
+* ``python -m fentu.explatoryservices.live_chute [TICKER ...]``
+  ``[--every S] [--polls N]`` — poll today's 1m bars for the watchlist
+  (default ``stop_cluster_scan.DEFAULT_WATCHLIST``) and print CHUTE alerts.
+* ``... --replay BARS.csv [--session YYYY-MM-DD]`` — replay recorded bars
+  (``timestamp,ticker,close`` rows in time order) against the calibration
+  as of that session.
+
+Calibration histories are read through the local market cache when
+``prefetch`` filled it after the close and the session has not opened yet
+(``FENTU_MARKET_CACHE=off`` to always fetch); a start mid-session fetches
+them live, and the intraday bars are always live.
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import time
+from dataclasses import dataclass
+from datetime import date, datetime
+
+import pandas as pd
+
+from fentu.explatoryservices.market_cache import MarketCache
+from fentu.explatoryservices.morning_brief import (
+    CHUTE_THRESHOLD,
+    is_chute,
+    mad_suffix,
+    window_mad,
+)
+from fentu.explatoryservices.polling import POLL_SECONDS, add_poll_arguments, poll_loop
+from fentu.explatoryservices.stop_cluster_scan import DEFAULT_WATCHLIST
+from fentu.explatoryservices.volcalculator import ReturnsRepository, _now_eastern
+
+BAR_INTERVAL = "1m"
+
+
+@dataclass(frozen=True)
+class ChuteAlert:
+    """A tick that fell through the CHUTE gate."""
+
+    ticker: str
+    at: datetime
+    price: float
+    pct: float
+    mad_multiple: float
+
+    def __str__(self):
+        return (f"{self.at:%H:%M} {self.ticker} {self.price:,.2f} "
+                f"({self.pct:+.2f}% vs prior close{mad_suffix(self.mad_multiple)})")
+
+
+class ChuteTracker:
+    """Frozen-calibration state for one ticker; `update` is O(1)."""
+
+    __slots__ = ("ticker", "prior_close", "mad", "_scale", "last_seen",
+                 "mad_multiple", "in_chute")
+
+    def __init__(self, ticker, prior_close, mad):
+        self.ticker = ticker
+        self.prior_close = prior_close
+        self.mad = mad
+        self._scale = 100.0 / (prior_close * mad)  # price move -> MAD multiple
+        self.last_seen = None
+        self.mad_multiple = None
+        self.in_chute = False
+
+    @property
+    def chute_price(self):
+        """The price at which a tick crosses the gate."""
+        return self.prior_close - CHUTE_THRESHOLD / self._scale
+
+    def update(self, price, at=None):
+        """Score one tick; a ChuteAlert on a fresh crossing, else None."""
+        self.last_seen = at
+        self.mad_multiple = (price - self.prior_close) * self._scale
+        if not is_chute(self.mad_multiple):
+            self.in_chute = False
+            return None
+        if self.in_chute:
+            return None
+        self.in_chute = True
+        return ChuteAlert(self.ticker, at, float(price),
+                          self.mad_multiple * self.mad, self.mad_multiple)
+
+
+def calibrate(ticker, close, session_date):
+    """A ChuteTracker from daily closes completed before `session_date`.
+
+    A daily history fetched mid-session ends with the session's own partial
+    row; it is dropped, so the prior close is yesterday's and the MAD window
+    is the 60 returns before it. None when there is no usable window.
+    """
+    close = close[close.index < pd.Timestamp(session_date)].dropna()
+    if len(close) < 2:
+        return None
+    mad = window_mad(close.pct_change().iloc[1:] * 100.0)
+    if mad is None:
+        return None
+    return ChuteTracker(ticker, float(close.iloc[-1]), mad)
+
+
+class LiveChuteMonitor:
+    """Routes ticks to per-ticker trackers; the only state is the trackers."""
+
+    def __init__(self, trackers):
+        self.trackers = {tracker.ticker: tracker for tracker in trackers}
+
+    @classmethod
+    def calibrated(cls, tickers, repository, session_date):
+        """(monitor, tickers that could not be calibrated)."""
+        trackers, skipped = [], []
+        for ticker in tickers:
+            history = repository.try_fetch_open_high_low_close(ticker)
+            tracker = None if history is None else calibrate(
+                ticker, history["Close"], session_date)
+            if tracker is None:
+                skipped.append(ticker)
+            else:
+                trackers.append(tracker)
+        return cls(trackers), skipped
+
+    def on_tick(self, ticker, at, price):
+        """Score one bar; stale bars (before the last one seen) are ignored.
+
+        The bar equal to the last one seen is rescored: a poll returns the
+        minute still forming, whose close moves until the minute ends.
+        """
+        tracker = self.trackers.get(ticker)
+        if tracker is None or (tracker.last_seen is not None and at < tracker.last_seen):
+            return None
+        return tracker.update(price, at)
+
+    def poll(self, repository, interval=BAR_INTERVAL):
+        """Fetch each ticker's bars once and score the new ones; the alerts."""
+        alerts = []
+        for ticker, tracker in self.trackers.items():
+            bars = repository.try_fetch_intraday_bars(ticker, interval)
+            if bars is None or bars.empty:
+                continue
+            close = bars["Close"].dropna()
+            if tracker.last_seen is not None:
+                close = close[close.index >= tracker.last_seen]
+            for at, price in close.items():
+                alert = self.on_tick(ticker, at, price)
+                if alert is not None:
+                    alerts.append(alert)
+        return alerts
+
+    def replay(self, ticks):
+        """Score an iterable of ``(at, ticker, price)``; yields alerts lazily."""
+        for at, ticker, price in ticks:
+            alert = self.on_tick(ticker, at, price)
+            if alert is not None:
+                yield alert
+
+
+def read_ticks(path):
+    """Stream ``(at, ticker, close)`` from a ``timestamp,ticker,close`` CSV."""
+    with open(path, newline="") as fh:
+        for row in csv.DictReader(fh):
+            yield datetime.fromisoformat(row["timestamp"]), row["ticker"], float(row["close"])
+
+
+def run(monitor, repository, every=POLL_SECONDS, polls=None, sleep=time.sleep,
+        emit=print):
+    """Poll every `every` seconds, emitting alerts; `polls` bounds the loop."""
+    def poll():
+        for alert in monitor.poll(repository):
+            emit(str(alert))
+
+    poll_loop(poll, every, polls, sleep)
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("tickers", nargs="*", default=list(DEFAULT_WATCHLIST),
+                        metavar="TICKER")
+    add_poll_arguments(parser)
+    parser.add_argument("--replay", metavar="CSV",
+                        help="replay timestamp,ticker,close rows instead of polling")
+    parser.add_argument("--session", type=date.fromisoformat, default=None,
+                        help="session date to calibrate before (default: today, ET)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    session = args.session or _now_eastern().date()
+    repository = ReturnsRepository(columns=("Close",), cache=MarketCache.from_env())
+    monitor, skipped = LiveChuteMonitor.calibrated(args.tickers, repository, session)
+    for tracker in monitor.trackers.values():
+        print(f"{tracker.ticker}: prior close {tracker.prior_close:,.2f}, "
+              f"MAD {tracker.mad:.2f}%, CHUTE below {tracker.chute_price:,.2f}")
+    for ticker in skipped:
+        print(f"{ticker} unavailable")
+    if args.replay:
+        for alert in monitor.replay(read_ticks(args.replay)):
+            print(alert)
+        return
+    try:
+        run(monitor, repository, args.every, args.polls)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
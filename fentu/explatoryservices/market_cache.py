@@ -0,0 +1,190 @@
+"""Local market-data cache: fetched once after the close, read all morning.
+
+An entry is *fresh* when it was fetched after its market's most recent
+close and the market has not reopened since — while it is closed, nothing
+newer can exist — so a warm entry is served without touching the network,
+and a stale one is refetched and replaced. During the session (09:30-16:00
+local) nothing is served from disk: every read fetches live data, and what
+it stores goes stale at the close. ``prefetch`` fills the cache shortly
+after each close; the interactive commands (``morning_brief``,
+``orchestrate_daily``) then read it.
+
+    cache = MarketCache()                        # .market_cache/
+    frame = cache.get_or_fetch(("ohlc", "^HSI"), "HK", fetch)
+
+Sessions are 09:30-16:00 local on weekdays: Hong Kong (UTC+8, no DST) and
+New York (US DST via ``volcalculator.is_us_dst``, taken on the session's
+own date). Tokyo, Seoul and Sydney close before Hong Kong, so their indices
+ride the HK close. Markets still trading during the US morning (European
+indices, FX) are ``LIVE``: never cached.
+Exchange holidays are not modelled: the first run after one simply refetches
+once.
+
+Entries are pickles (frames, quote dicts, ``tail_plot`` inputs) written
+atomically, so a reader never sees a half-written file. Location:
+``FENTU_MARKET_CACHE`` (a directory, or ``off`` to disable), default
+``.market_cache/`` in the working directory.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+from datetime import datetime, time, timedelta, timezone
+
+from fentu.explatoryservices.volcalculator import is_us_dst
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROOT = ".market_cache"
+ENV_VAR = "FENTU_MARKET_CACHE"
+MARKET_OPEN = time(9, 30)  # local open, both markets
+MARKET_CLOSE = time(16, 0)  # local close, both markets
+MARKETS = ("HK", "US")
+LIVE = "LIVE"  # trading while the morning commands run: always fetched
+HK_TICKERS = ("^HSI", "^N225", "^KS11", "^AXJO")  # settled by the HK close
+LIVE_TICKERS = ("^STOXX50E", "^GDAXI", "^FTSE", "^FCHI")
+
+
+def market_of(ticker):
+    """'HK' for Asia-Pacific listings/indices, 'LIVE' for Europe and FX,
+    else 'US'."""
+    ticker = ticker.upper()
+    if ticker in HK_TICKERS or ticker.endswith(".HK"):
+        return "HK"
+    if ticker in LIVE_TICKERS or ticker.endswith("=X"):
+        return LIVE
+    return "US"
+
+
+def latest_market(markets):
+    """The market whose data settles last: LIVE, then US, then HK."""
+    markets = set(markets)
+    return next(m for m in (LIVE, "US", "HK") if m in markets)
+
+
+def utc_offset(market, day):
+    """Local time minus UTC for `market` on the date `day`."""
+    if market == "HK":
+        return timedelta(hours=8)
+    noon = datetime.combine(day, time(12, 0), tzinfo=timezone.utc)
+    return timedelta(hours=-4 if is_us_dst(noon) else -5)
+
+
+def _local_utc(market, day, at):
+    """The local wall time `at` on `day`, in UTC."""
+    return datetime.combine(day, at, tzinfo=timezone.utc) - utc_offset(market, day)
+
+
+def last_close(market, now_utc):
+    """The most recent weekday 16:00 local close at or before `now_utc`."""
+    day = now_utc.date() + timedelta(days=1)
+    while day.weekday() >= 5 or _local_utc(market, day, MARKET_CLOSE) > now_utc:
+        day -= timedelta(days=1)
+    return _local_utc(market, day, MARKET_CLOSE)
+
+
+def next_close(market, now_utc):
+    """The first weekday 16:00 local close strictly after `now_utc`."""
+    day = now_utc.date() - timedelta(days=1)
+    while day.weekday() >= 5 or _local_utc(market, day, MARKET_CLOSE) <= now_utc:
+        day += timedelta(days=1)
+    return _local_utc(market, day, MARKET_CLOSE)
+
+
+def is_open(market, now_utc):
+    """True while `market` is in its weekday 09:30-16:00 local session."""
+    close = next_close(market, now_utc)
+    day = (close + utc_offset(market, close.date())).date()
+    return _local_utc(market, day, MARKET_OPEN) <= now_utc
+
+
+def utc_now():
+    """The current time, tz-aware UTC (the default cache clock)."""
+    return datetime.now(timezone.utc)
+
+
+class MarketCache:
+    """Pickled entries under `root`, fresh from a close until the next open."""
+
+    def __init__(self, root=DEFAULT_ROOT, now=None):
+        self.root = root
+        self._now = now if now is not None else utc_now
+
+    @classmethod
+    def from_env(cls):
+        """The CLI cache: ``$FENTU_MARKET_CACHE`` or ``.market_cache``;
+        None when the variable is ``off``."""
+        root = os.environ.get(ENV_VAR, DEFAULT_ROOT)
+        return None if root.lower() == "off" else cls(root)
+
+    def _path(self, key):
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()[:16]
+        label = "-".join(str(part) for part in key)
+        slug = "".join(ch if ch.isalnum() else "_" for ch in label)[:40]
+        return os.path.join(self.root, f"{slug}-{digest}.pkl")
+
+    def _read(self, key):
+        try:
+            with open(self._path(key), "rb") as fh:
+                return pickle.load(fh)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+    def fetched_at(self, key):
+        """When `key` was stored (UTC), or None if it is not cached."""
+        entry = self._read(key)
+        return None if entry is None else entry["fetched_at"]
+
+    def _fresh(self, entry, market):
+        now = self._now()
+        return (entry is not None and not is_open(market, now)
+                and entry["fetched_at"] >= last_close(market, now))
+
+    def is_fresh(self, key, market):
+        return self._fresh(self._read(key), market)
+
+    def get(self, key, market):
+        """The cached value if fresh, else None."""
+        entry = self._read(key)
+        return entry["value"] if self._fresh(entry, market) else None
+
+    def put(self, key, value):
+        os.makedirs(self.root, exist_ok=True)
+        path = self._path(key)
+        scratch = f"{path}.{os.getpid()}.tmp"
+        with open(scratch, "wb") as fh:
+            pickle.dump({"key": key, "fetched_at": self._now(), "value": value}, fh,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(scratch, path)
+        return value
+
+    def get_or_fetch(self, key, market, fetch):
+        """Fresh cached value, or `fetch()` stored and returned.
+
+        Nothing is stored when `fetch` raises or returns None / an empty
+        frame, so a feed hiccup is retried on the next call. LIVE markets
+        are always fetched and never stored.
+        """
+        if market == LIVE:
+            return fetch()
+        value = self.get(key, market)
+        if value is not None:
+            logger.debug("cache hit %s", key)
+            return value
+        return self.refresh(key, fetch)
+
+    def refresh(self, key, fetch):
+        """Fetch now and store (the prefetch path); returns the value."""
+        value = fetch()
+        if value is None or getattr(value, "empty", False):
+            return value
+        return self.put(key, value)
+
+
+def cached(cache, key, market, fetch):
+    """`fetch` routed through `cache` (a plain call when cache is None)."""
+    if cache is None:
+        return fetch
+    return lambda: cache.get_or_fetch(key, market, fetch)
@@ -17,17 +17,45 @@ hedger. STD is forbidden (a body metric on a fat-tailed variable; STD/MAD
 prints `CHUTE`. See `featurerequest/morning_brief_mad_chute.md`.
 
 
+Overnight brief: the same line for every market in ``OVERNIGHT_MARKETS``
+(Asia-Pacific closes, the Euro Stoxx open, FX), one per market, HSI first and
+worded exactly as above. The fetches run concurrently against one deadline,
+so the brief takes as long as the slowest market (at most ``FETCH_TIMEOUT``),
+not the sum; a market that fails or misses the deadline prints
+``<label> unavailable`` and the other lines are unaffected.
+
 CLI
 ---
-* ``python -m fentu.explatoryservices.morning_brief``  — print the one-line
-  overnight HSI summary (last close + % move o/n), or ``HSI unavailable`` on a
-  network hiccup.
+* ``python -m fentu.explatoryservices.morning_brief [LABEL ...]``
+  ``[--timeout S]`` — print the overnight brief (default: every market in
+  ``OVERNIGHT_MARKETS``; ``HSI`` alone gives the original one-liner), or
+  ``<label> unavailable`` per market on a network hiccup. Served from the
+  local market cache when ``prefetch`` filled it after the close
+  (``FENTU_MARKET_CACHE=off`` to always fetch).
 """
+import argparse
+import queue
+import threading
+import time
+
+from fentu.explatoryservices.market_cache import MarketCache
 from fentu.explatoryservices.volcalculator import ReturnsRepository
 
 HSI_TICKER = "^HSI"
 MAD_WINDOW = 60
 CHUTE_THRESHOLD = 2.5
+FETCH_TIMEOUT = 10.0  # seconds; the whole brief waits at most this long
+
+# (label, yfinance ticker, decimals shown for the last close)
+OVERNIGHT_MARKETS = (
+    ("HSI", HSI_TICKER, 0),
+    ("Nikkei", "^N225", 0),
+    ("KOSPI", "^KS11", 0),
+    ("ASX200", "^AXJO", 0),
+    ("EuroStoxx50", "^STOXX50E", 0),
+    ("USDJPY", "JPY=X", 2),
+    ("EURUSD", "EURUSD=X", 4),
+)
 
 
 def morning_brief(repository=None):
@@ -41,17 +69,67 @@ def morning_brief(repository=None):
     `repository` is injectable for testing (defaults to a fresh
     `ReturnsRepository`, which does NO I/O until asked).
     """
-    repo = repository if repository is not None else ReturnsRepository()
-    reading = _overnight_reading(repo, HSI_TICKER)
+    repo = repository if repository is not None else ReturnsRepository(columns=("Close",))
+    return _format_line("HSI", _overnight_reading(repo, HSI_TICKER), 0)
+
+
+def overnight_brief(markets=OVERNIGHT_MARKETS, repository=None, timeout=FETCH_TIMEOUT):
+    """One morning-brief line per market, fetched concurrently.
+
+    `markets` is ``(label, ticker, decimals)`` triples; lines keep that
+    order. Every fetch starts at once and the brief waits at most `timeout`
+    seconds in total; a market not back by then reads ``unavailable``.
+    """
+    repo = repository if repository is not None else ReturnsRepository(columns=("Close",))
+    frames = _fetch_concurrently(repo, [ticker for _label, ticker, _d in markets], timeout)
+    return "\n".join(
+        _format_line(label, _reading_from_frame(frames[ticker]), decimals)
+        for label, ticker, decimals in markets)
+
+
+def _fetch_concurrently(repo, tickers, timeout):
+    """ticker -> close frame, or None on failure / past the deadline.
+
+    Daemon threads, not a pool: a fetch that hangs past the deadline must
+    not hold up the brief (or interpreter exit) waiting to be joined.
+    """
+    landed = queue.Queue()
+
+    def fetch(ticker):
+        try:
+            landed.put((ticker, repo.try_fetch_open_high_low_close(ticker)))
+        except Exception:  # noqa: BLE001 — a bad market is one unavailable line
+            landed.put((ticker, None))
+
+    for ticker in dict.fromkeys(tickers):
+        threading.Thread(target=fetch, args=(ticker,), daemon=True,
+                         name=f"brief-{ticker}").start()
+    frames = dict.fromkeys(tickers)
+    deadline = time.monotonic() + timeout
+    for _ in range(len(frames)):
+        try:
+            ticker, frame = landed.get(timeout=max(deadline - time.monotonic(), 0.0))
+        except queue.Empty:
+            break
+        frames[ticker] = frame
+    return frames
+
+
+def _format_line(label, reading, decimals):
     if reading is None:
-        return "HSI unavailable"
+        return f"{label} unavailable"
     last, pct, mad_multiple = reading
     pct_sign = "+" if pct >= 0 else ""
-    mad_line = _mad_suffix(mad_multiple)
-    return f"HSI {last:,.0f} ({pct_sign}{pct:.2f}% o/n{mad_line})"
+    mad_line = mad_suffix(mad_multiple)
+    return f"{label} {last:,.{decimals}f} ({pct_sign}{pct:.2f}% o/n{mad_line})"
+
 
+def is_chute(mad_multiple):
+    """True when a signed MAD-multiple fell through the CHUTE gate."""
+    return mad_multiple < -CHUTE_THRESHOLD
 
-def _mad_suffix(mad_multiple):
+
+def mad_suffix(mad_multiple):
     """Render the signed MAD-multiple and the chute/escalator flag.
 
     ``None`` (calibration window empty / MAD zero) ⇒ no suffix: we still report
@@ -60,7 +138,7 @@ def _mad_suffix(mad_multiple):
     if mad_multiple is None:
         return ""
     mad_sign = "+" if mad_multiple >= 0 else ""
-    flag = "CHUTE" if mad_multiple < -CHUTE_THRESHOLD else "escalator"
+    flag = "CHUTE" if is_chute(mad_multiple) else "escalator"
     return (
         f", {mad_sign}{mad_multiple:.1f} MAD over {MAD_WINDOW}d — {flag}"
     )
@@ -74,7 +152,11 @@ def _overnight_reading(repo, ticker):
     is empty (no MAD to compute). The morning brief must never crash on a
     network hiccup before coffee.
     """
-    open_high_low_close = repo.try_fetch_open_high_low_close(ticker)
+    return _reading_from_frame(repo.try_fetch_open_high_low_close(ticker))
+
+
+def _reading_from_frame(open_high_low_close):
+    """``(last_close, pct, mad_multiple)`` from a fetched frame, or None."""
     if open_high_low_close is None:
         return None
     close = open_high_low_close.get("Close")
@@ -102,18 +184,42 @@ def _signed_mad_multiple(close, overnight_pct):
     not have.
     """
     returns = close.pct_change().iloc[1:-1] * 100.0  # prior returns only
-    window = returns.dropna().iloc[-MAD_WINDOW:]
+    mad = window_mad(returns)
+    if mad is None:
+        return None
+    return float(overnight_pct / mad)
+
+
+def window_mad(returns_pct):
+    """MAD of the last ``MAD_WINDOW`` percent returns, or None if empty / zero."""
+    window = returns_pct.dropna().iloc[-MAD_WINDOW:]
     if window.empty:
         return None
     mad = window.sub(window.mean()).abs().mean()
     if not mad or mad != mad:  # 0.0 or NaN
         return None
-    return float(overnight_pct / mad)
-
-
-
-def main():
-    print(morning_brief())
+    return float(mad)
+
+
+def _parse_args(argv):
+    labels = [label for label, _ticker, _decimals in OVERNIGHT_MARKETS]
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("markets", nargs="*", default=labels, metavar="LABEL",
+                        help=f"markets to brief (default: all of {', '.join(labels)})")
+    parser.add_argument("--timeout", type=float, default=FETCH_TIMEOUT,
+                        help="seconds to wait for the slowest market")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    by_label = {market[0].lower(): market for market in OVERNIGHT_MARKETS}
+    unknown = [label for label in args.markets if label.lower() not in by_label]
+    if unknown:
+        raise SystemExit(f"unknown markets: {', '.join(unknown)}")
+    repository = ReturnsRepository(columns=("Close",), cache=MarketCache.from_env())
+    markets = [by_label[label.lower()] for label in args.markets]
+    print(overnight_brief(markets, repository, args.timeout))
 
 
 if __name__ == "__main__":
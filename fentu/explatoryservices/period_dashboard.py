@@ -0,0 +1,258 @@
+"""Persistent percentage-change dashboard — switch period without a rebuild.
+
+``visualize_percentage_change`` used to rebuild the whole 3x2 figure per
+call: gridspec, QQ plot, seaborn histogram, both log-log panels and the full
+1990 -> today VIX line. Only the top four panels depend on the period.
+
+``PeriodDashboard`` builds the figure ONCE:
+
+* static artists — layout, VIX panel, axis labels, legends, grids — are drawn
+  once and live in the cached background;
+* data artists — QQ points + fit line, the fixed-count histogram bars, the
+  normal / Student-t curves, the tail log-log points + fit, the moments and
+  alpha texts — are ``animated`` and only ever updated via ``set_data`` /
+  ``set_height``.
+
+Per-period view-models (the fits are the expensive part) are computed once
+and cached. The first visit to a period pays one full draw, whose background
+(ticks and limits included) is cached per (period, canvas size); every later
+visit restores that background and blits the data artists, so toggling is an
+interactive-speed operation.
+
+Keys: ``d`` daily, ``w`` weekly, ``m`` monthly, ``y`` yearly.
+"""
+import numpy as np
+
+import fentu.explatoryservices.plotting_service as ps
+import fentu.explatoryservices.see_power_law as spl
+
+PERIOD_KEYS = {"d": "daily", "w": "weekly", "m": "monthly", "y": "yearly"}
+HISTOGRAM_BINS = 100
+MARGIN = 0.05  # fraction of the data span padded onto linear limits
+LOG_MARGIN = 1.5  # factor padded onto log-log limits
+
+
+# ---------------------------------------------------------------------------
+# View-models: pure computation, no axes.
+# ---------------------------------------------------------------------------
+
+
+def qq_view(returns):
+    """Probability-plot points, least-squares line and moments annotation."""
+    from scipy.stats import probplot
+
+    (theoretical, ordered), (slope, intercept, _) = probplot(returns)
+    return {
+        "x": theoretical, "y": ordered,
+        "fit_x": theoretical[[0, -1]],
+        "fit_y": slope * theoretical[[0, -1]] + intercept,
+        "text": ps.moments_text(returns),
+    }
+
+
+def histogram_view(returns, bins=HISTOGRAM_BINS):
+    """Fixed-count bins plus the normal / Student-t curves scaled to counts."""
+    counts, edges = np.histogram(np.asarray(returns), bins=bins)
+    fits = ps.prepare_histogram_data(returns, bins)
+    return {
+        "counts": counts, "edges": edges,
+        "normal": fits["normal_fit"], "student_t": fits["student_t_fit"],
+    }
+
+
+def tail_view(tail, tail_percent):
+    """Log-log fit data for one tail, or None when the tail is empty."""
+    if tail["x_min"] is None:
+        return None
+    fit = spl._loglog_fit_data(tail["data"], tail["x_min"], tail_percent)
+    fit["fit_x"] = fit["valid_centers"][fit["tmask"]]
+    fit["fit_y"] = 10 ** (fit["slope"] * np.log10(fit["fit_x"]) + fit["intercept"])
+    return fit
+
+
+def period_view(data, tail_percent):
+    """Everything the animated artists need for one period."""
+    return {
+        "title": f"{data['instrument']} {data['period'].capitalize()} Returns",
+        "qq": qq_view(data["returns"]),
+        "hist": histogram_view(data["returns"]),
+        "tails": [tail_view(tail, tail_percent) for tail in data["tails"]],
+        "tail_titles": [tail["title"] for tail in data["tails"]],
+    }
+
+
+def _linear_limits(*arrays):
+    low = min(np.min(a) for a in arrays)
+    high = max(np.max(a) for a in arrays)
+    pad = (high - low) * MARGIN or 1.0
+    return low - pad, high + pad
+
+
+def _log_limits(values):
+    return np.min(values) / LOG_MARGIN, np.max(values) * LOG_MARGIN
+
+
+# ---------------------------------------------------------------------------
+# The dashboard
+# ---------------------------------------------------------------------------
+
+
+class PeriodDashboard:
+    """One figure, four periods; see the module docstring.
+
+    `facade` is a VolatilityFacade: it supplies the returns, the layout and
+    the (static) VIX panel.
+    """
+
+    def __init__(self, facade, period="daily", tail_percent=0.10):
+        self.facade = facade
+        self.tail_percent = tail_percent
+        self.period = None
+        self._views = {}
+        self._backgrounds = {}
+        self.fig, *self.axes = facade._build_percentage_change_figure_layout()
+        facade._plot_vix_panel(self.axes[-1])
+        self._animated = []
+        self._build_artists()
+        self.fig.canvas.mpl_connect("draw_event", self._on_draw)
+        self.fig.canvas.mpl_connect("key_press_event", self._on_key)
+        self.show_period(period)
+
+    # --- static layer --------------------------------------------------------
+
+    def _track(self, *artists):
+        for artist in artists:
+            artist.set_animated(True)
+            self._animated.append(artist)
+        return artists[0] if len(artists) == 1 else artists
+
+    def _build_artists(self):
+        ax_qq, ax_hist, ax_left, ax_right, _ = self.axes
+        self._title = self._track(self.fig.suptitle(""))
+        self._build_qq(ax_qq)
+        self._build_histogram(ax_hist)
+        self._tails = [self._build_tail(ax) for ax in (ax_left, ax_right)]
+
+    def _build_qq(self, ax):
+        (points,) = ax.plot([], [], "o", color="tab:blue")
+        (fit,) = ax.plot([], [], "r-")
+        text = ax.text(0.05, 0.7, "", transform=ax.transAxes, fontsize=12)
+        self._qq = self._track(points, fit, text)
+        ax.set_title("Probability Plot")
+        ax.set_xlabel("Theoretical quantiles")
+        ax.set_ylabel("Ordered Values")
+
+    def _build_histogram(self, ax):
+        bars = ax.bar(np.arange(HISTOGRAM_BINS), np.zeros(HISTOGRAM_BINS),
+                      align="edge", color="tab:blue", alpha=0.6)
+        (normal,) = ax.plot([], [], color="orange", lw=2, label="Normal Fit")
+        (student_t,) = ax.plot([], [], color="green", lw=2, label="Student T Fit")
+        self._bars = list(bars.patches)
+        self._track(*self._bars)
+        self._fits = self._track(normal, student_t)
+        ax.set_ylabel("Count")
+        ax.legend()
+
+    def _build_tail(self, ax):
+        (body,) = ax.plot([], [], "o", alpha=0.4, color="gray", label="Data (not fitted)")
+        (tail,) = ax.plot([], [], "o", alpha=0.7, color="blue",
+                          label=f"Tail ({int(self.tail_percent * 100)}%)")
+        (fit,) = ax.plot([], [], "r-", linewidth=2, label="Fit")
+        ax.set_xscale("log")
+        ax.set_yscale("log")
+        ax.set_xlabel("x (log scale)")
+        ax.set_ylabel("Probability density (log scale)")
+        ax.legend(loc="upper right")
+        ax.grid(True, alpha=0.3, which="both")
+        return self._track(body, tail, fit, ax.title)
+
+    # --- data layer ----------------------------------------------------------
+
+    def view(self, period):
+        """Cached view-model for `period` (fetch + fits happen once)."""
+        if period not in self._views:
+            data = self.facade._prepare_percentage_change_data(period)
+            self._views[period] = period_view(data, self.tail_percent)
+        return self._views[period]
+
+    def _apply_qq(self, qq):
+        points, fit, text = self._qq
+        points.set_data(qq["x"], qq["y"])
+        fit.set_data(qq["fit_x"], qq["fit_y"])
+        text.set_text(qq["text"])
+        self.axes[0].set_xlim(_linear_limits(qq["x"]))
+        self.axes[0].set_ylim(_linear_limits(qq["y"], qq["fit_y"]))
+
+    def _apply_histogram(self, hist):
+        edges = hist["edges"]
+        for bar, left, width, count in zip(self._bars, edges[:-1],
+                                           np.diff(edges), hist["counts"]):
+            bar.set_x(left)
+            bar.set_width(width)
+            bar.set_height(count)
+        for line, fit in zip(self._fits, (hist["normal"], hist["student_t"])):
+            line.set_data(fit["x"], fit["pdf"])
+        peak = max(hist["counts"].max(), hist["normal"]["pdf"].max())
+        self.axes[1].set_xlim(edges[0], edges[-1])
+        self.axes[1].set_ylim(0, peak * (1 + MARGIN))
+
+    def _apply_tail(self, artists, ax, fit, title):
+        body, tail, line, title_text = artists
+        for artist in (body, tail, line):
+            artist.set_visible(fit is not None)
+        if fit is None:
+            title_text.set_text(f"{title}: no data")
+            return
+        centers, density, mask = fit["valid_centers"], fit["valid_density"], fit["tmask"]
+        body.set_data(centers[~mask], density[~mask])
+        tail.set_data(centers[mask], density[mask])
+        line.set_data(fit["fit_x"], fit["fit_y"])
+        title_text.set_text(f"{title}: α={fit['alpha']:.2f}")
+        ax.set_xlim(_log_limits(centers))
+        ax.set_ylim(_log_limits(density))
+
+    def _apply(self, view):
+        self._title.set_text(view["title"])
+        self._apply_qq(view["qq"])
+        self._apply_histogram(view["hist"])
+        for artists, ax, fit, title in zip(self._tails, self.axes[2:4],
+                                           view["tails"], view["tail_titles"]):
+            self._apply_tail(artists, ax, fit, title)
+
+    # --- drawing -------------------------------------------------------------
+
+    def _background_key(self):
+        return self.period, tuple(self.fig.bbox.bounds)
+
+    def show_period(self, period):
+        """Switch the data panels to `period`; blit if its background is cached."""
+        if period not in PERIOD_KEYS.values():
+            raise ValueError(f"Period must be one of {list(PERIOD_KEYS.values())}")
+        view = self.view(period)
+        self.period = period
+        self._apply(view)
+        background = self._backgrounds.get(self._background_key())
+        if background is None or not self.fig.canvas.supports_blit:
+            self.fig.canvas.draw_idle()  # -> _on_draw caches the background
+            return
+        self.fig.canvas.restore_region(background)
+        self._draw_animated()
+        self.fig.canvas.blit(self.fig.bbox)
+
+    def _draw_animated(self):
+        for artist in self._animated:
+            self.fig.draw_artist(artist)
+
+    def _on_draw(self, event):
+        """A full draw renders every static artist: cache it, then overlay."""
+        if self.fig.canvas.is_saving():
+            return
+        if self.fig.canvas.supports_blit:
+            self._backgrounds[self._background_key()] = (
+                self.fig.canvas.copy_from_bbox(self.fig.bbox))
+        self._draw_animated()
+
+    def _on_key(self, event):
+        period = PERIOD_KEYS.get(event.key)
+        if period is not None and period != self.period:
+            self.show_period(period)
@@ -4,6 +4,8 @@ import seaborn as sns
 from scipy.stats import probplot
 from scipy import stats
 
+from fentu.instrumentation.spans import spanned
+
 # Taleb (SCoFT / "Life Is Not in L2"): kurtosis is a 4th-moment estimator that
 # loses scientific validity under fat tails -- one observation can dominate it
 # (one day ≈ 80% of SP500 kurtosis over 56 yr). Printing it as a clean point
@@ -44,25 +46,29 @@ def calculate_four_moments(x):
     kurtosis_no_worst = _kurtosis_dropping_outlier(x)
     return mean, std, mad, skew, kurtosis, kurtosis_no_worst
 
-def qq_plot(x, ax=None, show=True):
-    if ax is None:
-        fig, ax = plt.subplots()
-    probplot(x, plot=ax)
+def moments_text(x):
+    """The four-moments annotation shown on the QQ plot."""
     mean, std, mad, skew, kurtosis, kurtosis_no_worst = calculate_four_moments(x)
     kurt_line = f'Kurt: {kurtosis:.2f}'
     if kurtosis_no_worst is not None:
         kurt_line += f'\nKurt (drop 1 worst): {kurtosis_no_worst:.2f}'
-    ax.text(0.05, 0.7,
-            f'Mean: {mean:.4f}\n'
+    return (f'Mean: {mean:.4f}\n'
             f'SD: {std:.4f}\n'
             f'MAD:{mad:.4f}\n'
             f'Skew: {skew:.4f}\n'
-            f'{kurt_line}',
-            transform=ax.transAxes, fontsize=12)
+            f'{kurt_line}')
+
+
+def qq_plot(x, ax=None, show=True):
+    if ax is None:
+        fig, ax = plt.subplots()
+    probplot(x, plot=ax)
+    ax.text(0.05, 0.7, moments_text(x), transform=ax.transAxes, fontsize=12)
     if show:
         plt.show()
     return ax
 
+@spanned("compute")
 def fit_normal_distribution(data):
     """Fit normal distribution and return parameters and PDF."""
     mu, sigma = stats.norm.fit(data)
@@ -70,8 +76,13 @@ def fit_normal_distribution(data):
     fitted_pdf = stats.norm.pdf(x, mu, sigma)
     return x, fitted_pdf, mu, sigma
 
+def fit_student_t_params(x):
+    """Maximum-likelihood Student-t fit: (df, loc, scale)."""
+    return stats.t.fit(x)
+
+@spanned("compute")
 def fit_student_t_distribution(x):
-    df, loc, scale = stats.t.fit(x)
+    df, loc, scale = fit_student_t_params(x)
     x_sorted = np.sort(x)
     pdf_t = stats.t.pdf(x_sorted, df, loc, scale)
     return x_sorted, pdf_t
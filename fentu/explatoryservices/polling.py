@@ -0,0 +1,29 @@
+"""The fixed-interval poll loop behind the live CLIs.
+
+``portfolio_stream`` and ``live_chute`` both poll the latest 1m bars on a
+timer until ^C (or for ``--polls N``); the loop and its two flags live here.
+"""
+from __future__ import annotations
+
+import time
+
+POLL_SECONDS = 60.0
+
+
+def poll_loop(poll, every=POLL_SECONDS, polls=None, sleep=time.sleep):
+    """Call `poll()` every `every` seconds; `polls` bounds the loop (None =
+    forever). There is no sleep after the last poll."""
+    done = 0
+    while polls is None or done < polls:
+        poll()
+        done += 1
+        if polls is None or done < polls:
+            sleep(every)
+
+
+def add_poll_arguments(parser):
+    """The ``--every S`` / ``--polls N`` flags of a polling CLI."""
+    parser.add_argument("--every", type=float, default=POLL_SECONDS,
+                        help="seconds between polls")
+    parser.add_argument("--polls", type=int, default=None,
+                        help="stop after this many polls (default: run until ^C)")
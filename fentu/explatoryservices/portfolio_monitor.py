@@ -39,13 +39,12 @@ resampling is pure pandas on the fetched prices; the scale is computed by
 ``DailyVolatility`` with its default ``MeanAbsoluteDeviationVolatility``
 calculator.
 
-CLI: ``see_change daily portfolio`` (wired in ``seechange.py``).
+CLI: ``see_change daily portfolio`` (wired in ``seechange.py``). matplotlib
+is imported only by the render functions, so a report-only caller
+(``orchestrate_daily --no-show``) never loads it.
 """
 
-import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib.dates import AutoDateLocator, ConciseDateFormatter
-from matplotlib.patches import Patch
 
 from fentu.explatoryservices.volcalculator import DailyVolatility, ReturnsRepository
 
@@ -106,7 +105,8 @@ def is_signal(move, usual):
     return multiple is not None and abs(multiple) > 1.0
 
 
-def _bar_color(move, usual):
+def bar_color(move, usual):
+    """Gray for noise, green / red for an up / down signal."""
     if not is_signal(move, usual):
         return NOISE_COLOR
     return UP_COLOR if move > 0 else DOWN_COLOR
@@ -115,7 +115,7 @@ def _bar_color(move, usual):
 class PortfolioMonitor:
     """Taleb-trick monitor over a fixed panel of holdings.
 
-    `repository` is injectable (defaults to a fresh `ReturnsRepository`,
+    `repository` is injectable (defaults to a Close-only `ReturnsRepository`,
     which does NO I/O until asked). `volatility` defaults to the project's
     headline MAD calculator via `DailyVolatility`.
     """
@@ -127,10 +127,11 @@ class PortfolioMonitor:
         self.holdings = holdings
         self.period = period
         self._info = PERIOD_INFO[period]
-        self._repository = repository or ReturnsRepository()
-        self._volatility = volatility or DailyVolatility()
+        self._repository = repository or ReturnsRepository(columns=("Close",))
+        self.volatility = volatility or DailyVolatility()
         # None = period default; the yearly default is itself None = all history.
         self.lookback = self._info["lookback"] if lookback is None else lookback
+        self.panel_artists = []
 
     # --- data (view-model; the only place the network is touched) ----------
 
@@ -139,27 +140,44 @@ class PortfolioMonitor:
                 for label, ticker in self.holdings]
 
     def _prepare_panel(self, label, ticker):
-        data = self._fetch_panel_data(ticker)
+        data = self.history(ticker)
         if data is None:
             return {"label": label, "available": False}
-        returns, prices = data
-        calibration = returns.iloc[:-1]  # the event never sets its own scale
+        window, calibration, prices = data
         usual = float(
-            self._volatility.calculate_1std_daily_volatility(calibration))
+            self.volatility.calculate_1std_daily_volatility(calibration))
+        return self.panel_for(label, window, len(calibration), usual,
+                              float(prices.iloc[-1]), prices.index[-1],
+                              float(window.iloc[-1]))
+
+    def history(self, ticker):
+        """(window, calibration, prices) of `ticker`, or None when it is
+        unavailable: the lookback window of period returns (percent), the
+        returns before the last one (the event never sets its own scale)
+        and the daily closes."""
+        data = self._fetch_panel_data(ticker)
+        if data is None:
+            return None
+        returns, prices = data
         window = (returns if self.lookback is None
                   else returns.iloc[-self.lookback:])
-        last_move = float(returns.iloc[-1])
+        return window, returns.iloc[:-1], prices
+
+    def panel_for(self, label, window, n_calibration, usual, last_price,
+                  last_date, last_move):
+        """The panel view-model from its already-computed pieces (a live
+        view advancing its own state builds panels through this)."""
         return {
             "label": label,
             "available": True,
             "unit": self._info["unit"],
             "window": window,
-            "n_calibration": len(calibration),
-            "insufficient_history": len(calibration) < MIN_CALIBRATION_PERIODS,
+            "n_calibration": n_calibration,
+            "insufficient_history": n_calibration < MIN_CALIBRATION_PERIODS,
             "incomplete_label": self._info["incomplete_label"],
             "bar_width_days": self._info["bar_width_days"],
-            "last_price": float(prices.iloc[-1]),
-            "last_date": prices.index[-1],
+            "last_price": last_price,
+            "last_date": last_date,
             "last_move": last_move,
             "usual": usual,
             "multiple": noise_multiple(last_move, usual),
@@ -198,11 +216,31 @@ class PortfolioMonitor:
         """Render the 2x2 signal panel. `panels` may be prebuilt (from
         ``prepare_panels``) so a caller that already fetched them for its own
         report does not fetch a second time."""
+        import matplotlib.pyplot as plt
+
+        fig = self.render(panels)
+        plt.show()
+        return fig
+
+    def render(self, panels=None, fig=None):
+        """Draw the 2x2 signal panel without showing it and return the figure.
+
+        `fig` may be a figure from an earlier render: its axes are cleared
+        and redrawn instead of building a new figure (headless batch runs).
+        Each panel's artists are kept in ``panel_artists`` (see
+        `plot_signal_panel`).
+        """
+        import matplotlib.pyplot as plt
+
         if panels is None:
             panels = self.prepare_panels()
-        fig, axes = plt.subplots(2, 2, figsize=(13, 8))
-        for ax, panel in zip(axes.flat, panels):
-            plot_signal_panel(ax, panel)
+        if fig is None:
+            fig, _ = plt.subplots(2, 2, figsize=(13, 8))
+        for ax in fig.axes:
+            ax.cla()
+        fig.legends.clear()
+        self.panel_artists = [plot_signal_panel(ax, panel)
+                              for ax, panel in zip(fig.axes, panels)]
         unit = self._info["unit"]
         fig.suptitle(
             f"Portfolio {self.period} signal monitor — Taleb noise filter "
@@ -213,7 +251,6 @@ class PortfolioMonitor:
         fig.legend(handles=legend_handles(), loc="lower center", ncol=4,
                    frameon=False, fontsize=9)
         fig.tight_layout(rect=[0, 0.04, 1, 0.93])
-        plt.show()
         return fig
 
 
@@ -229,6 +266,8 @@ def span_label(window):
 
 def legend_handles():
     """Proxy artists for the figure-level legend: band, noise, up/down signal."""
+    from matplotlib.patches import Patch
+
     return [
         Patch(facecolor=BAND_COLOR, edgecolor="0.6",
               label="usual band (±1 MAD)"),
@@ -244,18 +283,21 @@ def plot_signal_panel(ax, panel):
 
     Bars sit at their period-end date on a real time axis; the title carries
     the holding plus the window's actual date span, so the chart itself
-    answers "what period does this cover?".
+    answers "what period does this cover?". Returns ``(bars, verdict_text,
+    note_text)`` for a live view to update in place (None when unavailable).
     """
+    from matplotlib.dates import AutoDateLocator, ConciseDateFormatter
+
     if not panel.get("available", True):
         ax.text(0.5, 0.5, f"{panel['label']} unavailable",
                 ha="center", va="center", transform=ax.transAxes)
         ax.set_title(panel["label"])
-        return
+        return None
     window = panel["window"]
     usual = panel["usual"]
-    colors = [_bar_color(move, usual) for move in window]
-    ax.bar(window.index, window.values,
-           width=panel.get("bar_width_days", 1.0), color=colors)
+    colors = [bar_color(move, usual) for move in window]
+    bars = ax.bar(window.index, window.values,
+                  width=panel.get("bar_width_days", 1.0), color=colors)
     ax.axhspan(-usual, usual, color=BAND_COLOR, zorder=0)
     ax.axhline(0, color="black", lw=0.5)
     locator = AutoDateLocator(minticks=3, maxticks=6)
@@ -265,14 +307,35 @@ def plot_signal_panel(ax, panel):
     ax.set_title(f"{panel['label']}  ({span_label(window)})", fontsize=10)
     ax.set_xlabel(f"{unit.capitalize()} ending")
     ax.set_ylabel(f"% change per {unit}")
-    _annotate(ax, panel)
+    return (bars, *_annotate(ax, panel))
 
 
 def _annotate(ax, panel):
-    verdict = "SIGNAL" if panel["signal"] else "noise"
-    verdict_color = "green" if panel["signal"] else "red"
-    ax.text(0.99, 0.97, verdict, transform=ax.transAxes, ha="right", va="top",
-            fontsize=10, fontweight="bold", color=verdict_color)
+    """Verdict word + reading box; returns both text artists so a live view
+    can rewrite them in place."""
+    verdict, verdict_color = panel_verdict(panel)
+    verdict_text = ax.text(0.99, 0.97, verdict, transform=ax.transAxes,
+                           ha="right", va="top", fontsize=10,
+                           fontweight="bold", color=verdict_color)
+    note_text = ax.text(0.99, 0.87, panel_note(panel),
+                        transform=ax.transAxes, ha="right", va="top", fontsize=9,
+                        bbox=dict(facecolor="white", alpha=0.8,
+                                  edgecolor=note_edge_color(panel)))
+    return verdict_text, note_text
+
+
+def panel_verdict(panel):
+    """(word, color) of the panel's verdict."""
+    return ("SIGNAL", "green") if panel["signal"] else ("noise", "red")
+
+
+def note_edge_color(panel):
+    """Edge of the reading box: black for a signal, noise gray otherwise."""
+    return "black" if panel["signal"] else NOISE_COLOR
+
+
+def panel_note(panel):
+    """The reading box: as-of date, last price, move vs usual, calibration."""
     if panel["multiple"] is None:
         reading = "usual change undefined"
     else:
@@ -291,7 +354,4 @@ def _annotate(ax, panel):
              f"last {panel['last_price']:,.2f}", reading, usual_line]
     if panel.get("insufficient_history"):
         lines.append("insufficient history — band unreliable")
-    ax.text(0.99, 0.87, "\n".join(lines),
-            transform=ax.transAxes, ha="right", va="top", fontsize=9,
-            bbox=dict(facecolor="white", alpha=0.8,
-                      edgecolor="black" if panel["signal"] else NOISE_COLOR))
+    return "\n".join(lines)
@@ -0,0 +1,299 @@
+"""Streaming portfolio monitor — the 2x2 signal panel, ticking through a session.
+
+``PortfolioMonitor.prepare_panels`` is a batch view: every call refetches the
+full history, resamples it to calendar periods, recomputes the calibration
+MAD and rebuilds the window. Run live that is one full refetch + resample per
+holding per tick, for a picture in which only the last bar has moved.
+
+Here each holding is seeded once from that same batch view and then keeps
+its own state:
+
+* the open period (today / WTD / MTD / YTD): its end date, its base price
+  (the previous period's last close) and its running move;
+* the calibration accumulator: the completed periods' moves and their usual
+  change, recomputed only when a period closes and joins it (the open period
+  never calibrates its own denominator);
+* the window of bars on screen, a bounded deque.
+
+A price inside the open period updates the last bar's move and verdict in
+O(1); a price in a new period closes the open one into the calibration and
+opens the next bar. On screen, the first case rewrites only the last bar and
+the panel's two annotation texts and blits that one axes; only a period roll
+(or a move past the axis limits) redraws a panel. Histories are never
+refetched: a poll asks only for the holding's latest intraday bar.
+
+CLI
+---
+* ``python -m fentu.explatoryservices.portfolio_stream [PERIOD]``
+  ``[--every S] [--polls N]`` — seed the fixed panel (``daily`` default,
+  or ``weekly`` / ``monthly`` / ``yearly``), then poll the latest 1m bar of
+  every holding and tick the open window until ^C.
+"""
+from __future__ import annotations
+
+import argparse
+import math
+import time
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from fentu.explatoryservices.polling import POLL_SECONDS, add_poll_arguments, poll_loop
+from fentu.explatoryservices.portfolio_monitor import (
+    PERIOD_INFO,
+    PortfolioMonitor,
+    bar_color,
+    note_edge_color,
+    panel_note,
+    panel_verdict,
+    plot_signal_panel,
+)
+from fentu.explatoryservices.volcalculator import ReturnsRepository
+
+BAR_INTERVAL = "1m"
+BAR, PERIOD = "bar", "period"  # what a price changed: the open bar, or a new one
+
+
+def period_end(rule, day):
+    """The calendar-period label of `day` under resample `rule` (None = the day).
+
+    Matches ``resample(rule).last()`` labels: the week's Friday, the month's
+    or year's last day.
+    """
+    if rule is None:
+        return day
+    return pd.tseries.frequencies.to_offset(rule).rollforward(day)
+
+
+class CalibrationAccumulator:
+    """Completed-period moves and their usual change.
+
+    Values live in a doubling numpy buffer; the usual change is recomputed
+    with the monitor's volatility calculator only when a period is added, so
+    reading it per tick is free.
+    """
+
+    def __init__(self, moves, volatility):
+        moves = np.asarray(moves, dtype=float)
+        self._buffer = np.empty(max(2 * len(moves), 16))
+        self._buffer[:len(moves)] = moves
+        self._n = len(moves)
+        self._volatility = volatility
+        self.usual = self._scale()
+
+    def __len__(self):
+        return self._n
+
+    def add(self, move):
+        if self._n == len(self._buffer):
+            self._buffer = np.concatenate([self._buffer, np.empty(len(self._buffer))])
+        self._buffer[self._n] = move
+        self._n += 1
+        self.usual = self._scale()
+
+    def _scale(self):
+        moves = pd.Series(self._buffer[:self._n], copy=False)
+        return float(self._volatility.calculate_1std_daily_volatility(moves))
+
+
+class LiveHolding:
+    """One holding's open period, calibration and on-screen window."""
+
+    def __init__(self, label, ticker, rule, window, calibration, last_price,
+                 last_date, lookback):
+        self.label = label
+        self.ticker = ticker
+        self.rule = rule
+        self.window = deque(zip(window.index, window.to_numpy(dtype=float)),
+                            maxlen=lookback)
+        self.calibration = calibration
+        self.last_price = last_price
+        self.last_date = last_date
+        self.base = last_price * math.exp(-self.last_move / 100.0)
+
+    @property
+    def last_move(self):
+        return self.window[-1][1]
+
+    def on_price(self, at, price):
+        """Fold one price in; BAR, PERIOD, or None for a stale price."""
+        day = pd.Timestamp(at).normalize()
+        if day < self.last_date:
+            return None
+        end, move = self.window[-1]
+        change = BAR
+        if day != self.last_date and period_end(self.rule, day) != end:
+            self.calibration.add(move)
+            self.base = self.last_price
+            end = period_end(self.rule, day)
+            self.window.append((end, 0.0))
+            change = PERIOD
+        self.window[-1] = (end, math.log(price / self.base) * 100.0)
+        self.last_price, self.last_date = float(price), day
+        return change
+
+    def window_series(self):
+        ends, moves = zip(*self.window)
+        return pd.Series(moves, index=pd.DatetimeIndex(ends))
+
+
+class LivePortfolioMonitor:
+    """A `PortfolioMonitor` seeded once, then advanced price by price."""
+
+    def __init__(self, monitor, holdings):
+        self.monitor = monitor
+        self.holdings = holdings  # LiveHolding, or None when unavailable
+        self._index = {holding.ticker: i for i, holding in enumerate(holdings)
+                       if holding is not None}
+        self.fig = None
+        self._backgrounds = {}
+
+    @classmethod
+    def seed(cls, monitor):
+        """One batch fetch per holding (the last time histories are read)."""
+        rule = PERIOD_INFO[monitor.period]["resample"]
+        holdings = []
+        for label, ticker in monitor.holdings:
+            data = monitor.history(ticker)
+            if data is None:
+                holdings.append(None)
+                continue
+            window, calibration_returns, prices = data
+            calibration = CalibrationAccumulator(calibration_returns, monitor.volatility)
+            holdings.append(LiveHolding(label, ticker, rule, window, calibration,
+                                        float(prices.iloc[-1]), prices.index[-1],
+                                        monitor.lookback))
+        return cls(monitor, holdings)
+
+    # --- state ------------------------------------------------------------
+
+    def panel(self, i, with_window=True):
+        holding = self.holdings[i]
+        if holding is None:
+            return {"label": self.monitor.holdings[i][0], "available": False}
+        window = holding.window_series() if with_window else None
+        return self.monitor.panel_for(holding.label, window, len(holding.calibration),
+                                      holding.calibration.usual, holding.last_price,
+                                      holding.last_date, holding.last_move)
+
+    def panels(self):
+        return [self.panel(i) for i in range(len(self.holdings))]
+
+    def on_price(self, ticker, at, price):
+        """Advance `ticker` to `price`; the change (BAR / PERIOD / None).
+
+        With a rendered figure the change is drawn at once: BAR rewrites the
+        last bar in place, PERIOD redraws that holding's panel.
+        """
+        i = self._index.get(ticker)
+        if i is None:
+            return None
+        change = self.holdings[i].on_price(at, price)
+        if change is not None and self.fig is not None:
+            if change == PERIOD or not self._update_last_bar(i):
+                self._redraw_panel(i)
+        return change
+
+    def poll(self, repository, interval=BAR_INTERVAL):
+        """Fold in each holding's latest intraday bar; {ticker: change}."""
+        changes = {}
+        for ticker in self._index:
+            bars = repository.try_fetch_intraday_bars(ticker, interval)
+            close = None if bars is None else bars["Close"].dropna()
+            if close is None or close.empty:
+                continue
+            changes[ticker] = self.on_price(ticker, close.index[-1], close.iloc[-1])
+        return changes
+
+    # --- presentation -----------------------------------------------------
+
+    def render(self, fig=None):
+        """Full draw of the panel, then keep each last bar ready to blit."""
+        self.fig = self.monitor.render(self.panels(), fig)
+        self._draw()
+        return self.fig
+
+    def _live_artists(self, i):
+        artists = self.monitor.panel_artists[i]
+        if artists is None:
+            return ()
+        bars, verdict_text, note_text = artists
+        return bars.patches[-1], verdict_text, note_text
+
+    def _draw(self):
+        """Draw everything but the live artists, snapshot each axes, blit."""
+        for i in range(len(self.holdings)):
+            for artist in self._live_artists(i):
+                artist.set_animated(True)
+        self.fig.canvas.draw()
+        self._backgrounds = {
+            i: self.fig.canvas.copy_from_bbox(self.fig.axes[i].bbox)
+            for i in range(len(self.holdings)) if self._live_artists(i)}
+        for i in self._backgrounds:
+            self._blit(i)
+
+    def _blit(self, i):
+        ax = self.fig.axes[i]
+        self.fig.canvas.restore_region(self._backgrounds[i])
+        for artist in self._live_artists(i):
+            ax.draw_artist(artist)
+        self.fig.canvas.blit(ax.bbox)
+
+    def _update_last_bar(self, i):
+        """Rewrite the last bar and annotations in place; False when the
+        move left the axis limits and the panel needs a full redraw."""
+        if i not in self._backgrounds:
+            return False
+        panel = self.panel(i, with_window=False)
+        low, high = self.fig.axes[i].get_ylim()
+        if not low <= panel["last_move"] <= high:
+            return False
+        rect, verdict_text, note_text = self._live_artists(i)
+        rect.set_height(panel["last_move"])
+        rect.set_facecolor(bar_color(panel["last_move"], panel["usual"]))
+        word, color = panel_verdict(panel)
+        verdict_text.set_text(word)
+        verdict_text.set_color(color)
+        note_text.set_text(panel_note(panel))
+        note_text.get_bbox_patch().set_edgecolor(note_edge_color(panel))
+        self._blit(i)
+        return True
+
+    def _redraw_panel(self, i):
+        ax = self.fig.axes[i]
+        ax.cla()
+        self.monitor.panel_artists[i] = plot_signal_panel(ax, self.panel(i))
+        self._draw()
+
+
+def run(live, repository, every=POLL_SECONDS, polls=None, sleep=time.sleep):
+    """Poll every `every` seconds; `polls` bounds the loop (None = forever)."""
+    poll_loop(lambda: live.poll(repository), every, polls, sleep)
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("period", nargs="?", default="daily", choices=list(PERIOD_INFO))
+    add_poll_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    import matplotlib.pyplot as plt
+
+    args = _parse_args(argv)
+    repository = ReturnsRepository(columns=("Close",))
+    live = LivePortfolioMonitor.seed(PortfolioMonitor(period=args.period,
+                                                      repository=repository))
+    plt.ion()
+    live.render()
+    plt.show(block=False)
+    try:
+        run(live, repository, args.every, args.polls, sleep=plt.pause)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+"""Memory-mapped dates x tickers price matrix for universe analytics.
+
+Per-ticker pandas frames are the right shape for one chart, the wrong one for
+screening hundreds of tickers over 30+ years: every run re-parses every
+history. A ``PriceMatrix`` is a directory next to the network seam:
+
+    <root>/meta.json        tickers, fields, dtype, row count (the sidecar)
+    <root>/dates.i8         one int64 day number (datetime64[D]) per row
+    <root>/<field>.bin      C-order dates x tickers array per field
+
+Opening one reads the small JSON sidecar and memory-maps the rest: nothing
+is parsed or copied at startup, and pages load only when touched.
+``column("USO")`` is a strided view, ``rows(start, end)`` a row slice — both
+zero-copy — so vectorized consumers (``batch_mad``, ``period_returns``,
+``window_high_low``, tail fits on a column) work straight off the file.
+
+Appendable by date: ``append(wide)`` writes the rows newer than the last
+stored date to the end of each field file, then bumps the row count in
+``meta.json`` (replaced atomically). A reader only trusts ``rows`` rows, so a
+crash mid-append never exposes a half-written row, and the next append first
+truncates every file back to ``rows`` rows, so the bytes a crash left behind
+are overwritten rather than kept in front of the new rows.
+
+CLI
+---
+* ``python -m fentu.explatoryservices.price_matrix build ROOT TICKER ...``
+  ``[--fields High Low Close] [--dtype float32]``
+* ``python -m fentu.explatoryservices.price_matrix update ROOT``
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from fentu.explatoryservices.volcalculator import ReturnsRepository
+
+DEFAULT_FIELDS = ("High", "Low", "Close")
+META = "meta.json"
+DATES = "dates.i8"
+FORMAT_VERSION = 1
+
+
+def _day_numbers(index):
+    """int64 day numbers of a DatetimeIndex (the dates.i8 encoding)."""
+    return pd.DatetimeIndex(index).normalize().values.astype("datetime64[D]").astype(np.int64)
+
+
+def _append_rows(path, kept_bytes, data):
+    """Write `data` right after the first `kept_bytes` of `path`, dropping
+    anything past them (the tail of an append that crashed)."""
+    with open(path, "r+b") as fh:
+        fh.truncate(kept_bytes)
+        fh.seek(kept_bytes)
+        fh.write(data)
+
+
+def _map(path, dtype, shape):
+    """Read-only memmap of `path`; an empty array when there are no rows."""
+    if shape[0] == 0:
+        return np.empty(shape, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", shape=shape)
+
+
+class PriceMatrix:
+    """A memory-mapped price matrix on disk; see the module docstring."""
+
+    def __init__(self, root):
+        self.root = root
+        with open(os.path.join(root, META), encoding="utf-8") as fh:
+            meta = json.load(fh)
+        if meta.get("version") != FORMAT_VERSION:
+            raise ValueError(f"{root}: unsupported price matrix version {meta.get('version')}")
+        self.tickers = list(meta["tickers"])
+        self.fields = list(meta["fields"])
+        self.dtype = np.dtype(meta["dtype"])
+        self.n_rows = int(meta["rows"])
+        self._column_of = {ticker: i for i, ticker in enumerate(self.tickers)}
+        self.dates = _map(self._path(DATES), np.int64, (self.n_rows,)).view("datetime64[D]")
+        self._arrays = {field: _map(self._path(f"{field}.bin"), self.dtype,
+                                    (self.n_rows, len(self.tickers)))
+                        for field in self.fields}
+
+    def _path(self, name):
+        return os.path.join(self.root, name)
+
+    # --- creating / appending -----------------------------------------------
+
+    @classmethod
+    def create(cls, root, wide, fields=DEFAULT_FIELDS, dtype="float32"):
+        """A new matrix at `root` from a wide (field, ticker) frame."""
+        os.makedirs(root, exist_ok=True)
+        tickers = list(wide[fields[0]].columns)
+        for name in [DATES] + [f"{field}.bin" for field in fields]:
+            open(os.path.join(root, name), "wb").close()
+        _write_meta(root, tickers, fields, np.dtype(dtype).name, rows=0)
+        return cls(root).append(wide)
+
+    def append(self, wide):
+        """Append the rows of `wide` dated after the last stored row.
+
+        Columns are matched by ticker: tickers missing from `wide` are
+        stored as NaN, tickers the matrix does not know are ignored.
+        Returns the reopened matrix (the row count changed).
+        """
+        days = _day_numbers(wide.index)
+        last = self.dates[-1].astype(np.int64) if self.n_rows else np.iinfo(np.int64).min
+        new = days > last
+        if not new.any():
+            return self
+        order = np.argsort(days[new], kind="stable")
+        _append_rows(self._path(DATES), self.n_rows * np.dtype(np.int64).itemsize,
+                     days[new][order].tobytes())
+        row_bytes = len(self.tickers) * self.dtype.itemsize
+        for field in self.fields:
+            block = wide[field].reindex(columns=self.tickers).to_numpy(self.dtype)[new][order]
+            _append_rows(self._path(f"{field}.bin"), self.n_rows * row_bytes,
+                         np.ascontiguousarray(block).tobytes())
+        _write_meta(self.root, self.tickers, self.fields, self.dtype.name,
+                    rows=self.n_rows + int(new.sum()))
+        return PriceMatrix(self.root)
+
+    # --- zero-copy access ---------------------------------------------------
+
+    def field(self, name="Close"):
+        """The full dates x tickers array of one field (memory-mapped)."""
+        return self._arrays[name]
+
+    def column(self, ticker, field="Close"):
+        """One ticker's history: a strided view into the mapped file."""
+        return self._arrays[field][:, self._column_of[ticker]]
+
+    def row_range(self, start=None, end=None):
+        """slice of rows with start <= date <= end (either end open)."""
+        lo = 0 if start is None else int(np.searchsorted(self.dates, np.datetime64(pd.Timestamp(start).date(), "D")))
+        hi = self.n_rows if end is None else int(np.searchsorted(
+            self.dates, np.datetime64(pd.Timestamp(end).date(), "D"), side="right"))
+        return slice(lo, hi)
+
+    def rows(self, start=None, end=None, field="Close"):
+        """The dates x tickers block between two dates — a view, not a copy."""
+        return self._arrays[field][self.row_range(start, end)]
+
+    def frame(self, field="Close", start=None, end=None):
+        """A pandas copy of one field (for callers that want labels)."""
+        rows = self.row_range(start, end)
+        return pd.DataFrame(np.array(self._arrays[field][rows]),
+                            index=pd.DatetimeIndex(self.dates[rows].astype("datetime64[ns]")),
+                            columns=self.tickers)
+
+
+def _write_meta(root, tickers, fields, dtype, rows):
+    meta = {"version": FORMAT_VERSION, "tickers": list(tickers),
+            "fields": list(fields), "dtype": dtype, "rows": rows}
+    scratch = os.path.join(root, META + ".tmp")
+    with open(scratch, "w", encoding="utf-8") as fh:
+        json.dump(meta, fh)
+    os.replace(scratch, os.path.join(root, META))
+
+
+# ---------------------------------------------------------------------------
+# Vectorized consumers: column-wise over a dates x tickers block.
+# ---------------------------------------------------------------------------
+
+
+def log_returns(close):
+    """Row-to-row log returns of every column (one row shorter)."""
+    close = np.asarray(close, dtype=np.float64)
+    return np.log(close[1:] / close[:-1])
+
+
+def batch_mad(returns):
+    """Per-column mean absolute deviation, NaNs skipped (the headline MAD)."""
+    returns = np.asarray(returns, dtype=np.float64)
+    return np.nanmean(np.abs(returns - np.nanmean(returns, axis=0)), axis=0)
+
+
+def period_ends(dates, rule):
+    """Row positions of the last stored date in each period ('W', 'M', 'Y')."""
+    periods = pd.DatetimeIndex(np.asarray(dates).astype("datetime64[ns]")).to_period(rule)
+    codes = np.asarray(periods.asi8)
+    return np.flatnonzero(np.append(codes[1:] != codes[:-1], True))
+
+
+def period_returns(matrix, rule=None, field="Close"):
+    """Non-overlapping period log returns of every ticker (rule None = daily)."""
+    close = matrix.field(field)
+    if rule is not None:
+        close = close[period_ends(matrix.dates, rule)]
+    return log_returns(close)
+
+
+def window_high_low(matrix, start, end):
+    """Per-ticker (high, low) over [start, end]; NaN where nothing printed."""
+    rows = matrix.row_range(start, end)
+    high, low = matrix.field("High")[rows], matrix.field("Low")[rows]
+    if high.shape[0] == 0:
+        nan = np.full(len(matrix.tickers), np.nan)
+        return nan, nan
+    return np.nanmax(high, axis=0), np.nanmin(low, axis=0)
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def build(root, instruments, fields=DEFAULT_FIELDS, dtype="float32", repository=None):
+    """Fetch `instruments` in one bulk download and write a new matrix."""
+    repo = repository if repository is not None else ReturnsRepository(columns=fields)
+    wide = repo.get_wide_open_high_low_close(list(instruments))
+    return PriceMatrix.create(root, wide, fields, dtype)
+
+
+def update(root, repository=None):
+    """Append whatever the feed has past the matrix's last date."""
+    matrix = PriceMatrix(root)
+    repo = repository if repository is not None else ReturnsRepository(columns=matrix.fields)
+    return matrix.append(repo.get_wide_open_high_low_close(matrix.tickers))
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    create = commands.add_parser("build", help="write a new matrix")
+    create.add_argument("root")
+    create.add_argument("instruments", nargs="+")
+    create.add_argument("--fields", nargs="+", default=list(DEFAULT_FIELDS))
+    create.add_argument("--dtype", default="float32", choices=["float32", "float64"])
+    refresh = commands.add_parser("update", help="append new dates")
+    refresh.add_argument("root")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    if args.command == "build":
+        matrix = build(args.root, [t.upper() for t in args.instruments],
+                       tuple(args.fields), args.dtype)
+    else:
+        matrix = update(args.root)
+    last = matrix.dates[-1] if matrix.n_rows else "no rows"
+    print(f"{matrix.root}: {matrix.n_rows} dates x {len(matrix.tickers)} tickers, "
+          f"through {last}")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,8 @@ import numpy as np
 from scipy.stats import linregress
 import matplotlib.pyplot as plt
 
+from fentu.instrumentation.spans import spanned
+
 
 def create_log_space_bins(x_min, samples) -> np.ndarray:
     """
@@ -88,6 +90,7 @@ def _tail_mask(n_valid, tail_start_idx):
     return mask
 
 
+@spanned("compute")
 def fit_power_law_slope(bin_centers, density, tail_percent=0.2):
     """
     Fit a log-log line to the extreme tail; return slope and intercept.
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 
 import sys
-from fentu.explatoryservices.volcalculator import VolatilityFacade
+
 
 def main():
     if len(sys.argv) < 3:
@@ -37,6 +37,9 @@ def main():
         PortfolioMonitor(period=timeframe).visualize()
         return
 
+    # Imported here, after argv is validated: a usage error never pays for
+    # pandas/yfinance/matplotlib.
+    from fentu.explatoryservices.volcalculator import VolatilityFacade
     volatility = VolatilityFacade(ticker, start_date=start_date, end_date=end_date)
     volatility.visualize_percentage_change(timeframe)
 
@@ -0,0 +1,200 @@
+"""Signal backtest — replay the Taleb noise filter over the whole history.
+
+``PortfolioMonitor`` judges one bar: today's move against the MAD of every
+move before it. This replays that judgement at every bar of every holding,
+with exactly the data the monitor would have had that day — the calibration
+for bar ``t`` is the moves ``< t`` (expanding) or the last ``window`` of them
+(rolling); the event never sets its own scale, at any step — and then asks
+what happened next: the forward return after SIGNAL bars (split by
+direction) versus after noise bars.
+
+Vectorized: MAD around a moving mean is not a running sum (every step moves
+the mean every deviation is taken from), but
+
+    sum |r_i - m| = (S - 2 * S_below) + m * (2 * k_below - n)
+
+where ``k_below`` / ``S_below`` are the count and sum of the calibration
+moves under the mean ``m``. Those are prefix-dominance queries ("how many of
+the first L moves are below x"), answered for all bars at once in blocks:
+one sorted prefix + ``searchsorted`` per block of queries, plus a small
+in-block comparison matrix. Decades x dozens of tickers run in under a
+second, with no per-day loop and no monitor re-instantiated.
+
+CLI
+---
+* ``python -m fentu.explatoryservices.signal_backtest [TICKER ...]``
+  ``[--period P] [--horizons 1 5 21] [--window N]`` — one bulk fetch, then
+  the forward-return summary per holding and verdict.
+"""
+from __future__ import annotations
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from fentu.explatoryservices.portfolio_monitor import (
+    DEFAULT_PORTFOLIO,
+    MIN_CALIBRATION_PERIODS,
+    PERIOD_INFO,
+)
+from fentu.explatoryservices.volcalculator import ReturnsRepository
+from fentu.explatoryservices.watchlist_monitor import period_returns
+
+HORIZONS = (1, 5, 21)  # forward bars measured after each bar
+BLOCK = 256  # prefix length granularity of the dominance queries
+VERDICTS = ("signal up", "signal down", "noise")
+
+
+def prefix_below(values, lengths, thresholds, block=BLOCK):
+    """Count and sum of ``values[:L]`` strictly below `x`, per (L, x) query.
+
+    Queries are grouped by ``L // block``: the block's whole prefix is sorted
+    once and searched for every query in the group; the few values between
+    the block start and each query's ``L`` are compared directly.
+    """
+    values = np.asarray(values, dtype=float)
+    lengths = np.asarray(lengths, dtype=np.int64)
+    thresholds = np.asarray(thresholds, dtype=float)
+    counts = np.zeros(len(lengths), dtype=np.int64)
+    sums = np.zeros(len(lengths))
+    group = lengths // block
+    for g in np.unique(group):
+        queries = np.flatnonzero(group == g)
+        start = int(g) * block
+        prefix = np.sort(values[:start])
+        cumulative = np.concatenate([[0.0], np.cumsum(prefix)])
+        below = np.searchsorted(prefix, thresholds[queries], side="left")
+        counts[queries] = below
+        sums[queries] = cumulative[below]
+        tail = values[start:start + block]
+        inside = np.arange(len(tail))[None, :] < (lengths[queries] - start)[:, None]
+        under = inside & (tail[None, :] < thresholds[queries][:, None])
+        counts[queries] += under.sum(axis=1)
+        sums[queries] += (under * tail[None, :]).sum(axis=1)
+    return counts, sums
+
+
+def calibration_mad(returns, window=None):
+    """MAD of the moves before each bar: ``out[t]`` uses ``returns[:t]``
+    (expanding) or ``returns[t - window:t]`` (rolling). NaN when empty."""
+    r = np.asarray(returns, dtype=float)
+    t = np.arange(len(r))
+    start = np.zeros_like(t) if window is None else np.maximum(t - window, 0)
+    cumulative = np.concatenate([[0.0], np.cumsum(r)])
+    n = t - start
+    total = cumulative[t] - cumulative[start]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = total / n
+    k, below = prefix_below(r, t, mean)
+    if window is not None:
+        k_out, below_out = prefix_below(r, start, mean)
+        k, below = k - k_out, below - below_out
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return ((total - 2.0 * below) + mean * (2.0 * k - n)) / n
+
+
+def forward_returns(returns, horizons=HORIZONS):
+    """{h: the summed moves of the next h bars} (NaN past the end)."""
+    r = np.asarray(returns, dtype=float)
+    cumulative = np.concatenate([[0.0], np.cumsum(r)])
+    out = {}
+    for h in horizons:
+        ahead = np.full(len(r), np.nan)
+        if h < len(r):
+            ahead[:len(r) - h] = cumulative[h + 1:] - cumulative[1:len(r) - h + 1]
+        out[h] = ahead
+    return out
+
+
+def replay(returns, horizons=HORIZONS, window=None,
+           min_calibration=MIN_CALIBRATION_PERIODS):
+    """Every bar of one holding, judged as the monitor would have that day.
+
+    `returns` is the holding's percent moves (a Series). Columns: move,
+    usual, multiple, significance, signal, verdict and ``fwd_<h>`` per
+    horizon. Bars with fewer than `min_calibration` prior moves are dropped.
+    """
+    returns = returns.dropna()
+    usual = calibration_mad(returns.to_numpy(), window)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        multiple = np.where(usual > 0, returns.to_numpy() / usual, np.nan)
+    signal = np.abs(multiple) > 1.0
+    verdict = np.where(signal, np.where(multiple > 0, VERDICTS[0], VERDICTS[1]), VERDICTS[2])
+    frame = pd.DataFrame({"move": returns.to_numpy(), "usual": usual,
+                          "multiple": multiple, "significance": multiple ** 2,
+                          "signal": signal, "verdict": verdict}, index=returns.index)
+    for h, ahead in forward_returns(returns.to_numpy(), horizons).items():
+        frame[f"fwd_{h}"] = ahead
+    enough = np.arange(len(frame)) >= min_calibration
+    return frame[enough & ~np.isnan(multiple)]
+
+
+def backtest(closes, holdings=None, period="daily", horizons=HORIZONS, window=None,
+             min_calibration=MIN_CALIBRATION_PERIODS):
+    """Replay every holding; one long frame indexed by (label, date)."""
+    if holdings is None:
+        holdings = [(ticker, ticker) for ticker in closes.columns]
+    returns = period_returns(closes.reindex(columns=[t for _l, t in holdings]),
+                             PERIOD_INFO[period]["resample"])
+    frames = {label: replay(returns[ticker], horizons, window, min_calibration)
+              for label, ticker in holdings}
+    return pd.concat(frames, names=["label", "date"])
+
+
+def signal_days(bars):
+    """Only the SIGNAL bars, most significant first."""
+    return bars[bars["signal"]].sort_values("significance", ascending=False)
+
+
+def summary(bars, horizons=HORIZONS):
+    """Per holding and verdict: bar count, then mean forward move and the
+    share of bars followed by a rise, per horizon."""
+    grouped = bars.groupby([bars.index.get_level_values("label"), "verdict"], sort=False)
+    columns = {"bars": grouped["move"].size()}
+    for h in horizons:
+        ahead = grouped[f"fwd_{h}"]
+        columns[f"mean_fwd_{h}"] = ahead.mean()
+        columns[f"up_share_{h}"] = ahead.apply(lambda s: (s.dropna() > 0).mean())
+    return pd.DataFrame(columns)
+
+
+def format_summary(table, period="daily", horizons=HORIZONS):
+    unit = PERIOD_INFO[period]["unit"]
+    header = f"{'label':<7} {'verdict':<12} {'bars':>6}" + "".join(
+        f" {f'+{h} {unit}s':>16}" for h in horizons)
+    lines = [header]
+    for (label, verdict), row in table.iterrows():
+        cells = "".join(f" {row[f'mean_fwd_{h}']:>+7.2f}% ({row[f'up_share_{h}']:>4.0%})"
+                        for h in horizons)
+        lines.append(f"{label:<7} {verdict:<12} {int(row.bars):>6}{cells}")
+    return "\n".join(lines)
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("tickers", nargs="*", metavar="TICKER",
+                        help="yfinance tickers (default: the portfolio)")
+    parser.add_argument("--period", default="daily", choices=list(PERIOD_INFO))
+    parser.add_argument("--horizons", type=int, nargs="+", default=list(HORIZONS),
+                        help="forward bars to measure after each bar")
+    parser.add_argument("--window", type=int, default=None,
+                        help="rolling calibration length (default: expanding)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    holdings = ([(t.upper(), t.upper()) for t in args.tickers] if args.tickers
+                else DEFAULT_PORTFOLIO)
+    repo = ReturnsRepository(columns=("Close",))
+    wide = repo.try_fetch_wide_open_high_low_close([ticker for _label, ticker in holdings])
+    if wide is None or wide.empty:
+        print("backtest unavailable")
+        return
+    bars = backtest(wide["Close"], holdings, args.period, args.horizons, args.window)
+    print(format_summary(summary(bars, args.horizons), args.period, args.horizons))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Signal matrix — every holding's verdict on every calendar period at once.
+
+A holding's day, week, month and year readings used to take four
+``PortfolioMonitor`` objects, one per ``PERIOD_INFO`` key, each fetching and
+resampling the same history again. Here the closes are fetched once (one
+bulk ``ReturnsRepository`` call for all holdings) and the four
+non-overlapping period series are derived from them in one group-by each on
+datetime64 period labels, coarser from finer where the calendars nest
+(year-ends from month-ends, which already are the last daily print of each
+month). Each period is then read in one vectorized pass
+(``watchlist_monitor``), the completed periods calibrating the usual change
+and the open one being the event, as in the 2x2 panel.
+
+The result is a holdings x periods matrix of the signed MAD-multiple, the
+quadratic significance and the SIGNAL / noise verdict.
+
+CLI
+---
+* ``python -m fentu.explatoryservices.signal_matrix [TICKER ...]`` — print
+  the matrix (default: the portfolio's four holdings).
+"""
+from __future__ import annotations
+
+import argparse
+import math
+
+import pandas as pd
+
+from fentu.explatoryservices.portfolio_monitor import DEFAULT_PORTFOLIO, PERIOD_INFO
+from fentu.explatoryservices.volcalculator import ReturnsRepository
+from fentu.explatoryservices.watchlist_monitor import holding_columns, period_readings
+
+PERIODS = tuple(PERIOD_INFO)
+# Periods resampled from another period's closes instead of the daily ones.
+RESAMPLED_FROM = {"yearly": "monthly"}
+
+
+def period_ends(index, period):
+    """Each date's calendar-period label, as ``resample(rule)`` names it: the
+    day itself, its week's Friday, its month's or its year's last day."""
+    days = index.values.astype("datetime64[D]")
+    if period == "weekly":  # 1970-01-01 was a Thursday
+        days = days + (4 - (days.astype("int64") + 3) % 7) % 7
+    elif period == "monthly":
+        days = (days.astype("datetime64[M]") + 1).astype("datetime64[D]") - 1
+    elif period == "yearly":
+        days = (days.astype("datetime64[Y]") + 1).astype("datetime64[D]") - 1
+    return pd.DatetimeIndex(days.astype("datetime64[ns]"))
+
+
+def period_closes(closes):
+    """{period: period-end closes}, each calendar derived once.
+
+    The same frames as ``resample(rule).last()`` minus its empty bins (which
+    add no return): a group-by on period labels computed with datetime64
+    arithmetic, year-ends taken from the month-end frame.
+    """
+    daily = closes.dropna(how="all")
+    out = {}
+    for period in sorted(PERIODS, key=lambda p: p in RESAMPLED_FROM):
+        source = out[RESAMPLED_FROM[period]] if period in RESAMPLED_FROM else daily
+        if PERIOD_INFO[period]["resample"] is None:
+            out[period] = source
+        else:
+            out[period] = source.groupby(period_ends(source.index, period)).last()
+    return {period: out[period] for period in PERIODS}
+
+
+def _verdict(multiple):
+    if math.isnan(multiple):
+        return "n/a"
+    return "SIGNAL" if abs(multiple) > 1.0 else "noise"
+
+
+def signal_matrix(closes, holdings=None):
+    """Holdings x (period, field) frame off one closes frame.
+
+    Fields per period: ``multiple`` (signed MAD-multiple of the open
+    period's move), ``significance`` (its square) and ``verdict``
+    (SIGNAL / noise / n/a).
+    """
+    labels, _tickers, closes = holding_columns(closes, holdings)
+    blocks = {}
+    for period, resampled in period_closes(closes).items():
+        table = period_readings(resampled, closes, labels)
+        blocks[period] = pd.DataFrame({
+            "multiple": table["multiple"],
+            "significance": table["significance"],
+            "verdict": [_verdict(m) for m in table["multiple"]],
+        })
+    return pd.concat(blocks, axis=1, names=["period", "field"])
+
+
+def format_matrix(matrix):
+    """Text matrix: one row per holding, one ``+2.1x (4.4) SIGNAL`` cell per period."""
+    width = 21
+    lines = [f"{'':<7}" + "".join(f"{period:>{width}}" for period in PERIODS)]
+    for label, row in matrix.iterrows():
+        cells = []
+        for period in PERIODS:
+            multiple = row[(period, "multiple")]
+            cell = ("n/a" if math.isnan(multiple) else
+                    f"{multiple:+.1f}x ({row[(period, 'significance')]:.1f}) "
+                    f"{row[(period, 'verdict')]}")
+            cells.append(f"{cell:>{width}}")
+        lines.append(f"{label:<7}" + "".join(cells))
+    return "\n".join(lines)
+
+
+def matrix_report(holdings=DEFAULT_PORTFOLIO, repository=None):
+    """The printed matrix off ONE bulk fetch; never raises on a bad feed."""
+    repo = repository if repository is not None else ReturnsRepository(columns=("Close",))
+    wide = repo.try_fetch_wide_open_high_low_close([ticker for _label, ticker in holdings])
+    if wide is None or wide.empty:
+        return "signal matrix unavailable"
+    return format_matrix(signal_matrix(wide["Close"], holdings))
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("tickers", nargs="*", metavar="TICKER",
+                        help="yfinance tickers (default: the portfolio)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    holdings = ([(t.upper(), t.upper()) for t in args.tickers] if args.tickers
+                else DEFAULT_PORTFOLIO)
+    print(matrix_report(holdings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""Stop-cluster scan — which names on the watchlist are walking into stops.
+
+``high_low_levels`` answers one ticker per run. This runs the same 2mo / 6mo
+(/ war regime for USO) old high/low logic across a whole watchlist and ranks
+the names by how close the last close sits to the nearest PTJ stop zone
+(``stop_zone``: buy stops just above old highs, sell stops just below old
+lows) — the ones about to trade into a cluster come first.
+
+One bulk fetch (``ReturnsRepository.get_wide_open_high_low_close``, tickers
+fetched concurrently) gives a wide High/Low/Close frame; each window's
+extrema are then taken column-wise over a single date slice for every ticker
+at once — no per-ticker report loop. The fetch keeps only High/Low/Close,
+in float32 (a ranking display), so a wide universe stays small in memory.
+
+CLI
+---
+* ``python -m fentu.explatoryservices.stop_cluster_scan [TICKER ...]``
+  ``[--within PCT] [--all]``
+"""
+from __future__ import annotations
+
+import argparse
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from fentu.explatoryservices.high_low_levels import level_label, lookback_windows, stop_zone
+from fentu.explatoryservices.volcalculator import ReturnsRepository
+
+DEFAULT_WATCHLIST = (
+    "USO", "BNO", "GLD", "IAU", "SPY", "QQQ", "TQQQ", "IWM", "TLT", "BRK-B",
+)
+APPROACH_PCT = 3.0  # names within this % of a stop zone are "approaching"
+SCAN_COLUMNS = ("High", "Low", "Close")
+
+
+def _column_extrema(window, kind):
+    """Column-wise (price, first print date) of the window's high or low.
+
+    NaN prints are skipped; a ticker with no print in the window gets NaN.
+    """
+    values = window.to_numpy(float)
+    if values.shape[0] == 0:
+        nan = np.full(values.shape[1], np.nan)
+        return nan, nan.astype("datetime64[ns]")
+    fill = -np.inf if kind == "high" else np.inf
+    filled = np.where(np.isnan(values), fill, values)
+    at = filled.argmax(axis=0) if kind == "high" else filled.argmin(axis=0)
+    has_data = ~np.isnan(values).all(axis=0)
+    price = np.where(has_data, filled[at, np.arange(values.shape[1])], np.nan)
+    dates = np.where(has_data, window.index.values[at], np.datetime64("NaT"))
+    return price, dates
+
+
+def _window_levels(wide, today, instruments):
+    """Long frame of every (ticker, window, kind) level: price + print date.
+
+    Windows are grouped by start date so each date slice is cut once and
+    reduced column-wise for all the tickers that use it.
+    """
+    tickers_by_window = {}
+    for ticker in instruments:
+        for short, _label, start in lookback_windows(today, ticker):
+            tickers_by_window.setdefault((short, start), []).append(ticker)
+    frames = []
+    for (short, start), tickers in tickers_by_window.items():
+        rows = slice(pd.Timestamp(start), pd.Timestamp(today))
+        for kind, field in (("high", "High"), ("low", "Low")):
+            price, dates = _column_extrema(wide[field].loc[rows, tickers], kind)
+            frames.append(pd.DataFrame({"ticker": tickers, "window": short,
+                                        "kind": kind, "price": price, "date": dates}))
+    return pd.concat(frames, ignore_index=True).dropna(subset=["price"])
+
+
+def _distance_pct(close, lower, upper):
+    """% from close to the [lower, upper] zone; 0 inside it."""
+    gap = np.where(close < lower, lower - close, np.where(close > upper, close - upper, 0.0))
+    return gap / close * 100.0
+
+
+def scan(wide, today=None, instruments=None):
+    """Every ticker's nearest stop zone, closest first.
+
+    `wide` has (field, ticker) columns (High/Low/Close). Returns one row per
+    ticker with data: ticker, close, label, price, date, stop_side, zone_low,
+    zone_high, distance_pct.
+    """
+    today = today if today is not None else date.today()
+    instruments = list(instruments or wide["Close"].columns)
+    close = wide["Close"][instruments].loc[:pd.Timestamp(today)].ffill().iloc[-1]
+    levels = _window_levels(wide.loc[:pd.Timestamp(today)], today, instruments)
+    levels["close"] = close.reindex(levels["ticker"]).to_numpy()
+    levels = levels.dropna(subset=["close"])
+    levels["stop_side"] = np.where(levels["kind"] == "high", "buy", "sell")
+    for side in ("buy", "sell"):
+        rows = levels["stop_side"] == side
+        lower, upper = stop_zone(levels.loc[rows, "price"].to_numpy(), side)
+        levels.loc[rows, "zone_low"], levels.loc[rows, "zone_high"] = lower, upper
+    levels["distance_pct"] = _distance_pct(
+        levels["close"].to_numpy(), levels["zone_low"].to_numpy(), levels["zone_high"].to_numpy())
+    levels["label"] = [level_label(s, k) for s, k in zip(levels["window"], levels["kind"])]
+    nearest = levels.loc[levels.groupby("ticker")["distance_pct"].idxmin()]
+    columns = ["ticker", "close", "label", "price", "date", "stop_side",
+               "zone_low", "zone_high", "distance_pct"]
+    return nearest.sort_values(["distance_pct", "ticker"])[columns].reset_index(drop=True)
+
+
+def format_table(ranked, within=APPROACH_PCT, show_all=False):
+    """Text table of the names within `within`% of a stop zone (or all)."""
+    shown = ranked if show_all else ranked[ranked["distance_pct"] <= within]
+    if shown.empty:
+        return f"no names within {within:.1f}% of a stop cluster"
+    lines = [f"{'ticker':<7} {'close':>9}  {'nearest level':<16} {'level':>9}"
+             f"  {'printed':<10}  {'stops':<9} {'zone':<17} {'away':>6}"]
+    for row in shown.itertuples():
+        zone = f"{row.zone_low:.2f}-{row.zone_high:.2f}"
+        lines.append(
+            f"{row.ticker:<7} {row.close:>9.2f}  {row.label:<16} {row.price:>9.2f}"
+            f"  {pd.Timestamp(row.date).date()!s:<10}  {row.stop_side + ' stops':<9}"
+            f" {zone:<17} {row.distance_pct:>5.1f}%")
+    return "\n".join(lines)
+
+
+def _missing(wide, instruments):
+    present = wide["Close"].columns[wide["Close"].notna().any()]
+    return [t for t in instruments if t not in present]
+
+
+def scan_report(instruments=DEFAULT_WATCHLIST, repository=None, today=None,
+                within=APPROACH_PCT, show_all=False):
+    """The printed report off ONE bulk fetch; never raises on a bad feed."""
+    repo = (repository if repository is not None
+            else ReturnsRepository(columns=SCAN_COLUMNS, dtype="float32"))
+    instruments = list(instruments)
+    wide = repo.try_fetch_wide_open_high_low_close(instruments)
+    if wide is None or wide.empty:
+        return "watchlist unavailable"
+    missing = _missing(wide, instruments)
+    available = [t for t in instruments if t not in missing]
+    lines = [format_table(scan(wide, today, available), within, show_all)]
+    lines += [f"{ticker} unavailable" for ticker in missing]
+    return "\n".join(lines)
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("instruments", nargs="*", default=list(DEFAULT_WATCHLIST),
+                        help="yfinance tickers (default: the watchlist)")
+    parser.add_argument("--within", type=float, default=APPROACH_PCT,
+                        help="show names within this %% of a stop zone")
+    parser.add_argument("--all", action="store_true", dest="show_all",
+                        help="rank every name, not just the approaching ones")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    print(scan_report([t.upper() for t in args.instruments],
+                      within=args.within, show_all=args.show_all))
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,10 @@ Topology Diagram (ASCII)
  | yfinance | pandas | numpy | scipy.stats(norm,t) | curl_cffi.requests     |
  | matplotlib.pyplot | plotting_service (ps) | see_power_law (spl)          |
  +---------------------------------------------------------------------------+
+ Only pandas/numpy load with this module. yfinance + curl_cffi load on the
+ first fetch, matplotlib/ps/spl (seaborn, scipy) on the first plot, so a CLI
+ path pays only for what it uses. `volcalculator.yf` / `.requests` / `.plt`
+ / `.ps` / `.spl` still resolve (lazily) for callers and patches.
       |            |          |            |               |
       | prices     | data     | tails/log  | (unused)      | plotting
       v            v          v            v               v
@@ -41,6 +45,14 @@ Topology Diagram (ASCII)
  |   get_prices(instrument)           -> _raw_open_high_low_close + start/end window        |
  |   get_returns(instrument, period)  -> np.log(prices/shift)[period:]       |
  |   get_vix_open_high_low_close() / get_vix_prices()-> full ^VIX history, UN-windowed      |
+ |   get_wide_open_high_low_close(instruments) -> ONE bulk yf.download;     |
+ |                                       (field, ticker) columns             |
+ |   columns= / dtype= projection      -> keep only the needed fields as one |
+ |                                       compact (float32) block             |
+ |   cache= MarketCache                -> serve histories fetched since the  |
+ |                                       last close from .market_cache/      |
+ |   fetch_open_high_low_close(instr)  -> the uncached network fetch         |
+ |   try_fetch_intraday_bars(instr)    -> today's 1m bars; live, uncached    |
  +---------------------------------------------------------------------------+
  +---------------------------------------------------------------------------+
  | MarketClock          (Seam 2 — DST / market-open logic, pure of I/O)      |
@@ -54,6 +66,7 @@ Topology Diagram (ASCII)
  |   show_panel_unavailable(ax,...)  -> centered "unavailable" note          |
  |   plot_vix_panel(ax, open_high_low_close, current_value) -> pure render from prebuilt    |
  |       open_high_low_close + optional (label, value) current-value pair   |
+ |       close downsampled to point_budget (min/max buckets keep spikes)    |
  +---------------------------------------------------------------------------+
                  |  composed by
                  v
@@ -74,11 +87,14 @@ Topology Diagram (ASCII)
  |  [Volatility]    calculate_daily_volatility() -> DailyVolatility          |
  |  [Extreme]       find_negative/positive_extreme_returns(k|threshold)      |
  |  [Visualization] visualize_percentage_change(period, tail_percent)        |
+ |     +-> period_dashboard.PeriodDashboard: one figure, d/w/m/y toggles;    |
+ |         static VIX/layout, data artists updated via set_data + blit       |
  |     +-> _prepare_percentage_change_data() (data view-model)               |
- |     +-> _plot_percentage_change()                                         |
+ |     +-> _draw_percentage_change()  (pure draw onto given axes)            |
  |           +-> ps.qq_plot / ps.histgram_plot / spl.plot_loglog_with_fit    |
  |           +-> _plot_vix_panel             (delegates -> dashboard)        |
  |           +-> matplotlib 3x2 gridspec + suptitle                          |
+ |  [Headless]      render_percentage_change(fig, axes, period)             |
  |  [Reporting]     get_past_week_price_and_log_returns()                    |
  +---------------------------------------------------------------------------+
 
@@ -91,22 +107,39 @@ Topology Diagram (ASCII)
  +---------------------------------------------------------------------------+
 """
 
-import yfinance as yf
-import pandas as pd
-pd.set_option('display.max_rows', None)
+import importlib
 
-import fentu.explatoryservices.plotting_service as ps
-import fentu.explatoryservices.see_power_law as spl
-import matplotlib.pyplot as plt
+import pandas as pd
 import numpy as np
-from curl_cffi import requests
 from datetime import datetime, timezone, timedelta, time as _dtime
 
+from fentu.explatoryservices.downsample import POINT_BUDGET, downsample_series
+from fentu.instrumentation.spans import span
+
 VIX_TICKER = "^VIX"
+OPEN_HIGH_LOW_CLOSE = ("Open", "High", "Low", "Close")
+PROJECTION_CHUNK = 64  # columns copied per step by project_columns
 TIME_MARKET_OPEN = _dtime(9, 30)  # US equity market open, Eastern Time
+RETURN_PERIODS = ('daily', 'weekly', 'monthly', 'yearly')
+
+# Heavy dependencies, imported on first use (see the topology note above).
+_LAZY_MODULES = {
+    "yf": "yfinance",
+    "requests": "curl_cffi.requests",
+    "plt": "matplotlib.pyplot",
+    "ps": "fentu.explatoryservices.plotting_service",
+    "spl": "fentu.explatoryservices.see_power_law",
+}
 
 
-def _is_us_dst(dt_utc):
+def __getattr__(name):
+    """Module-level lazy attributes: `volcalculator.yf` imports yfinance."""
+    if name in _LAZY_MODULES:
+        return importlib.import_module(_LAZY_MODULES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def is_us_dst(dt_utc):
     """True if `dt_utc` (tz-aware UTC) falls within US daylight saving time.
 
     US DST: second Sunday of March -> first Sunday of November. Stdlib-only so
@@ -124,7 +157,7 @@ def _is_us_dst(dt_utc):
 def _now_eastern():
     """Current time in US Eastern Time (EST/EDT), tz-aware."""
     now_utc = datetime.now(timezone.utc)
-    offset_h = -4 if _is_us_dst(now_utc) else -5
+    offset_h = -4 if is_us_dst(now_utc) else -5
     return now_utc.astimezone(timezone(timedelta(hours=offset_h), "ET"))
 
 
@@ -162,31 +195,87 @@ class DailyVolatility:
 # ---------------------------------------------------------------------------
 
 
+def project_columns(frame, columns=None, dtype=None):
+    """`frame` cut down to `columns`, as ONE compact `dtype` array.
+
+    Works on a single-ticker frame and on a wide (field, ticker) frame, where
+    `columns` picks fields. Columns the feed did not send are skipped. The
+    result owns its data (never a view of the feed's frame), so once the
+    caller drops the raw frame its Volume / Dividends / Stock Splits blocks
+    are freed. No projection asked for -> `frame` unchanged.
+    """
+    if columns is None and dtype is None:
+        return frame
+    keep = np.arange(frame.shape[1])
+    if columns is not None:
+        keep = keep[frame.columns.get_level_values(0).isin(list(columns))]
+    # Filled in column chunks: no float64 intermediate of all kept columns.
+    values = np.empty((frame.shape[0], len(keep)), dtype=dtype or np.float64)
+    for start in range(0, len(keep), PROJECTION_CHUNK):
+        chunk = keep[start:start + PROJECTION_CHUNK]
+        values[:, start:start + len(chunk)] = frame.iloc[:, chunk].to_numpy()
+    return pd.DataFrame(values, index=frame.index, columns=frame.columns[keep])
+
+
 class ReturnsRepository:
     """Owns all yfinance open_high_low_close fetching and the start/end date window.
 
     Constructed cheaply (no I/O); fetches happen lazily on demand. The VIX
     helpers deliberately ignore the ETF's start/end window so the VIX subplot
     always shows the full 1990 -> today history.
+
+    Projection: with `columns` (e.g. ``("Close",)``) every fetch keeps only
+    those fields, and with `dtype` (e.g. ``"float32"`` for display-only
+    paths) stores them in that precision — see `project_columns`. A wide
+    fetch keeps yfinance's single shared DatetimeIndex across tickers. The
+    default (None, None) hands back the feed's full frame.
+
+    Cache: with a `market_cache.MarketCache`, a history fetched since its
+    market's last close is served from disk (the full frame is cached; the
+    projection applies on the way out). None = always the network.
     """
 
-    def __init__(self, start_date=None, end_date=None):
+    def __init__(self, start_date=None, end_date=None, columns=None, dtype=None,
+                 cache=None):
         self.start_date = start_date
         self.end_date = end_date
+        self.columns = tuple(columns) if columns is not None else None
+        self.dtype = dtype
+        self.cache = cache
+
+    def _through_cache(self, key, instruments, fetch):
+        if self.cache is None:
+            return fetch()
+        from fentu.explatoryservices.market_cache import latest_market, market_of
+
+        market = latest_market(market_of(instrument) for instrument in instruments)
+        return self.cache.get_or_fetch(key, market, fetch)
 
     def _raw_open_high_low_close(self, instrument):
+        """Full open_high_low_close history for `instrument` (cache, else
+        network), projected; see `fetch_open_high_low_close`."""
+        frame = self._through_cache(("ohlc", instrument), [instrument],
+                                    lambda: self.fetch_open_high_low_close(instrument))
+        return project_columns(frame, self.columns, self.dtype)
+
+    def fetch_open_high_low_close(self, instrument):
         """Fetch full open_high_low_close history for `instrument` with no date filtering.
 
-        The shared network fetch; callers that want the repository's date
-        window apply start_date/end_date themselves.
+        The shared network fetch, never read from or written to the cache
+        (``prefetch`` calls it to refresh one); callers that want the
+        repository's date window apply start_date/end_date themselves.
 
         A spurious yfinance failure ("possibly delisted; no price data
         found") yields an EMPTY DataFrame whose index is a plain Index with
         no .tz attribute -- only strip tz from a real DatetimeIndex.
         """
+        import yfinance as yf
+        from curl_cffi import requests
+
         session = requests.Session(impersonate="chrome")
         ticker = yf.Ticker(instrument, session=session)
-        open_high_low_close = ticker.history(period="max")
+        with span("fetch_open_high_low_close", "network", instrument=instrument):
+            open_high_low_close = ticker.history(period="max")
         if isinstance(open_high_low_close.index, pd.DatetimeIndex) and open_high_low_close.index.tz is not None:
             open_high_low_close.index = open_high_low_close.index.tz_localize(None)
         return open_high_low_close
@@ -205,6 +294,65 @@ class ReturnsRepository:
         except Exception:
             return None
 
+    def _fetch_intraday_bars(self, instrument, interval="1m"):
+        """Today's intraday open_high_low_close bars for `instrument`.
+
+        Live data: never cached and never projected. The index is stripped
+        to tz-naive exchange-local time like the daily histories.
+        """
+        import yfinance as yf
+        from curl_cffi import requests
+
+        session = requests.Session(impersonate="chrome")
+        ticker = yf.Ticker(instrument, session=session)
+        with span("fetch_intraday_bars", "network", instrument=instrument):
+            bars = ticker.history(period="1d", interval=interval)
+        if isinstance(bars.index, pd.DatetimeIndex) and bars.index.tz is not None:
+            bars.index = bars.index.tz_localize(None)
+        return bars
+
+    def try_fetch_intraday_bars(self, instrument, interval="1m"):
+        """Intraday bars, or None on any hiccup (see try_fetch_open_high_low_close)."""
+        try:
+            return self._fetch_intraday_bars(instrument, interval)
+        except Exception:
+            return None
+
+    def get_wide_open_high_low_close(self, instruments):
+        """Wide full history for many instruments (cache, else one bulk
+        fetch), projected; see `_fetch_wide_open_high_low_close`."""
+        instruments = list(instruments)
+        wide = self._through_cache(("wide", *sorted(instruments)), instruments,
+                                   lambda: self._fetch_wide_open_high_low_close(instruments))
+        return project_columns(wide, self.columns, self.dtype)
+
+    def _fetch_wide_open_high_low_close(self, instruments):
+        """One bulk fetch of full history for many instruments.
+
+        Returns a wide frame with (field, ticker) columns -- ``wide["High"]``
+        is dates x tickers -- on one shared, tz-naive DatetimeIndex. yfinance
+        fetches the tickers concurrently; a ticker it cannot fetch comes back
+        as an all-NaN column rather than an exception.
+        """
+        import yfinance as yf
+        from curl_cffi import requests
+
+        session = requests.Session(impersonate="chrome")
+        with span("fetch_wide_open_high_low_close", "network", tickers=len(instruments)):
+            wide = yf.download(list(instruments), period="max", group_by="column",
+                               auto_adjust=True, threads=True, progress=False,
+                               session=session)
+        if isinstance(wide.index, pd.DatetimeIndex) and wide.index.tz is not None:
+            wide.index = wide.index.tz_localize(None)
+        return wide
+
+    def try_fetch_wide_open_high_low_close(self, instruments):
+        """Bulk fetch, or None on any hiccup (see try_fetch_open_high_low_close)."""
+        try:
+            return self.get_wide_open_high_low_close(instruments)
+        except Exception:
+            return None
+
     def get_prices(self, instrument):
         open_high_low_close = self._raw_open_high_low_close(instrument)
         prices = open_high_low_close['Close']
@@ -279,9 +427,13 @@ class VolatilityDashboard:
     """Renders the percentage-change figure's panels from pre-built data.
 
     Never fetches. `plot_vix_panel` takes pre-built open_high_low_close + an optional
-    `(label, value)` current-value pair.
+    `(label, value)` current-value pair. Line panels draw at most
+    `point_budget` points (min/max per bucket: spikes survive exactly).
     """
 
+    def __init__(self, point_budget=POINT_BUDGET):
+        self.point_budget = point_budget
+
     def show_panel_unavailable(self, ax, title, message, detail=""):
         text = message
         if detail:
@@ -293,7 +445,7 @@ class VolatilityDashboard:
         if vix_open_high_low_close.empty:
             self.show_panel_unavailable(ax, "VIX Index", "VIX unavailable")
             return
-        close = vix_open_high_low_close['Close']
+        close = downsample_series(vix_open_high_low_close['Close'], self.point_budget)
         ax.plot(close.index, close.values, color="purple", lw=1.2, label="VIX close")
         ax.set_title("VIX Index")
         ax.set_ylabel("VIX")
@@ -416,10 +568,10 @@ class VolatilityFacade:
         Returns:
             dict with 'returns', 'tails', 'period', 'instrument'
         """
-        if period not in self.return_periods:
-            raise ValueError(f"Period must be one of {list(self.return_periods.keys())}")
+        if period not in RETURN_PERIODS:
+            raise ValueError(f"Period must be one of {list(RETURN_PERIODS)}")
 
-        returns_data = self.return_periods[period]
+        returns_data = getattr(self, f"{period}_returns")  # fetch only this one
         left_tail = np.abs(returns_data[returns_data < 0].values)
         right_tail = returns_data[returns_data > 0].values
 
@@ -437,6 +589,8 @@ class VolatilityFacade:
 
     def _plot_tail_fits(self, tails, axes, tail_percent):
         """Render left/right tail log-log fits onto the two bottom-row axes."""
+        import fentu.explatoryservices.see_power_law as spl
+
         for tail, ax in zip(tails, axes):
             if tail['x_min'] is not None:
                 spl.plot_loglog_with_fit(
@@ -451,6 +605,8 @@ class VolatilityFacade:
         Returns: (fig, ax_qq, ax_hist, ax_left, ax_right, ax_vix) where
         ax_vix spans the full width of its bottom row.
         """
+        import matplotlib.pyplot as plt
+
         fig = plt.figure(figsize=(12, 12))
         gs = fig.add_gridspec(
             3, 2,
@@ -464,38 +620,52 @@ class VolatilityFacade:
         ax_vix = fig.add_subplot(gs[2, :])
         return fig, ax_qq, ax_hist, ax_left, ax_right, ax_vix
 
-    def _plot_percentage_change(self, data, tail_percent):
-        """
-        Plot percentage change visualizations.
+    def _draw_percentage_change(self, fig, axes, data, tail_percent):
+        """Draw every panel onto a prebuilt layout; no window, no show.
 
-        Layout: a 2x2 block of QQ / histogram / left-tail / right-tail on top,
-        with the VIX index curve occupying the full-width row beneath.
-
-        Args:
-            data: dict from _prepare_percentage_change_data
-            tail_percent: Fraction of extreme tail to fit for alpha estimation
+        `axes` is (ax_qq, ax_hist, ax_left, ax_right, ax_vix) as returned by
+        _build_percentage_change_figure_layout.
         """
-        fig, ax_qq, ax_hist, ax_left, ax_right, ax_vix = self._build_percentage_change_figure_layout()
+        import fentu.explatoryservices.plotting_service as ps
 
+        ax_qq, ax_hist, ax_left, ax_right, ax_vix = axes
         ps.qq_plot(data['returns'], ax=ax_qq, show=False)
         ps.histgram_plot(data['returns'], ax=ax_hist, show=False)
         self._plot_tail_fits(data['tails'], [ax_left, ax_right], tail_percent)
         self._plot_vix_panel(ax_vix)
-
         fig.suptitle(f"{data['instrument']} {data['period'].capitalize()} Returns")
-        plt.show()
+
+    def render_percentage_change(self, fig, axes, period='daily', tail_percent=0.10):
+        """Headless twin of visualize_percentage_change: draw `period` onto a
+        caller-owned (fig, axes) layout and return the figure — the caller
+        saves it, and may clear and reuse the layout for the next render."""
+        data = self._prepare_percentage_change_data(period)
+        self._draw_percentage_change(fig, axes, data, tail_percent)
+        return fig
 
     def visualize_percentage_change(self, period='daily', tail_percent=0.10):
         """
         Visualize percentage changes for a specific period using QQ plot, histogram,
         and log-log plots for left and right tail analysis.
 
+        Opens a PeriodDashboard: the figure is built once and the d/w/m/y keys
+        switch period in place (blitting over a cached background).
+
         Args:
             period: str, one of 'daily', 'weekly', 'monthly', 'yearly'
             tail_percent: Fraction of extreme tail to fit for alpha estimation (default 0.1)
+
+        Returns:
+            The PeriodDashboard (after the window closes).
         """
-        data = self._prepare_percentage_change_data(period)
-        self._plot_percentage_change(data, tail_percent)
+        import matplotlib.pyplot as plt
+        from fentu.explatoryservices.period_dashboard import PeriodDashboard
+
+        if period not in RETURN_PERIODS:
+            raise ValueError(f"Period must be one of {list(RETURN_PERIODS)}")
+        dashboard = PeriodDashboard(self, period=period, tail_percent=tail_percent)
+        plt.show()
+        return dashboard
 
     def _find_extreme_returns(self, period='daily', k=None, threshold=None, side='negative'):
         """
@@ -556,6 +726,7 @@ class VolatilityFacade:
         return pd.DataFrame({'price': prices, 'log_return': log_returns})
 
 if __name__ == "__main__":
+    pd.set_option('display.max_rows', None)
     volatility = VolatilityFacade("ILS")
     # Visualize different time-frame return distributions
     # volatility.visualize_percentage_change('weekly')
@@ -0,0 +1,288 @@
+"""Watchlist monitor — the portfolio signal filter for 40+ names at once.
+
+``PortfolioMonitor`` draws a fixed 2x2 of bar charts: the right picture for
+four holdings, and one that cannot hold forty. This applies the same Taleb
+filter (Fooled by Randomness p.166; see ``portfolio_monitor``) to a whole
+watchlist:
+
+* ONE bulk fetch of closes (``ReturnsRepository.get_wide_open_high_low_close``)
+  and ONE vectorized pass over the dates x tickers frame give every name's
+  last calendar-period move, its usual change (MAD of the completed periods
+  before it — the event never calibrates its own denominator), the signed
+  MAD-multiple and the quadratic significance. No per-ticker loop.
+* A heat grid keeps the fixed-position discipline: names sit in watchlist
+  order, row by row, every day, and each cell is colored by its verdict —
+  gray noise inside ±1 usual move, green / red signals deepening with the
+  multiple. The grid is one image plus one label per cell, paged at
+  ``PAGE_SIZE`` names, so the draw cost of a page stays flat as the
+  watchlist grows.
+* The ranking lives in a table instead (``format_table``): the signals by
+  significance, largest first, so the grid never reshuffles.
+
+Calendar periods and the MAD scale are exactly ``PortfolioMonitor``'s
+(``PERIOD_INFO``); a name's row equals its 2x2 panel reading.
+
+CLI
+---
+* ``python -m fentu.explatoryservices.watchlist_monitor [TICKER ...]``
+  ``[--period P] [--all] [--no-show]`` — print the signal table
+  (``--all``: every name) and show the heat grid; default watchlist is the
+  portfolio plus ``stop_cluster_scan.DEFAULT_WATCHLIST``.
+"""
+from __future__ import annotations
+
+import argparse
+import math
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from fentu.explatoryservices.portfolio_monitor import (
+    DEFAULT_PORTFOLIO,
+    DOWN_COLOR,
+    MIN_CALIBRATION_PERIODS,
+    NOISE_COLOR,
+    PERIOD_INFO,
+    UP_COLOR,
+)
+from fentu.explatoryservices.stop_cluster_scan import DEFAULT_WATCHLIST
+from fentu.explatoryservices.volcalculator import ReturnsRepository
+
+DEFAULT_HOLDINGS = tuple(DEFAULT_PORTFOLIO) + tuple(
+    (ticker, ticker) for ticker in DEFAULT_WATCHLIST
+    if ticker not in {t for _label, t in DEFAULT_PORTFOLIO})
+FULL_COLOR_MULTIPLE = 3.0  # a signal this many usual moves out is fully saturated
+PAGE_SIZE = 48  # names per heat-grid page
+
+
+def resample_closes(closes, rule):
+    """Period-end closes under resample `rule` (None = trading days)."""
+    closes = closes.dropna(how="all")
+    return closes if rule is None else closes.resample(rule).last()
+
+
+def period_returns(closes, rule=None):
+    """Percent log returns per calendar period, column-wise.
+
+    Each column matches ``PortfolioMonitor._period_returns`` on that ticker
+    alone: a row where the ticker did not print stays NaN, and its next print
+    is measured from its own previous print (not from a NaN). `closes`
+    already at period ends takes ``rule=None``.
+    """
+    closes = resample_closes(closes, rule)
+    filled = closes.ffill()
+    returns = np.log(filled / filled.shift(1)) * 100.0
+    return returns.where(closes.notna())
+
+
+def _last_valid(values):
+    """Row index of each column's last non-NaN value, and whether it has one."""
+    valid = ~np.isnan(values)
+    has_data = valid.any(axis=0)
+    return values.shape[0] - 1 - valid[::-1].argmax(axis=0), has_data
+
+
+def holding_columns(closes, holdings):
+    """(labels, tickers, closes) with `closes` reindexed to the holdings'
+    tickers in order; `holdings` None takes every column, labelled by ticker."""
+    if holdings is None:
+        holdings = [(ticker, ticker) for ticker in closes.columns]
+    labels = [label for label, _ticker in holdings]
+    tickers = [ticker for _label, ticker in holdings]
+    return labels, tickers, closes.reindex(columns=tickers).astype(float)
+
+
+def signal_table(closes, holdings=None, period="daily"):
+    """Every holding's reading in one vectorized pass.
+
+    `closes` is dates x tickers; `holdings` is ``(label, ticker)`` pairs
+    (default: every column, labelled by ticker) and fixes the row order.
+    Columns: ticker, last_date, last_price, last_move, usual, multiple,
+    significance, signal, n_calibration, insufficient_history. A ticker with
+    no usable history has NaN readings and ``signal`` False.
+    """
+    labels, tickers, closes = holding_columns(closes, holdings)
+    period_closes = resample_closes(closes, PERIOD_INFO[period]["resample"])
+    return period_readings(period_closes, closes, labels)
+
+
+def period_readings(period_closes, closes, labels):
+    """`signal_table` from closes already at period ends (`period_closes`)
+    and the daily `closes` they came from (for the last print)."""
+    columns = np.arange(len(labels))
+    returns = period_returns(period_closes).to_numpy()
+    at, has_move = _last_valid(returns)
+    last_move = np.where(has_move, returns[at, columns], np.nan)
+    calibration = returns.copy()
+    calibration[at, columns] = np.nan
+    n_calibration = (~np.isnan(calibration)).sum(axis=0)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN columns
+        usual = np.nanmean(np.abs(calibration - np.nanmean(calibration, axis=0)), axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        multiple = np.where(usual > 0, last_move / usual, np.nan)
+
+    prices = closes.to_numpy()
+    price_at, has_price = _last_valid(prices)
+    return pd.DataFrame({
+        "ticker": list(closes.columns),
+        "last_date": np.where(has_price, closes.index.values[price_at], np.datetime64("NaT")),
+        "last_price": np.where(has_price, prices[price_at, columns], np.nan),
+        "last_move": last_move,
+        "usual": usual,
+        "multiple": multiple,
+        "significance": multiple ** 2,
+        "signal": np.abs(multiple) > 1.0,
+        "n_calibration": n_calibration,
+        "insufficient_history": n_calibration < MIN_CALIBRATION_PERIODS,
+    }, index=pd.Index(labels, name="label"))
+
+
+def ranked(table, show_all=False):
+    """Signals (or every name) by significance, largest first."""
+    shown = table if show_all else table[table["signal"]]
+    return shown.sort_values("significance", ascending=False, na_position="last",
+                             kind="stable")
+
+
+def format_table(table, period="daily", show_all=False):
+    """Text ranking of the signals (or of every name)."""
+    shown = ranked(table, show_all)
+    unit = PERIOD_INFO[period]["unit"]
+    if shown.empty:
+        return f"no name moved more than its usual {unit}"
+    lines = [f"{'label':<7} {'last':>10} {'move':>8} {'usual':>7} {'x usual':>8}"
+             f" {'signif.':>8}  verdict"]
+    for label, row in shown.iterrows():
+        if math.isnan(row.multiple):
+            lines.append(f"{label:<7} unavailable")
+            continue
+        verdict = "SIGNAL" if row.signal else "noise"
+        if row.insufficient_history:
+            verdict += " (thin history)"
+        lines.append(f"{label:<7} {row.last_price:>10,.2f} {row.last_move:>+7.2f}%"
+                     f" {row.usual:>6.2f}% {row.multiple:>+7.1f}x"
+                     f" {row.significance:>7.1f}x  {verdict}")
+    return "\n".join(lines)
+
+
+def grid_shape(n):
+    """(rows, cols) of the most square grid holding `n` cells."""
+    cols = max(1, math.ceil(math.sqrt(n)))
+    return math.ceil(n / cols), cols
+
+
+def cell_colors(table):
+    """RGB per holding: gray noise, green / red signals deepening with the
+    multiple up to ``FULL_COLOR_MULTIPLE``; white when unavailable."""
+    from matplotlib.colors import to_rgb
+
+    multiple = table["multiple"].to_numpy()
+    depth = np.clip((np.abs(multiple) - 1.0) / (FULL_COLOR_MULTIPLE - 1.0), 0.0, 1.0)
+    tint = np.where((multiple > 0)[:, None], to_rgb(UP_COLOR), to_rgb(DOWN_COLOR))
+    light = np.ones(3)
+    signal = light + (tint - light) * (0.35 + 0.65 * depth)[:, None]
+    colors = np.where(table["signal"].to_numpy()[:, None], signal, to_rgb(NOISE_COLOR))
+    return np.where(np.isnan(multiple)[:, None], light, colors)
+
+
+def plot_heat_grid(ax, table, period="daily", shape=None, title_suffix=""):
+    """Fixed-position heat grid: one image, one label per cell.
+
+    `shape` (rows, cols) defaults to the most square grid for the table;
+    pages pass the full-page shape so a name keeps its cell.
+    """
+    n = len(table)
+    rows, cols = shape or grid_shape(n)
+    image = np.ones((rows * cols, 3))
+    image[:n] = cell_colors(table)
+    ax.imshow(image.reshape(rows, cols, 3), aspect="auto", interpolation="nearest")
+    for i, (label, row) in enumerate(table.iterrows()):
+        reading = "n/a" if math.isnan(row.multiple) else f"{row.multiple:+.1f}x"
+        ax.text(i % cols, i // cols, f"{label}\n{reading}", ha="center", va="center",
+                fontsize=8, fontweight="bold" if row.signal else "normal")
+    ax.set_xticks([])
+    ax.set_yticks([])
+    unit = PERIOD_INFO[period]["unit"]
+    ax.set_title(f"Watchlist {period} signal grid{title_suffix} — each cell = last "
+                 f"{unit}'s move as a multiple of the usual {unit} (MAD); gray = noise",
+                 fontsize=10)
+
+
+def pages(n, page_size=PAGE_SIZE):
+    """Number of grid pages for `n` names."""
+    return max(1, math.ceil(n / page_size))
+
+
+def render(table, period="daily", page=0, page_size=PAGE_SIZE, fig=None):
+    """Draw one page of the heat grid; returns the figure.
+
+    A page holds at most `page_size` names in watchlist order, so the draw
+    cost is bounded however long the watchlist grows, and a name always sits
+    in the same cell of the same page.
+    """
+    import matplotlib.pyplot as plt
+
+    shape = grid_shape(min(len(table), page_size))
+    if fig is None:
+        rows, cols = shape
+        fig = plt.figure(figsize=(min(1.3 * cols + 1, 16), min(0.9 * rows + 1, 12)))
+    fig.clear()
+    # Fixed margins: tight_layout would measure every cell label.
+    ax = fig.add_axes([0.01, 0.01, 0.98, 0.9])
+    n_pages = pages(len(table), page_size)
+    suffix = f" (page {page + 1}/{n_pages})" if n_pages > 1 else ""
+    plot_heat_grid(ax, table.iloc[page * page_size:(page + 1) * page_size], period,
+                   shape, suffix)
+    return fig
+
+
+def _closes(repository, tickers):
+    wide = repository.try_fetch_wide_open_high_low_close(tickers)
+    if wide is None or wide.empty:
+        return None
+    return wide["Close"]
+
+
+def watchlist_report(holdings=DEFAULT_HOLDINGS, period="daily", repository=None,
+                     show_all=False):
+    """(text report, table or None) off ONE bulk fetch; never raises."""
+    repo = repository if repository is not None else ReturnsRepository(columns=("Close",))
+    closes = _closes(repo, [ticker for _label, ticker in holdings])
+    if closes is None:
+        return "watchlist unavailable", None
+    table = signal_table(closes, holdings, period)
+    missing = table.index[table["multiple"].isna()]
+    lines = [format_table(table.drop(missing), period, show_all)]
+    lines += [f"{label} unavailable" for label in missing]
+    return "\n".join(lines), table
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("tickers", nargs="*", metavar="TICKER",
+                        help="yfinance tickers in grid order (default: the watchlist)")
+    parser.add_argument("--period", default="daily", choices=list(PERIOD_INFO))
+    parser.add_argument("--all", action="store_true", dest="show_all",
+                        help="rank every name, not just the signals")
+    parser.add_argument("--no-show", action="store_true", help="print the table only")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    holdings = ([(t.upper(), t.upper()) for t in args.tickers] if args.tickers
+                else DEFAULT_HOLDINGS)
+    report, table = watchlist_report(holdings, args.period, show_all=args.show_all)
+    print(report)
+    if table is not None and not args.no_show:
+        import matplotlib.pyplot as plt
+
+        for page in range(pages(len(table))):
+            render(table, args.period, page)
+        plt.show()
+
+
+if __name__ == "__main__":
+    main()
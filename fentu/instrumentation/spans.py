@@ -0,0 +1,156 @@
+"""Timing spans — where the morning run spends its time.
+
+Wrap a stage in a span and, when recording is on, its wall time lands in a
+per-run report split by category (``network`` / ``compute`` / ``render`` /
+``phase``)::
+
+    with span("option_chain", "network", expiry=expiry):
+        chain = ticker.option_chain(expiry)
+
+    @spanned("compute")
+    def reconstruct_ratios(...): ...
+
+Recording is OFF by default and then costs one flag check per call: ``span``
+hands back a shared no-op context manager and ``spanned`` calls straight
+through. Turn it on with ``enable()`` (or ``FENTU_SPANS=1`` in the
+environment), then write the aggregated JSON report (``write_report``)
+and/or a Chrome trace (``write_chrome_trace``; open in chrome://tracing or
+https://ui.perfetto.dev) to see which stage regressed.
+
+Spans are thread-safe: the orchestrator's concurrent phases each show up on
+their own thread row in the trace.
+"""
+from __future__ import annotations
+
+import functools
+import json
+import os
+import threading
+import time
+
+_LOCK = threading.Lock()
+_STATE = {"enabled": os.environ.get("FENTU_SPANS") == "1", "origin": time.perf_counter()}
+_RECORDS = []  # one dict per finished span
+
+
+class _NullSpan:
+    """The disabled span: enter/exit do nothing."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    def __init__(self, name, category, args):
+        self.name, self.category, self.args = name, category, args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        end = time.perf_counter()
+        record = {
+            "name": self.name, "cat": self.category,
+            "start": self.start - _STATE["origin"], "dur": end - self.start,
+            "tid": threading.get_ident(), "args": self.args,
+        }
+        if exc_type is not None:
+            record["args"] = {**self.args, "error": exc_type.__name__}
+        with _LOCK:
+            _RECORDS.append(record)
+        return False
+
+
+def enabled():
+    return _STATE["enabled"]
+
+
+def enable():
+    """Start recording (keeps any spans already recorded)."""
+    _STATE["enabled"] = True
+
+
+def disable():
+    _STATE["enabled"] = False
+
+
+def reset():
+    """Forget recorded spans; trace timestamps restart at zero."""
+    with _LOCK:
+        _RECORDS.clear()
+        _STATE["origin"] = time.perf_counter()
+
+
+def span(name, category="compute", **args):
+    """Context manager timing one stage; a shared no-op when disabled."""
+    if not _STATE["enabled"]:
+        return _NULL_SPAN
+    return _Span(name, category, args)
+
+
+def spanned(category="compute", name=None):
+    """Decorator: time every call of the function as a span."""
+
+    def decorate(fn):
+        label = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _STATE["enabled"]:
+                return fn(*args, **kwargs)
+            with _Span(label, category, {}):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def records():
+    with _LOCK:
+        return list(_RECORDS)
+
+
+def report():
+    """Aggregated timings: per span name and per category (seconds)."""
+    by_name, by_category = {}, {}
+    for record in records():
+        entry = by_name.setdefault(record["name"], {
+            "category": record["cat"], "count": 0, "total_s": 0.0, "max_s": 0.0})
+        entry["count"] += 1
+        entry["total_s"] += record["dur"]
+        entry["max_s"] = max(entry["max_s"], record["dur"])
+        by_category[record["cat"]] = by_category.get(record["cat"], 0.0) + record["dur"]
+    spans = dict(sorted(by_name.items(), key=lambda item: -item[1]["total_s"]))
+    return {"spans": spans, "categories": by_category}
+
+
+def write_report(path):
+    """The per-run JSON timing report (see `report`)."""
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(report(), fh, indent=2)
+    return path
+
+
+def chrome_trace():
+    """Trace Event Format: one complete ('X') event per span, microseconds."""
+    pid = os.getpid()
+    events = [{
+        "name": r["name"], "cat": r["cat"], "ph": "X", "pid": pid, "tid": r["tid"],
+        "ts": round(r["start"] * 1e6, 1), "dur": round(r["dur"] * 1e6, 1),
+        "args": {k: str(v) for k, v in r["args"].items()},
+    } for r in records()]
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def write_chrome_trace(path):
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(chrome_trace(), fh)
+    return path
@@ -20,27 +20,46 @@ its report AND pops its plot out on screen (close a window to advance):
 Run it:
     uv run python -m fentu.orchestrator.orchestrate_daily
 
+The phases form a small task graph (``task_graph.TaskGraph``): the portfolio
+scan, the QQQ option chain and the ^VXN/QQQ history download start together;
+the SIGNAL tickers' price frames follow the scan. Reports still print in the
+order above while the remaining branches fetch, each phase is timed, and the
+run ends with a one-line timing summary.
+
 Flags:
     --skip-tail   run only the signal scan + high/low levels (no option chain)
     --no-show     print reports only, no plots pop out (headless/cron runs)
+    --timing-report PATH   record spans (fetches, option chains, fits,
+                  reconstruction, savefig) and write the JSON timing report
+    --trace PATH  also write a Chrome trace (chrome://tracing, Perfetto)
+    --no-cache    always fetch live; by default prices, the QQQ chain and the
+                  ^VXN/QQQ history come from the local market cache when it
+                  was filled after the last US close (``prefetch``)
 """
 
 from __future__ import annotations
 
 import logging
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 
 from fentu.explatoryservices.high_low_levels import (
     _report_from_open_high_low_close,
     plot_high_low_levels,
 )
+from fentu.explatoryservices.market_cache import MarketCache, cached
 from fentu.explatoryservices.portfolio_monitor import PortfolioMonitor
-from fentu.explatoryservices.volcalculator import ReturnsRepository
-from fentu.pricingservices import tail_plot
+from fentu.explatoryservices.volcalculator import OPEN_HIGH_LOW_CLOSE, ReturnsRepository
+from fentu.instrumentation import spans
+from fentu.orchestrator.task_graph import TaskGraph, format_timings
 
 logger = logging.getLogger(__name__)
 
+TAIL_QUOTES_KEY = ("tail_quotes", "QQQ")
+TAIL_HISTORY_KEY = ("tail_history", "QQQ", 10)  # download_price_history's default years
+
 
 def signal_panels(panels):
     """Panels whose last move is a SIGNAL, not noise (available holdings only)."""
@@ -62,55 +81,136 @@ def format_panel_line(panel):
             f"({reading}) -> {verdict}")
 
 
-def main(argv=None):
-    args = list(argv if argv is not None else sys.argv[1:])
-    skip_tail = "--skip-tail" in args
-    show = "--no-show" not in args
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
-    )
+def _fetch_signal_frames(repository, tickers):
+    """Price frames for the SIGNAL tickers, fetched side by side."""
+    if not tickers:
+        return {}
+    with ThreadPoolExecutor(max_workers=len(tickers)) as pool:
+        frames = pool.map(repository.try_fetch_open_high_low_close, tickers)
+        return dict(zip(tickers, frames))
 
-    monitor = PortfolioMonitor(period="daily")
-    ticker_of = dict(monitor.holdings)  # label -> yfinance ticker
-    repository = ReturnsRepository()
 
-    print("=== daily orchestration ===")
+def fetch_tail_quotes():
+    """Today's QQQ option chain quotes (tail_plot's input)."""
+    from fentu.pricingservices import tail_plot
+    return tail_plot.fetch_today_quotes()
+
+
+def fetch_tail_history():
+    """The ^VXN/QQQ price history (tail_plot's input)."""
+    from fentu.pricingservices import tail_plot
+    return tail_plot.download_price_history()
+
+
+def build_graph(monitor, repository, skip_tail, cache=None):
+    """The daily task graph: the signal levels wait on the portfolio scan;
+    the QQQ chain and the ^VXN/QQQ history are independent branches (read
+    through `cache` when given)."""
+    ticker_of = dict(monitor.holdings)  # label -> yfinance ticker
+    graph = TaskGraph()
+    graph.add("portfolio", monitor.prepare_panels)
+    graph.add("levels", lambda panels: _fetch_signal_frames(
+        repository, [ticker_of[p["label"]] for p in signal_panels(panels)]),
+        after=["portfolio"])
+    if not skip_tail:
+        graph.add("tail_quotes", cached(cache, TAIL_QUOTES_KEY, "US", fetch_tail_quotes))
+        graph.add("tail_history", cached(cache, TAIL_HISTORY_KEY, "US", fetch_tail_history))
+    return graph
+
+
+def _print_portfolio(graph, monitor, show):
     print("\n--- see_change daily portfolio (Taleb noise filter) ---")
-    panels = monitor.prepare_panels()
+    panels = graph.result("portfolio")
     for panel in panels:
         print(format_panel_line(panel))
     if show:
         monitor.visualize(panels)  # the 2x2 signal panel pops out
+    return panels
+
 
+def _print_levels(graph, monitor, panels, show):
+    ticker_of = dict(monitor.holdings)
     signals = signal_panels(panels)
     if not signals:
         print("\nno SIGNAL today: every holding stayed inside its usual band "
               "(noise)")
+    frames = graph.result("levels")
     for panel in signals:
         ticker = ticker_of[panel["label"]]
         print(f"\n--- {ticker} SIGNAL today -> high/low levels ---")
-        frame = repository.try_fetch_open_high_low_close(ticker)
+        frame = frames.get(ticker)
         print(_report_from_open_high_low_close(frame, ticker, date.today()))
         if show and frame is not None and not frame.empty:
             plot_high_low_levels(frame, ticker, show=True)
 
-    if skip_tail:
-        logger.info("--skip-tail: skipping the QQQ tail-to-body chart")
-        return 0
+
+def _print_tail(graph, show):
+    # Imported here: matplotlib/yfinance/scipy load only when the tail
+    # chart actually runs (not for --skip-tail).
+    from fentu.pricingservices import tail_plot
 
     print("\n--- NDX100 QQQ tail-to-body ratio (every day) ---")
     try:
-        save_path, today_ratio, q25 = tail_plot.plot_tail_cheapness(show=show)
+        inputs = tail_plot.TailInputs(graph.result("tail_quotes"),
+                                      graph.result("tail_history"))
+        save_path, today_ratio, q25 = tail_plot.plot_tail_cheapness(
+            show=show, inputs=inputs)
     except Exception as exc:  # noqa: BLE001 — a broken chart must not kill the day
         print(f"QQQ tail chart skipped: {exc}")
-        return 0
+        return
     # Reuse the tail_plot verdict wording — the single source of the decision.
     verdict = tail_plot._verdict(today_ratio, q25)
     decision_level = int(tail_plot.DECISION_LEVEL * 100)
     print(f"QQQ: {decision_level}% OTM put / ATM straddle today = "
           f"{today_ratio:.4f} vs 25th pct buy line {q25:.4f} -> {verdict}")
     print(f"chart: {save_path}")
+
+
+def _flag_value(args, flag):
+    """The argument after `flag`, or None when the flag is absent."""
+    if flag in args and args.index(flag) + 1 < len(args):
+        return args[args.index(flag) + 1]
+    return None
+
+
+def _write_span_outputs(report_path, trace_path):
+    if report_path:
+        print(f"timing report: {spans.write_report(report_path)}")
+    if trace_path:
+        print(f"trace: {spans.write_chrome_trace(trace_path)}")
+
+
+def main(argv=None):
+    args = list(argv if argv is not None else sys.argv[1:])
+    skip_tail = "--skip-tail" in args
+    show = "--no-show" not in args
+    report_path = _flag_value(args, "--timing-report")
+    trace_path = _flag_value(args, "--trace")
+    if report_path or trace_path:
+        spans.reset()
+        spans.enable()
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+    started = time.perf_counter()
+    cache = None if "--no-cache" in args else MarketCache.from_env()
+    monitor = PortfolioMonitor(
+        period="daily", repository=ReturnsRepository(columns=("Close",), cache=cache))
+    repository = ReturnsRepository(columns=OPEN_HIGH_LOW_CLOSE, cache=cache)
+    graph = build_graph(monitor, repository, skip_tail, cache)
+
+    print("=== daily orchestration ===")
+    with graph:  # every fetch starts now; reports print in order as they land
+        panels = _print_portfolio(graph, monitor, show)
+        _print_levels(graph, monitor, panels, show)
+        if skip_tail:
+            logger.info("--skip-tail: skipping the QQQ tail-to-body chart")
+        else:
+            _print_tail(graph, show)
+    print(f"\n{format_timings(graph.timings, time.perf_counter() - started)}")
+    _write_span_outputs(report_path, trace_path)
     return 0
 
 
@@ -0,0 +1,140 @@
+"""Prefetch: warm the local market cache shortly after each close.
+
+``morning_brief`` is read before coffee and ``orchestrate_daily`` is run by
+hand; both used to block on yfinance at the moment they were invoked. This
+fetches what they will ask for once the data is final and stores it in
+``market_cache.MarketCache``, so the interactive run is served from disk:
+
+* HK close (16:00 HKT): the Asia-Pacific index histories of the morning
+  brief (``^HSI``, Nikkei, KOSPI, ASX — all closed by then). Its European and
+  FX lines are live in the US morning and are always fetched.
+* US close (16:00 ET): the portfolio holdings and ``^VIX`` histories, the
+  QQQ option chain quotes and the ^VXN/QQQ history (orchestrate_daily).
+
+Each market's jobs run concurrently; one failed fetch is logged and skipped
+(the interactive command will simply fetch it live).
+
+CLI
+---
+* ``python -m fentu.orchestrator.prefetch --once [--market HK US]`` — one
+  shot, for cron (e.g. ``20 16 * * 1-5`` in New York time).
+* ``python -m fentu.orchestrator.prefetch`` — stay up as a small daemon,
+  sleeping until ``--delay-minutes`` (default 20) after each close.
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from fentu.explatoryservices.market_cache import (
+    MARKETS,
+    MarketCache,
+    market_of,
+    next_close,
+    utc_now,
+)
+from fentu.explatoryservices.morning_brief import OVERNIGHT_MARKETS
+from fentu.explatoryservices.portfolio_monitor import DEFAULT_PORTFOLIO
+from fentu.explatoryservices.volcalculator import VIX_TICKER, ReturnsRepository
+from fentu.orchestrator import orchestrate_daily
+
+logger = logging.getLogger(__name__)
+
+PREFETCH_DELAY = timedelta(minutes=20)  # let the closing prints settle
+
+
+def jobs(market, repository):
+    """(cache key, fetch) pairs to warm after `market`'s close."""
+    def history(ticker):
+        return ("ohlc", ticker), lambda: repository.fetch_open_high_low_close(ticker)
+
+    if market == "HK":
+        return [history(ticker) for _label, ticker, _decimals in OVERNIGHT_MARKETS
+                if market_of(ticker) == "HK"]
+    tickers = [ticker for _label, ticker in DEFAULT_PORTFOLIO] + [VIX_TICKER]
+    return [history(ticker) for ticker in tickers] + [
+        (orchestrate_daily.TAIL_QUOTES_KEY, orchestrate_daily.fetch_tail_quotes),
+        (orchestrate_daily.TAIL_HISTORY_KEY, orchestrate_daily.fetch_tail_history),
+    ]
+
+
+def _refresh(cache, key, fetch):
+    try:
+        value = cache.refresh(key, fetch)
+    except Exception as exc:  # noqa: BLE001 — one bad fetch must not stop the rest
+        logger.warning("prefetch %s failed: %s", key, exc)
+        return f"failed ({exc})"
+    return "failed (empty)" if value is None or getattr(value, "empty", False) else "ok"
+
+
+def prefetch(market, cache, repository=None):
+    """Fetch and store every job of `market` now; {key: 'ok' | 'failed (...)'}."""
+    repository = repository if repository is not None else ReturnsRepository()
+    pending = jobs(market, repository)
+    with ThreadPoolExecutor(max_workers=len(pending)) as pool:
+        outcomes = pool.map(lambda job: _refresh(cache, *job), pending)
+        return {key: outcome for (key, _fetch), outcome in zip(pending, outcomes)}
+
+
+def next_run(now_utc, markets=MARKETS, delay=PREFETCH_DELAY):
+    """(when, market) of the next prefetch: `delay` after the soonest close."""
+    return min((next_close(market, now_utc - delay) + delay, market) for market in markets)
+
+
+def run_daemon(cache, markets=MARKETS, delay=PREFETCH_DELAY, runs=None,
+               sleep=time.sleep, now=utc_now):
+    """Sleep until each close (+ delay), prefetch that market, repeat.
+
+    `runs` bounds the loop (None = forever); `sleep` / `now` are injectable.
+    """
+    done = 0
+    while runs is None or done < runs:
+        when, market = next_run(now(), markets, delay)
+        logger.info("next prefetch: %s at %s", market, when.isoformat())
+        sleep(max((when - now()).total_seconds(), 0.0))
+        _log_outcomes(market, prefetch(market, cache))
+        done += 1
+
+
+def _log_outcomes(market, outcomes):
+    ok = sum(outcome == "ok" for outcome in outcomes.values())
+    logger.info("prefetched %s: %d/%d ok", market, ok, len(outcomes))
+    return ok
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--once", action="store_true",
+                        help="prefetch now and exit (cron) instead of staying up")
+    parser.add_argument("--market", nargs="+", choices=MARKETS, default=list(MARKETS))
+    parser.add_argument("--delay-minutes", type=float, default=PREFETCH_DELAY.seconds / 60,
+                        help="daemon: minutes after the close to fetch")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    logging.basicConfig(level=logging.INFO,
+                        format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    cache = MarketCache.from_env()
+    if cache is None:
+        print("market cache is off (FENTU_MARKET_CACHE=off); nothing to prefetch")
+        return 1
+    if not args.once:
+        run_daemon(cache, args.market, timedelta(minutes=args.delay_minutes))
+        return 0
+    failed = 0
+    for market in args.market:
+        outcomes = prefetch(market, cache)
+        for key, outcome in outcomes.items():
+            print(f"{market} {'/'.join(map(str, key))}: {outcome}")
+        failed += len(outcomes) - _log_outcomes(market, outcomes)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
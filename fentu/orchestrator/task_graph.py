@@ -0,0 +1,80 @@
+"""A tiny task graph: declared dependencies, concurrent branches, timed phases.
+
+The daily run is mostly waiting on the network (portfolio prices, the QQQ
+option chain, ^VXN/QQQ history). Those fetches do not depend on each other,
+so they run side by side; a task that needs another's output names it in
+``after`` and receives its result as an argument. The caller still consumes
+results in whatever order it likes (``result(name)`` blocks until that task
+is done), so reports print in a fixed order while the later branches keep
+fetching — the run takes as long as its slowest branch, not the sum.
+
+A failed task re-raises from ``result``; its dependents fail with the same
+exception instead of running on missing input.
+"""
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from fentu.instrumentation.spans import span
+
+logger = logging.getLogger(__name__)
+
+
+class TaskGraph:
+    """Submit tasks in dependency order; each runs as soon as its inputs exist."""
+
+    def __init__(self):
+        self._tasks = []  # (name, fn, after) in declaration order
+        self._futures = {}
+        self._pool = None
+        self.timings = {}  # name -> seconds spent in the task itself
+
+    def add(self, name, fn, after=()):
+        """Declare `name` = fn(*results of `after`); dependencies must exist."""
+        missing = [dep for dep in after if dep not in {t[0] for t in self._tasks}]
+        if missing:
+            raise ValueError(f"{name}: unknown dependencies {missing}")
+        self._tasks.append((name, fn, tuple(after)))
+        return self
+
+    def _timed(self, name, fn, after):
+        inputs = [self._futures[dep].result() for dep in after]
+        started = time.perf_counter()
+        try:
+            with span(name, "phase"):
+                return fn(*inputs)
+        finally:
+            self.timings[name] = time.perf_counter() - started
+            logger.info("phase %s: %.2fs", name, self.timings[name])
+
+    def start(self):
+        """Launch every task; one thread each, so a waiting task never starves
+        a runnable one."""
+        self._pool = ThreadPoolExecutor(max_workers=max(len(self._tasks), 1),
+                                        thread_name_prefix="phase")
+        for name, fn, after in self._tasks:
+            self._futures[name] = self._pool.submit(self._timed, name, fn, after)
+        return self
+
+    def result(self, name):
+        """Block until `name` finishes; its return value, or its exception."""
+        return self._futures[name].result()
+
+    def close(self):
+        """Wait for the remaining tasks and release the threads."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def format_timings(timings, wall):
+    """'phase timings: portfolio 0.81s | tail_quotes 2.10s | wall 2.31s'."""
+    phases = " | ".join(f"{name} {seconds:.2f}s" for name, seconds in timings.items())
+    return f"phase timings: {phases} | wall {wall:.2f}s" if phases else f"wall {wall:.2f}s"
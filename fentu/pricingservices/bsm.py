@@ -0,0 +1,46 @@
+"""Vectorized Black-Scholes-Merton: whole price histories in one numpy pass.
+
+py_vollib prices one option per call — fine for today's quote, slow for
+every day since 1999 at every wing. These take arrays (or scalars, broadcast
+together) and return arrays, agreeing with py_vollib to rounding; a
+non-positive vol or tenor prices the intrinsic value.
+
+Prices are homogeneous in (spot, strike), so the wing/body ratio depends only
+on the vols and the tenor (``pricing_engines.BSMEngine`` prices it at spot 1).
+"""
+from __future__ import annotations
+
+import numpy as np
+from scipy.special import ndtr
+
+
+def _d1_d2(spot, strike, vol, t_years, rate):
+    root_t = np.sqrt(t_years)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d1 = (np.log(spot / strike) + (rate + 0.5 * vol * vol) * t_years) / (vol * root_t)
+    return d1, d1 - vol * root_t
+
+
+def _price(sign, spot, strike, vol, t_years, rate):
+    spot, strike, vol, t_years, rate = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (spot, strike, vol, t_years, rate)))
+    d1, d2 = _d1_d2(spot, strike, vol, t_years, rate)
+    discount = np.exp(-rate * t_years)
+    price = sign * (spot * ndtr(sign * d1) - strike * discount * ndtr(sign * d2))
+    intrinsic = np.maximum(sign * (spot - strike), 0.0)
+    return np.where((vol > 0) & (t_years > 0), price, intrinsic)
+
+
+def call(spot, strike, vol, t_years, rate=0.0):
+    """BSM call price, element-wise."""
+    return _price(1.0, spot, strike, vol, t_years, rate)
+
+
+def put(spot, strike, vol, t_years, rate=0.0):
+    """BSM put price, element-wise."""
+    return _price(-1.0, spot, strike, vol, t_years, rate)
+
+
+def straddle(spot, vol, t_years, rate=0.0):
+    """ATM straddle (call + put struck at spot), element-wise."""
+    return call(spot, spot, vol, t_years, rate) + put(spot, spot, vol, t_years, rate)
@@ -8,6 +8,8 @@ from __future__ import annotations
 
 from datetime import datetime
 
+from fentu.instrumentation.spans import span
+
 
 def mid(row) -> float:
     """Mid-market price from a yfinance chain row (bid, ask)."""
@@ -19,7 +21,8 @@ def fetch_spot(symbol: str) -> float:
     import yfinance as yf
 
     ticker = yf.Ticker(symbol)
-    return float(ticker.history(period="1d")["Close"].iloc[-1])
+    with span("fetch_spot", "network", symbol=symbol):
+        return float(ticker.history(period="1d")["Close"].iloc[-1])
 
 
 def pick_expiry(ticker, target_days: int, max_dte_factor: float = 1.7) -> str | None:
@@ -0,0 +1,148 @@
+"""Order statistics over a growing (or sliding) sample, in O(log n) per step.
+
+A walk-forward percentile asks, at every date, "where does today's value sit
+among the values before it?" and "what is their 25th percentile?". Sorting
+the prior sample for each date is O(n log n) per day; ``RankTree`` keeps a
+Fenwick (binary indexed) tree of counts over the sample's value ranks instead,
+so adding a value, removing one (a sliding window), counting the values below
+a rank and finding the k-th smallest are each O(log n).
+
+The ranks are the positions of the values in a sorted grid fixed up front —
+for a backtest, the sorted distinct values of the whole series (knowing
+where a future value *would* sort reveals nothing about today, as long as
+it is only added to the tree on its own date).
+
+When the values arrive one date at a time with no grid known in advance,
+``SortedSample`` keeps them in a sorted list instead: a binary-search insert
+per appended date, and the rank of a value and any percentile by binary
+search / direct index — exact, never re-sorted.
+"""
+from __future__ import annotations
+
+import bisect
+import math
+
+import numpy as np
+
+
+class RankTree:
+    """Fenwick tree of value counts over ranks ``0 .. size - 1``."""
+
+    __slots__ = ("size", "count", "_tree", "_top")
+
+    def __init__(self, size):
+        self.size = size
+        self.count = 0
+        self._tree = [0] * (size + 1)
+        self._top = 1 << (size.bit_length() - 1) if size else 0
+
+    def add(self, rank, delta=1):
+        """Add `delta` copies of the value at `rank` (negative removes)."""
+        self.count += delta
+        i = rank + 1
+        tree, size = self._tree, self.size
+        while i <= size:
+            tree[i] += delta
+            i += i & -i
+
+    def below(self, rank):
+        """How many values in the tree have a rank ``< rank``."""
+        total = 0
+        tree = self._tree
+        while rank > 0:
+            total += tree[rank]
+            rank -= rank & -rank
+        return total
+
+    def kth(self, k):
+        """Rank of the k-th smallest value in the tree (0-based)."""
+        if not 0 <= k < self.count:
+            raise IndexError(f"k={k} outside a tree of {self.count} values")
+        position, step, tree, size = 0, self._top, self._tree, self.size
+        while step:
+            nxt = position + step
+            if nxt <= size and tree[nxt] <= k:
+                position = nxt
+                k -= tree[nxt]
+            step >>= 1
+        return position
+
+
+class SortedSample:
+    """A growing sample kept sorted, for the percentile questions on it."""
+
+    __slots__ = ("_sorted",)
+
+    def __init__(self, values=()):
+        self._sorted = sorted(v for v in values if math.isfinite(v))
+
+    def __len__(self):
+        return len(self._sorted)
+
+    def append(self, value):
+        """Add one value (NaN / inf are ignored): a binary-search insert."""
+        if math.isfinite(value):
+            bisect.insort(self._sorted, value)
+
+    def rank_share(self, value):
+        """Fraction of the sample strictly below `value` (NaN when the sample
+        is empty or `value` is NaN / inf — a missing quote has no rank)."""
+        if not self._sorted or not math.isfinite(value):
+            return float("nan")
+        return bisect.bisect_left(self._sorted, value) / len(self._sorted)
+
+    def percentile(self, q):
+        """``np.percentile(sample, q)`` with its linear interpolation."""
+        return _interpolated(self._sorted.__getitem__, len(self._sorted), q)
+
+
+def _interpolated(kth_value, n, q):
+    """`q`-th percentile of `n` values given the k-th smallest (0-based)."""
+    if n == 0:
+        return float("nan")
+    position = q / 100.0 * (n - 1)
+    lo = math.floor(position)
+    low = kth_value(lo)
+    if lo + 1 >= n:
+        return float(low)
+    return float(low + (position - lo) * (kth_value(lo + 1) - low))
+
+
+def percentile_at(tree, grid, q):
+    """``np.percentile(values, q)`` (linear interpolation) of the values in
+    `tree`, whose ranks index the sorted `grid`. NaN when the tree is empty."""
+    return _interpolated(lambda k: grid[tree.kth(k)], tree.count, q)
+
+
+def walk_forward_percentiles(values, qs=(25.0,), window=None):
+    """For every index ``t``: the rank share of ``values[t]`` among the prior
+    values and their ``qs`` percentiles, using only ``values[:t]`` (or the last
+    `window` of them).
+
+    Returns ``(share, {q: array})``; ``share[t]`` is the fraction of prior
+    values strictly below ``values[t]``. NaN values are skipped (never added,
+    never scored); index 0 and NaN rows read NaN.
+    """
+    values = np.asarray(values, dtype=float)
+    finite = np.isfinite(values)
+    grid, ranks = np.unique(values[finite], return_inverse=True)
+    rank_of = np.full(len(values), -1, dtype=np.int64)
+    rank_of[finite] = ranks
+    tree = RankTree(len(grid))
+    share = np.full(len(values), np.nan)
+    out = {q: np.full(len(values), np.nan) for q in qs}
+    live = []  # ranks in the tree, oldest first (for the sliding window)
+    oldest = 0
+    for t, rank in enumerate(rank_of.tolist()):
+        if rank < 0:
+            continue
+        if tree.count:
+            share[t] = tree.below(rank) / tree.count
+            for q in qs:
+                out[q][t] = percentile_at(tree, grid, q)
+        tree.add(rank)
+        live.append(rank)
+        if window is not None and tree.count > window:
+            tree.add(live[oldest], -1)
+            oldest += 1
+    return share, out
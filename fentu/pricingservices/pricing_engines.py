@@ -0,0 +1,149 @@
+"""Option pricing engines for the tail chart: lognormal BSM and a fat-tailed one.
+
+``tail_plot`` reconstructs the wing/body ratio history with BSM — a Gaussian
+3m log return, exactly the body assumption the rest of the codebase rejects.
+``StudentTEngine`` prices the same options with a Student-t terminal log
+return instead, at the same (vol, tenor) as BSM, so the two histories differ
+only in the shape of the distribution:
+
+    log(S_T / S_0) = mu + vol * sqrt(t) * Z,  Z ~ Student-t(df), unit variance
+
+The t density has no exponential moment, so the move ``vol * sqrt(t) * Z``
+is truncated at ``MAX_LOG_MOVE`` (in log-return units, whatever the vol and
+tenor, so the 25%-OTM strike always sits inside the support) and
+renormalized, and ``mu`` is set so that ``E[S_T] = S_0`` (zero rate, like
+``bsm.put``) on the truncated law.
+
+Prices are expectations over a quadrature grid: per vol, ``QUADRATURE_NODES``
+sinh-spaced nodes in ``Z`` out to the truncation (dense in the body, still
+resolving the tails) with trapezoid weights times the t density. For one
+tenor and one strike, the price curve is evaluated on ``VOL_GRID`` in one
+vectorized (vols x nodes) pass and cached; every day's price is then a
+log-log interpolation on that curve, so a whole history costs about what the
+vectorized BSM does. Vols off the grid, and any point where the curve is
+not finite, are integrated directly.
+
+Every price is per unit of spot, with strikes as fractions of spot (prices
+are homogeneous in spot and strike).
+"""
+from __future__ import annotations
+
+import numpy as np
+
+from fentu.pricingservices import bsm
+
+DEFAULT_DF = 3.0  # tail index of the t: density ~ |x|^-(df + 1)
+MAX_LOG_MOVE = 3.0  # |log(S_T / S_0) - mu| <= 3: a 95% crash / 20x rally over the tenor
+QUADRATURE_NODES = 512
+VOL_GRID = np.geomspace(0.08, 4.0, 200)  # annual vols where price curves are cached
+
+
+class _Engine:
+    """Wing/body ratios from an engine's ``put`` and ``straddle``."""
+
+    def wing_ratios(self, atm_vols, skew, t_years, levels):
+        """{pct: ``pct``-OTM put at ``atm_vol + skew[pct]/100`` / ATM straddle}
+        for every vol in `atm_vols`; NaN where the straddle is worthless."""
+        atm_vols = np.asarray(atm_vols, dtype=float)
+        body = self.straddle(atm_vols, t_years)
+        ratios = {}
+        for pct in levels:
+            wing = self.put(1.0 - pct, atm_vols + skew[pct] / 100.0, t_years)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ratios[pct] = np.where(body > 0, wing / body, np.nan)
+        return ratios
+
+
+class BSMEngine(_Engine):
+    """Lognormal BSM (the vectorized ``bsm`` pricer)."""
+
+    name = "bsm"
+    label = "BSM"
+
+    def put(self, strike, vols, t_years):
+        return bsm.put(1.0, strike, vols, t_years)
+
+    def straddle(self, vols, t_years):
+        return bsm.straddle(1.0, vols, t_years)
+
+
+def _t_quadrature(df, nodes, z_max):
+    """(z, weights), one row per entry of `z_max`: the unit-variance
+    Student-t truncated at ±z_max."""
+    from scipy import stats
+
+    u = np.arcsinh(np.asarray(z_max, dtype=float))[:, None] * np.linspace(-1.0, 1.0, nodes)
+    z = np.sinh(u)
+    unit = np.sqrt((df - 2.0) / df)  # Z = unit * T has variance 1 for T ~ t(df)
+    weights = stats.t.pdf(z / unit, df) / unit * np.cosh(u)
+    weights[:, [0, -1]] *= 0.5
+    return z, weights / weights.sum(axis=1, keepdims=True)
+
+
+class StudentTEngine(_Engine):
+    """Student-t terminal log return, priced on a cached quadrature grid."""
+
+    name = "student-t"
+
+    def __init__(self, df=DEFAULT_DF, nodes=QUADRATURE_NODES, max_log_move=MAX_LOG_MOVE):
+        if not df > 2.0:
+            raise ValueError(f"df must exceed 2 for a finite variance, got {df}")
+        self.df, self.nodes, self.max_log_move = df, nodes, max_log_move
+        self.label = f"Student-t (df={df:g})"
+        self._curves = {}  # (kind, strike, t_years) -> log price on VOL_GRID
+
+    def _growth(self, vols, t_years):
+        """(S_T / S_0 at every node and the weights, one row per vol); a
+        martingale on each row."""
+        sd = np.asarray(vols, dtype=float) * np.sqrt(t_years)
+        z, weights = _t_quadrature(self.df, self.nodes, self.max_log_move / sd)
+        moves = np.exp(sd[:, None] * z)
+        return moves / np.sum(moves * weights, axis=1, keepdims=True), weights
+
+    def _integrate(self, kind, strike, vols, t_years):
+        growth, weights = self._growth(vols, t_years)
+        payoff = np.maximum(strike - growth, 0.0) if kind == "put" else np.abs(growth - 1.0)
+        return np.sum(payoff * weights, axis=1)
+
+    def _curve(self, kind, strike, t_years):
+        key = (kind, strike, t_years)
+        if key not in self._curves:
+            with np.errstate(divide="ignore"):
+                self._curves[key] = np.log(self._integrate(kind, strike, VOL_GRID, t_years))
+        return self._curves[key]
+
+    def _price(self, kind, strike, vols, t_years):
+        vols = np.asarray(vols, dtype=float)
+        flat = vols.ravel()
+        out = np.empty(len(flat))
+        on_grid = (flat >= VOL_GRID[0]) & (flat <= VOL_GRID[-1])
+        logged = np.interp(np.log(flat[on_grid]), np.log(VOL_GRID),
+                           self._curve(kind, strike, t_years))
+        out[on_grid] = np.exp(logged)
+        direct = ~on_grid & (flat > 0)
+        direct[on_grid] = ~np.isfinite(logged)  # a zero on the curve: no log-log slope
+        if direct.any():
+            out[direct] = self._integrate(kind, strike, flat[direct], t_years)
+        intrinsic = max(strike - 1.0, 0.0) if kind == "put" else 0.0
+        out[~(flat > 0)] = intrinsic
+        return out.reshape(vols.shape)
+
+    def put(self, strike, vols, t_years):
+        return self._price("put", strike, vols, t_years)
+
+    def straddle(self, vols, t_years):
+        return self._price("straddle", 1.0, vols, t_years)
+
+
+ENGINES = {"bsm": BSMEngine(), "student-t": StudentTEngine()}
+
+
+def pricing_engine(engine):
+    """An engine instance from a name in ``ENGINES`` (or an engine, as is)."""
+    if isinstance(engine, str):
+        try:
+            return ENGINES[engine]
+        except KeyError:
+            raise ValueError(f"unknown pricing engine {engine!r}; "
+                             f"choose from {sorted(ENGINES)}") from None
+    return engine
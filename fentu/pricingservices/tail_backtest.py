@@ -0,0 +1,187 @@
+"""Tail backtest — walk the "CHEAP - buy the tail" rule forward through history.
+
+``tail_plot`` says "CHEAP - buy the tail" when today's 25%-OTM put / ATM
+straddle ratio is below the 25th percentile of the reconstructed history.
+This replays that decision on every past date, with only what was known
+that day:
+
+* the day's ratio is reconstructed exactly as the chart does (the chart's
+  pricing engine — BSM by default, or the Student-t of ``pricing_engines``
+  — at the day's own VXN level, the wing at ``VXN + skew``), for every date
+  at once;
+* its percentile is taken against the ratios *before* it only (expanding,
+  or the last `window` of them), kept in an order-statistics tree
+  (``order_statistics.RankTree``) that grows by one date per step — no
+  re-sorting of the history for each day;
+* each CHEAP date buys one hypothetical 3m 25%-OTM put at the engine's price,
+  held to expiry and settled at the QQQ close on (or after) the expiry date.
+
+The report compares the rule's trades with the other dates and with buying
+every day: hit rate (the put paid more than it cost), in-the-money rate and
+the convexity payoff — payoff as a multiple of the premium, per trade and in
+total. Puts whose expiry is past the last close stay open and are not
+scored.
+
+CLI
+---
+* ``python -m fentu.pricingservices.tail_backtest [--since 1999-01-01]``
+  ``[--skew PTS] [--window DAYS] [--engine bsm|student-t]`` — download
+  VXN/QQQ since `--since` and print the report (skew default: today's real
+  25% wing skew from the chain).
+"""
+from __future__ import annotations
+
+import argparse
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from fentu.pricingservices.order_statistics import walk_forward_percentiles
+from fentu.pricingservices.pricing_engines import ENGINES, pricing_engine
+from fentu.pricingservices.tail_plot import (
+    DECISION_LEVEL,
+    DEFAULT_MATURITY,
+    MATURITIES,
+    download_price_history,
+    fetch_today_quotes,
+)
+
+BUY_PERCENTILE = 25.0  # tail_plot's buy line: the 25th percentile of the ratio history
+MIN_HISTORY = 252  # prior ratios needed before a percentile is trusted (~1 year)
+DEFAULT_SINCE = date(1999, 1, 1)
+
+
+def _closes(frame, n):
+    """A PriceHistory column (yfinance Series or one-column frame) as floats."""
+    return np.asarray(frame, dtype=float).reshape(n, -1)[:, 0]
+
+
+def walk_forward(history, skew_pts, t_days=MATURITIES[DEFAULT_MATURITY], pct=DECISION_LEVEL,
+                 window=None, min_history=MIN_HISTORY, engine="bsm"):
+    """Every date of `history` (``tail_plot.PriceHistory``), judged and traded.
+
+    `engine` ("bsm", "student-t" or a ``pricing_engines`` engine) prices both
+    the ratio and the put, as ``tail_plot.reconstruct_ratios`` does.
+
+    Columns: spot, vol, ratio, percentile (share of prior ratios below the
+    day's), q25 (the prior buy line), cheap, scored (enough prior ratios to
+    judge), strike, cost, expiry, settle, payoff, multiple (payoff / cost)
+    and expired. Dates without a usable VXN/QQQ close are dropped.
+    """
+    dates = pd.DatetimeIndex(history.dates)
+    spot = _closes(history.qqq, len(dates))
+    vol = _closes(history.vxn, len(dates)) / 100.0
+    usable = np.isfinite(spot) & np.isfinite(vol) & (vol > 0)
+    dates, spot, vol = dates[usable], spot[usable], vol[usable]
+
+    t_years = t_days / 365.0
+    engine = pricing_engine(engine)
+    ratio = engine.wing_ratios(vol, {pct: skew_pts}, t_years, (pct,))[pct]
+    share, buy_line = walk_forward_percentiles(ratio, (BUY_PERCENTILE,), window)
+    q25 = buy_line[BUY_PERCENTILE]
+    priced = np.isfinite(ratio)
+    n_prior = np.cumsum(priced) - priced  # only priced ratios enter the sample
+    if window is not None:
+        n_prior = np.minimum(n_prior, window)
+    scored = priced & (n_prior >= min_history)
+    cheap = scored & (ratio < q25)
+
+    strike = spot * (1.0 - pct)
+    cost = spot * engine.put(1.0 - pct, vol + skew_pts / 100.0, t_years)
+    expiry = dates + pd.Timedelta(days=t_days)
+    at = np.searchsorted(dates.values, expiry.values, side="left")
+    expired = at < len(dates)
+    settle = np.where(expired, spot[np.minimum(at, len(dates) - 1)], np.nan)
+    payoff = np.maximum(strike - settle, 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        multiple = np.where(cost > 0, payoff / cost, np.nan)
+    return pd.DataFrame({
+        "spot": spot, "vol": vol, "ratio": ratio, "percentile": share, "q25": q25,
+        "cheap": cheap, "scored": scored, "strike": strike, "cost": cost,
+        "expiry": expiry, "settle": settle, "payoff": payoff, "multiple": multiple,
+        "expired": expired,
+    }, index=pd.Index(dates, name="date"))
+
+
+def _stats(trades):
+    done = trades[trades["expired"]]
+    multiple = done["multiple"]
+    return {
+        "trades": len(done),
+        "open": int((~trades["expired"]).sum()),
+        "hit_rate": (done["payoff"] > done["cost"]).mean() if len(done) else np.nan,
+        "itm_rate": (done["payoff"] > 0).mean() if len(done) else np.nan,
+        "mean_cost_pct": (done["cost"] / done["spot"]).mean() * 100.0 if len(done) else np.nan,
+        "mean_multiple": multiple.mean() if len(done) else np.nan,
+        "median_multiple": multiple.median() if len(done) else np.nan,
+        "max_multiple": multiple.max() if len(done) else np.nan,
+        "payoff_per_premium": (done["payoff"].sum() / done["cost"].sum()
+                               if len(done) and done["cost"].sum() > 0 else np.nan),
+    }
+
+
+def summary(days):
+    """One row per group: the rule's CHEAP dates, the other scored dates and
+    every scored date (buying the tail unconditionally)."""
+    scored = days[days["scored"]]
+    groups = {"CHEAP": scored[scored["cheap"]], "not cheap": scored[~scored["cheap"]],
+              "every day": scored}
+    return pd.DataFrame({name: _stats(trades) for name, trades in groups.items()}).T
+
+
+def format_summary(table, days, model="BSM"):
+    scored = days[days["scored"]]
+    head = (f"{DEFAULT_MATURITY} {int(DECISION_LEVEL * 100)}%-OTM put ({model}) bought when the ratio "
+            f"< prior {BUY_PERCENTILE:.0f}th pct"
+            + (f", {scored.index[0].date()} .. {days.index[-1].date()}" if len(scored) else ""))
+    lines = [head,
+             f"{'':<10} {'trades':>6} {'open':>5} {'hit':>6} {'ITM':>6} {'cost':>7}"
+             f" {'mean x':>7} {'median x':>8} {'max x':>7} {'payoff/prem':>11}"]
+    for name, row in table.iterrows():
+        if not row.trades:
+            lines.append(f"{name:<10} {0:>6} {int(row.open):>5}  no expired trades")
+            continue
+        lines.append(f"{name:<10} {int(row.trades):>6} {int(row.open):>5} {row.hit_rate:>6.1%}"
+                     f" {row.itm_rate:>6.1%} {row.mean_cost_pct:>6.2f}% {row.mean_multiple:>6.2f}x"
+                     f" {row.median_multiple:>7.2f}x {row.max_multiple:>6.1f}x"
+                     f" {row.payoff_per_premium:>10.2f}x")
+    return "\n".join(lines)
+
+
+def _today_skew():
+    quote = fetch_today_quotes().get(DEFAULT_MATURITY)
+    skew = quote["skew_pts"].get(DECISION_LEVEL) if quote else None
+    return skew if skew is not None and np.isfinite(skew) else None
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--since", type=date.fromisoformat, default=DEFAULT_SINCE,
+                        help="first history date (default: 1999-01-01)")
+    parser.add_argument("--skew", type=float, default=None,
+                        help="25%% wing skew in vol points (default: today's real skew)")
+    parser.add_argument("--window", type=int, default=None,
+                        help="rolling percentile length in days (default: expanding)")
+    parser.add_argument("--engine", default="bsm", choices=list(ENGINES),
+                        help="pricing model for the ratios and the puts (default: bsm)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    try:
+        skew = args.skew if args.skew is not None else _today_skew()
+        history = download_price_history((date.today() - args.since).days / 365.25)
+    except Exception as exc:  # a bad feed is reported, not raised
+        print(f"tail backtest unavailable ({exc})")
+        return
+    if skew is None:
+        print("tail backtest unavailable (no 25% wing skew today: pass --skew)")
+        return
+    days = walk_forward(history, skew, window=args.window, engine=args.engine)
+    print(format_summary(summary(days), days, pricing_engine(args.engine).label))
+
+
+if __name__ == "__main__":
+    main()
@@ -7,7 +7,7 @@ Don't buy an option if you have a reason, guess what it's already priced in!
 Never buy an option if it's not cheap.
 
 Run it:
-    uv run python -m fentu.pricingservices.tail_plot
+    uv run python -m fentu.pricingservices.tail_plot [--engine bsm|student-t]
 
 Output: figures/tail_cheapness_<date>.png (named after today's date)
 
@@ -34,8 +34,10 @@ if not os.environ.get("DISPLAY"):
 import matplotlib.pyplot as plt
 import numpy as np
 import yfinance as yf
-from py_vollib.black_scholes import black_scholes
 
+from fentu.instrumentation.spans import span, spanned
+from fentu.pricingservices.order_statistics import SortedSample
+from fentu.pricingservices.pricing_engines import ENGINES, pricing_engine
 from fentu.pricingservices.option_quotes import (
     atm_strike,
     call_iv,
@@ -58,22 +60,6 @@ DECISION_LEVEL = 0.25  # the wing this plot decides on
 LEVEL_COLORS = {0.20: "#1f77b4", 0.25: "#ff7f0e", 0.30: "#9467bd"}
 
 
-def bs_call(spot, strike, vol, t_years, rate=0.0):
-    if vol <= 0 or t_years <= 0:
-        return max(spot - strike, 0.0)
-    return black_scholes("c", spot, strike, t_years, rate, vol)
-
-
-def bs_put(spot, strike, vol, t_years, rate=0.0):
-    if vol <= 0 or t_years <= 0:
-        return max(strike - spot, 0.0)
-    return black_scholes("p", spot, strike, t_years, rate, vol)
-
-
-def bs_straddle(spot, vol, t_years, rate=0.0):
-    return bs_call(spot, spot, vol, t_years, rate) + bs_put(spot, spot, vol, t_years, rate)
-
-
 def fetch_today_quotes():
     """Real mid-market quotes for today: spot, ATM straddle, OTM wings."""
     ticker = yf.Ticker("QQQ")
@@ -83,7 +69,8 @@ def fetch_today_quotes():
     for label, days in MATURITIES.items():
         expiry = pick_expiry(ticker, days)
         if expiry is not None:
-            chain = ticker.option_chain(expiry)
+            with span("option_chain", "network", expiry=expiry):
+                chain = ticker.option_chain(expiry)
             atm_k = atm_strike(chain, spot)
             wing = {pct: otm_put_mid(chain, otm_strike(spot, pct)) for pct in WING_LEVELS}
             atm_iv = call_iv(chain, atm_k)
@@ -99,12 +86,6 @@ def fetch_today_quotes():
     return quotes
 
 
-def _close(series_or_df, day):
-    """Scalar close on a date from a yfinance Series or DataFrame (multi-col feeds)."""
-    value = series_or_df.loc[day]
-    return float(value.iloc[0]) if hasattr(value, "iloc") else float(value)
-
-
 class PriceHistory:
     """Aligned VXN/QQQ closes over the window: the (dates, vxn, qqq) data clump."""
 
@@ -114,65 +95,73 @@ class PriceHistory:
         self.qqq = qqq
 
 
+class TailInputs:
+    """Everything the chart needs from the network: today's chain quotes and
+    the VXN/QQQ history. Fetched up front (possibly concurrently with other
+    work) so plot_tail_cheapness itself does no I/O."""
+
+    def __init__(self, quotes, history):
+        self.quotes = quotes
+        self.history = history
+
+
+def fetch_tail_inputs(years=10):
+    """The chart's two network fetches, which do not depend on each other."""
+    return TailInputs(fetch_today_quotes(), download_price_history(years))
+
+
 def download_price_history(years=10):
     """Phase A: download and align VXN/QQQ closes over the window."""
     end = datetime.now().date()
     start = end - timedelta(days=int(years * 365.25))
-    vxn = yf.download("^VXN", start=start, end=end, progress=False, auto_adjust=False)["Close"]
-    qqq = yf.download("QQQ", start=start, end=end, progress=False, auto_adjust=False)["Close"]
+    with span("download", "network", ticker="^VXN"):
+        vxn = yf.download("^VXN", start=start, end=end, progress=False, auto_adjust=False)["Close"]
+    with span("download", "network", ticker="QQQ"):
+        qqq = yf.download("QQQ", start=start, end=end, progress=False, auto_adjust=False)["Close"]
     dates = vxn.index.intersection(qqq.index)
     if len(dates) == 0:
         raise RuntimeError("no overlapping VXN/QQQ history downloaded — check network and retry")
     return PriceHistory(dates, vxn.loc[dates], qqq.loc[dates])
 
 
-def _bsm_wing_ratios(spot, atm_vol, skew, t_years):
-    """BSM wing/body ratio per OTM level at one (spot, vol) level."""
-    body = bs_straddle(spot, atm_vol, t_years)
-    factor = 1.0 / body if body > 0 else float("nan")
-    ratios = {}
-    for pct in WING_LEVELS:
-        wing_strike = spot * (1 - pct)
-        wing_vol = atm_vol + skew[pct] / 100.0
-        wing_price = bs_put(spot, wing_strike, wing_vol, t_years)
-        ratios[pct] = wing_price * factor
-    return ratios
+def _aligned_closes(frame, dates):
+    """Closes on `dates` as floats, from a yfinance Series or one-column frame."""
+    return np.asarray(frame.loc[dates], dtype=float).reshape(len(dates), -1)[:, 0]
 
 
-def reconstruct_ratios(history, skew, t_years, vol_anchor=1.0):
-    """Phase B: wing/body price ratios per (date, OTM level) from the BSM reconstruction.
+@spanned("compute")
+def reconstruct_ratios(history, skew, t_years, vol_anchor=1.0, engine="bsm"):
+    """Phase B: wing/body price ratios per (date, OTM level) from the model reconstruction.
 
     With vol_anchor=1.0 each day's vol is that day's own real VXN.
     So it's distribution doesn't move with today's quotes.
-    """
 
-    def day_ratios(idx):
-        day = idx.date()
-        s = _close(history.qqq, idx)
-        v = _close(history.vxn, idx) / 100.0 * vol_anchor
-        if not (math.isfinite(s) and math.isfinite(v)) or v <= 0:
-            return []
-        ratios = _bsm_wing_ratios(s, v, skew, t_years)
-        row = []
-        for pct, ratio in ratios.items():
-            row.append((day, pct, ratio))
-        return row
-
-    all_ratios = []
-    for idx in history.dates:
-        all_ratios.extend(day_ratios(idx))
-    return all_ratios
-
-def bsm_model_today_ratio(quote):
+    `engine` ("bsm", "student-t" or a pricing_engines engine) prices every
+    day at once; the ratio needs no spot (prices are homogeneous), but days
+    without a usable QQQ close are skipped as before.
+    """
+    s = _aligned_closes(history.qqq, history.dates)
+    v = _aligned_closes(history.vxn, history.dates) / 100.0 * vol_anchor
+    usable = np.isfinite(s) & np.isfinite(v) & (v > 0)
+    ratios = pricing_engine(engine).wing_ratios(v[usable], skew, t_years, WING_LEVELS)
+    days = [idx.date() for idx in history.dates[usable]]
+    columns = [ratios[pct].tolist() for pct in WING_LEVELS]
+    return [(day, pct, column[i]) for i, day in enumerate(days)
+            for pct, column in zip(WING_LEVELS, columns)]
+
+def bsm_model_today_ratio(quote, engine="bsm"):
     """model implied wing/body ratio at TODAY's real spot
 
     This is the only place today's vol level enters the chart:
 
     a display point comparable to today's real quote, kept out of the percentile lines.
+    Priced with the same `engine` as the history.
     """
-    return _bsm_wing_ratios(quote["spot"], quote["atm_iv"], quote["skew_pts"], quote["dte"] / 365.0)
+    ratios = pricing_engine(engine).wing_ratios(
+        [quote["atm_iv"]], quote["skew_pts"], quote["dte"] / 365.0, WING_LEVELS)
+    return {pct: float(ratio[0]) for pct, ratio in ratios.items()}
 
-def historical_ratios(quotes, years=10):
+def historical_ratios(quotes, years=10, history=None, engine="bsm"):
     """Wing/body ratio history reconstructed from real VXN + QQQ closes, UNANCHORED.
 
     Each day is priced at that day's own VXN level.
@@ -183,8 +172,11 @@ def historical_ratios(quotes, years=10):
 
     The tenor is the REAL option's calendar DTE(quotes[label]["dte"])
     wing/body ratios are tenor-sensitive
+
+    `history` is a pre-fetched PriceHistory; None downloads `years` of it.
+    `engine` picks the pricing model (see reconstruct_ratios).
     """
-    history = download_price_history(years)
+    history = history if history is not None else download_price_history(years)
     logger.info(
         "history: %d aligned VXN/QQQ closes (%s .. %s)",
         len(history.dates),
@@ -195,7 +187,8 @@ def historical_ratios(quotes, years=10):
     for label in MATURITIES:
         t_years = quotes[label]["dte"] / 365.0
         # TOFIX: a residual circularity via skew
-        ratios[label] = reconstruct_ratios(history, quotes[label]["skew_pts"], t_years)
+        ratios[label] = reconstruct_ratios(history, quotes[label]["skew_pts"], t_years,
+                                           engine=engine)
         logger.info(
             "label %s: dte=%d days -> t=%.4f y, reconstructed %d points",
             label,
@@ -219,26 +212,33 @@ def wing_series(ratios_by_maturity):
 
 
 
-def plot_tail_cheapness(save_path=None, show=False):
-    quotes = fetch_today_quotes()
+def plot_tail_cheapness(save_path=None, show=False, inputs=None, engine="bsm"):
+    """Draw and save the chart; `inputs` (TailInputs) skips the fetches.
+    `engine` prices the history and the model point ("bsm" or "student-t")."""
+    inputs = inputs if inputs is not None else fetch_tail_inputs()
+    quotes = inputs.quotes
     _log_today_quotes(quotes)
     _validate_today_quotes(quotes)
-    hist = historical_ratios(quotes)
+    hist = historical_ratios(quotes, history=inputs.history, engine=engine)
     series = wing_series(hist)
-    model_today = bsm_model_today_ratio(quotes[DEFAULT_MATURITY])
+    model_today = bsm_model_today_ratio(quotes[DEFAULT_MATURITY], engine)
+    model = pricing_engine(engine).label
     logger.info("series points per wing: %s", {pct: len(series[pct]) for pct in WING_LEVELS})
     today = date.today()
     save_path = save_path or _default_save_path(today)
 
     today_ratio = _real_today_ratio(quotes)
 
+    sample = decision_sample(series)
+    rank = sample.rank_share(today_ratio)
+
     fig, ax = plt.subplots(figsize=(13, 7))
     _plot_wing_series(ax, series)
-    q25 = _plot_decision_annotations(ax, series)
-    _plot_today_marker(ax, today_ratio, model_today)
+    q25 = _plot_decision_annotations(ax, series, sample)
+    _plot_today_marker(ax, today_ratio, model_today, model)
     verdict = _verdict(today_ratio, q25)
-    _log_decision(verdict, today_ratio, q25, model_today)
-    _decorate_axes(ax, quotes, today, today_ratio, q25, verdict)
+    _log_decision(verdict, today_ratio, q25, model_today, rank)
+    _decorate_axes(ax, quotes, today, today_ratio, q25, verdict, rank, model)
 
     _save_figure(fig, save_path)
     if show:
@@ -310,20 +310,22 @@ def _default_save_path(today):
     return f"figures/tail_cheapness_{today.strftime('%b').lower()}{today.day}_{today.year}.png"
 
 
-def _log_decision(verdict, today_ratio, q25, model_today):
+def _log_decision(verdict, today_ratio, q25, model_today, rank=float("nan")):
     logger.info(
-        "decision wing: q25 buy line=%.4f, model-implied today=%.4f, verdict=%s (today %.4f vs q25 %.4f)",
+        "decision wing: q25 buy line=%.4f, model-implied today=%.4f, verdict=%s (today %.4f vs q25 %.4f, %s)",
         q25,
         model_today[DECISION_LEVEL],
         verdict,
         today_ratio,
         q25,
+        _rank_display(rank),
     )
 
 
 def _save_figure(fig, save_path):
     fig.tight_layout()
-    fig.savefig(save_path, dpi=150)
+    with span("savefig", "render", path=save_path):
+        fig.savefig(save_path, dpi=150)
     logger.info("saved %s", save_path)
     print(f"saved {save_path}")
 
@@ -342,16 +344,20 @@ def _plot_wing_series(ax, series):
     )
 
 
-def _plot_decision_annotations(ax, series):
+def decision_sample(series):
+    """The decision wing's ratio history as a SortedSample: sorted once, then
+    every percentile and today's rank is a lookup (and a new date an insert)."""
+    return SortedSample(r for d, r in series[DECISION_LEVEL])
+
+
+def _plot_decision_annotations(ax, series, sample=None):
     """Buy/expensive bands and zone labels for the decision wing. Returns the 25th-pct buy line."""
     sr = series[DECISION_LEVEL]
     if not sr:
         return float("nan")
+    sample = sample if sample is not None else decision_sample(series)
     dates = [d for d, r in sr]
-    vals = [r for d, r in sr if math.isfinite(r)]
-    q25 = np.percentile(vals, 25)
-    q50 = np.percentile(vals, 50)
-    q75 = np.percentile(vals, 75)
+    q25, q50, q75 = (sample.percentile(q) for q in (25, 50, 75))
     for text, y, color, dash in [
         (f"red line: 25th pct of 10y ratio, {int(DECISION_LEVEL*100)}% OTM wing -> buy line ({q25:.4f})", q25, "#d62728", "--"),
         (f"blue line: 50th pct (median) of 10y ratio, {int(DECISION_LEVEL*100)}% OTM wing ({q50:.4f})", q50, "#1f77b4", "-."),
@@ -367,7 +373,7 @@ def _plot_decision_annotations(ax, series):
     return q25
 
 
-def _plot_today_marker(ax, today_ratio, model_today):
+def _plot_today_marker(ax, today_ratio, model_today, model="BSM"):
     m_ratio = model_today[DECISION_LEVEL]
     ax.scatter(
         [date.today()],
@@ -377,7 +383,7 @@ def _plot_today_marker(ax, today_ratio, model_today):
         facecolors="none",
         edgecolors="gray",
         zorder=4,
-        label=f"model-implied today (BSM, real spot + ATM IV + skew): {m_ratio:.4f}",
+        label=f"model-implied today ({model}, real spot + ATM IV + skew): {m_ratio:.4f}",
     )
     ax.scatter(
         [date.today()],
@@ -395,13 +401,18 @@ def _verdict(today_ratio, q25):
     return "CHEAP - buy the tail" if today_ratio < q25 else "NOT cheap - wait, let the strangles fund"
 
 
-def _decorate_axes(ax, quotes, today, today_ratio, q25, verdict):
+def _rank_display(rank):
+    """Today's percentile rank in the ratio history, e.g. 'pct rank 12%'."""
+    return "pct rank n/a" if rank != rank else f"pct rank {rank:.0%}"
+
+
+def _decorate_axes(ax, quotes, today, today_ratio, q25, verdict, rank=float("nan"), model="BSM"):
     ax.set_title(
         f"QQQ tail cheapness - {today.strftime('%b')} {today.day} {today.year} (spot ${quotes['3m']['spot']:.2f})\n"
-        f"{int(DECISION_LEVEL*100)}% OTM put / ATM straddle today = {today_ratio:.4f} vs 25th pct buy line {q25:.4f} -> {verdict}"
+        f"{int(DECISION_LEVEL*100)}% OTM put / ATM straddle today = {today_ratio:.4f} vs 25th pct buy line {q25:.4f} -> {verdict} ({_rank_display(rank)})"
     )
     ax.set_ylabel("far-OTM put price / ATM straddle price (log scale)")
-    ax.set_xlabel("10 years of history (reconstructed: real VXN + QQQ closes, BSM, each day at its own VXN vol level")
+    ax.set_xlabel(f"10 years of history (reconstructed: real VXN + QQQ closes, {model}, each day at its own VXN vol level")
     ax.set_yscale("log")
     ax.set_yticks([0.01, 0.02, 0.05, 0.1, 0.2])
     ax.get_yaxis().set_major_formatter(matplotlib.ticker.FormatStrFormatter("%.2f"))
@@ -410,6 +421,12 @@ def _decorate_axes(ax, quotes, today, today_ratio, q25, verdict):
 
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--engine", default="bsm", choices=list(ENGINES),
+                        help="pricing model for the history and the model point")
+    args = parser.parse_args()
     logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
-    path, today_ratio, q25 = plot_tail_cheapness()
+    path, today_ratio, q25 = plot_tail_cheapness(engine=args.engine)
     plt.show()
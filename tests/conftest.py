@@ -0,0 +1,26 @@
+"""Shared test data: synthetic fat-tailed closes for the monitor tests."""
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def _t3_closes(n_tickers=1, n_days=500, seed=0, start="2024-01-01", columns=None, gaps=None):
+    """Closes from 100 with Student-t(3) daily log returns at a 1% scale.
+
+    `columns` names the tickers (default T0, T1, ...); `gaps` maps a column
+    position to the rows set to NaN (a later listing, a suspension).
+    """
+    rng = np.random.default_rng(seed)
+    returns = rng.standard_t(3, size=(n_days - 1, n_tickers)) * 0.01
+    prices = 100.0 * np.exp(np.vstack([np.zeros(n_tickers), np.cumsum(returns, axis=0)]))
+    closes = pd.DataFrame(prices, index=pd.bdate_range(start, periods=n_days),
+                          columns=columns or [f"T{i}" for i in range(n_tickers)])
+    for column, rows in (gaps or {}).items():
+        closes.iloc[rows, column] = np.nan
+    return closes
+
+
+@pytest.fixture
+def t3_closes():
+    """The synthetic closes factory; call it with the shape the test needs."""
+    return _t3_closes
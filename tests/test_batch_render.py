@@ -0,0 +1,122 @@
+"""
+Test the headless batch renderer: every instrument x period (and the
+portfolio panel) lands on disk as PNG/SVG with an index, the layout figure is
+reused between renders, and a failing ticker becomes an index entry instead
+of killing the pack. Network I/O is faked through the injectable repository.
+"""
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+from fentu.explatoryservices import batch_render
+from fentu.explatoryservices.volcalculator import ReturnsRepository
+
+
+def _open_high_low_close(n=700, seed=0):
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range("2022-01-03", periods=n)
+    close = 100 * np.exp(np.cumsum(rng.standard_t(3, n) * 0.01))
+    return pd.DataFrame({"Open": close, "High": close * 1.01,
+                         "Low": close * 0.99, "Close": close}, index=index)
+
+
+class FakeRepository(ReturnsRepository):
+    """Canned frames for every ticker; BROKEN raises like a dead feed.
+    Module-level so process-pool workers can unpickle it."""
+
+    def __init__(self):
+        super().__init__()
+        self.fetched = []
+
+    def _raw_open_high_low_close(self, instrument):
+        self.fetched.append(instrument)
+        if instrument == "BROKEN":
+            raise RuntimeError("possibly delisted; no price data found")
+        return _open_high_low_close()
+
+
+@pytest.fixture(autouse=True)
+def _close_figures():
+    yield
+    plt.close("all")
+
+
+def _charts(index_path):
+    with open(index_path, encoding="utf-8") as fh:
+        return json.load(fh)["charts"]
+
+
+def test_every_instrument_and_period_is_written_and_indexed(tmp_path):
+    index = batch_render.render_batch(
+        ["QQQ", "TLT"], out_dir=str(tmp_path), periods=("daily", "yearly"),
+        formats=("png", "svg"), jobs=1, repository=FakeRepository())
+
+    charts = _charts(index)
+    assert [(c["instrument"], c["period"]) for c in charts] == [
+        ("QQQ", "daily"), ("QQQ", "yearly"), ("TLT", "daily"), ("TLT", "yearly")]
+    for chart in charts:
+        assert [os.path.splitext(f)[1] for f in chart["files"]] == [".png", ".svg"]
+        assert all(os.path.getsize(f) > 0 for f in chart["files"])
+
+
+def test_layout_figure_is_reused_between_renders(tmp_path):
+    batch_render.render_batch(
+        ["QQQ", "TLT"], out_dir=str(tmp_path), periods=("daily", "weekly"),
+        jobs=1, repository=FakeRepository())
+    assert len(plt.get_fignums()) == 1
+
+
+def test_portfolio_panels_render_per_period(tmp_path):
+    index = batch_render.render_batch(
+        [], out_dir=str(tmp_path), periods=("daily", "monthly"),
+        portfolio=True, jobs=1, repository=FakeRepository())
+
+    charts = _charts(index)
+    assert [(c["kind"], c["period"]) for c in charts] == [
+        ("portfolio", "daily"), ("portfolio", "monthly")]
+    assert all("files" in c for c in charts)
+    assert len(plt.get_fignums()) == 1
+
+
+def test_failing_ticker_is_an_index_entry_not_a_crash(tmp_path):
+    index = batch_render.render_batch(
+        ["BROKEN", "QQQ"], out_dir=str(tmp_path), periods=("daily",),
+        jobs=1, repository=FakeRepository())
+
+    broken, good = _charts(index)
+    assert "possibly delisted" in broken["error"] and "files" not in broken
+    assert os.path.exists(good["files"][0])
+
+
+def test_memo_repository_fetches_each_instrument_once(monkeypatch):
+    calls = []
+    monkeypatch.setattr(ReturnsRepository, "_raw_open_high_low_close",
+                        lambda self, instrument: calls.append(instrument)
+                        or _open_high_low_close())
+    repo = batch_render.MemoRepository()
+    for period in (1, 5, 21, 252):
+        repo.get_returns("QQQ", period)
+    repo.get_vix_prices()
+    repo.get_vix_prices()
+    assert calls == ["QQQ", "^VIX"]
+
+
+def test_process_pool_renders_the_same_pack(tmp_path):
+    index = batch_render.render_batch(
+        ["QQQ", "TLT"], out_dir=str(tmp_path), periods=("daily",),
+        jobs=2, repository=FakeRepository())
+    charts = _charts(index)
+    assert [c["instrument"] for c in charts] == ["QQQ", "TLT"]
+    assert all(os.path.exists(c["files"][0]) for c in charts)
+
+
+def test_chart_stem_is_filesystem_safe():
+    assert batch_render.chart_stem("^VIX", "daily") == "_VIX_daily"
+    assert batch_render.chart_stem("BRK-B", "yearly") == "BRK-B_yearly"
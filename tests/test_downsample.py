@@ -0,0 +1,81 @@
+"""
+Test the point-budget downsampling behind the long line panels: a fixed
+number of points whatever the history length, real prints only, and every
+spike kept exactly (the 2008/2020 VIX peaks must survive).
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+from fentu.explatoryservices.downsample import downsample_indices, downsample_series
+from fentu.explatoryservices.volcalculator import VolatilityDashboard
+
+
+def _vix_like(n=9000, seed=0):
+    """Mean-reverting series with two isolated one-day spikes."""
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range("1990-01-02", periods=n)
+    values = 18 + np.cumsum(rng.normal(0, 0.3, n)) * 0.05
+    values[4700] = 80.86  # "2008"
+    values[7600] = 82.69  # "2020"
+    values[100] = 9.14   # the all-time low
+    return pd.Series(values, index=index)
+
+
+@pytest.mark.parametrize("method", ["minmax", "lttb"])
+def test_output_fits_the_budget_and_keeps_the_ends(method):
+    series = _vix_like()
+    kept = downsample_series(series, budget=500, method=method)
+    assert len(kept) <= 500 + 4  # budget + ends + global extremes
+    assert kept.index[0] == series.index[0]
+    assert kept.index[-1] == series.index[-1]
+    assert kept.index.is_monotonic_increasing
+
+
+@pytest.mark.parametrize("method", ["minmax", "lttb"])
+def test_spikes_survive_exactly(method):
+    series = _vix_like()
+    kept = downsample_series(series, budget=300, method=method)
+    for day in (100, 4700, 7600):
+        assert kept.loc[series.index[day]] == series.iloc[day]
+
+
+def test_minmax_keeps_every_bucket_envelope():
+    series = _vix_like(n=10_000)
+    kept = downsample_series(series, budget=200)
+    buckets = np.array_split(series.values, 100)
+    kept_values = set(kept.values)
+    assert all(b.max() in kept_values and b.min() in kept_values for b in buckets)
+
+
+def test_short_series_are_untouched():
+    series = _vix_like().iloc[:50]
+    assert downsample_indices(series.index.values, series.values, budget=100).tolist() \
+        == list(range(50))
+
+
+def test_nan_gaps_do_not_break_the_reducer():
+    series = _vix_like()
+    series.iloc[2000:2100] = np.nan
+    kept = downsample_series(series, budget=400)
+    assert kept.max() == series.max()
+
+
+def test_unknown_method_is_rejected():
+    series = _vix_like()
+    with pytest.raises(ValueError):
+        downsample_series(series, budget=100, method="median")
+
+
+def test_vix_panel_draws_a_fixed_budget_with_the_peaks():
+    series = _vix_like()
+    fig, ax = plt.subplots()
+    VolatilityDashboard(point_budget=400).plot_vix_panel(ax, pd.DataFrame({"Close": series}))
+    line = ax.get_lines()[0]
+    assert len(line.get_ydata()) <= 404
+    assert max(line.get_ydata()) == pytest.approx(82.69)
+    plt.close(fig)
@@ -8,10 +8,12 @@ Paul Tudor Jones's moving-volume lesson).
 """
 from datetime import date
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from fentu.explatoryservices.high_low_levels import (
+    RangeExtremaIndex,
     _report_from_open_high_low_close,
     levels_view,
     main,
@@ -383,3 +385,75 @@ class TestLevelsReport:
             _report_from_open_high_low_close(empty, "USO", self.TODAY)
             == "USO unavailable"
         )
+
+
+class TestRangeExtremaIndex:
+    """The sparse-table index answers any window like the masked-frame scan it
+    replaces: same levels, same FIRST print date on ties, O(1) per query."""
+
+    @staticmethod
+    def _random_history(n=300, seed=11):
+        rng = np.random.default_rng(seed)
+        idx = pd.bdate_range("2025-01-02", periods=n)
+        close = np.round(80 + np.cumsum(rng.normal(0, 1, n)), 0)  # many ties
+        return pd.DataFrame({"High": close + 1, "Low": close - 1, "Close": close}, index=idx)
+
+    @staticmethod
+    def _masked_scan(frame, start, end):
+        window = frame[(frame.index >= pd.Timestamp(start)) & (frame.index <= pd.Timestamp(end))]
+        return {
+            "high": float(window["High"].max()),
+            "high_date": window["High"].idxmax().date(),
+            "low": float(window["Low"].min()),
+            "low_date": window["Low"].idxmin().date(),
+        }
+
+    def test_matches_the_masked_scan_on_every_window(self):
+        frame = self._random_history()
+        index = RangeExtremaIndex(frame)
+        rng = np.random.default_rng(0)
+        for _ in range(300):
+            i, j = sorted(rng.integers(0, len(frame), 2))
+            start, end = frame.index[i].date(), frame.index[j].date()
+            assert index.window_high_low(start, end) == self._masked_scan(frame, start, end)
+
+    def test_nan_prints_are_skipped(self):
+        frame = _open_high_low_close([
+            ("2026-06-01", 75.0, 70.0, 72.0),
+            ("2026-06-02", float("nan"), float("nan"), 72.0),
+            ("2026-06-03", 74.0, 71.0, 72.0),
+        ])
+        stats = RangeExtremaIndex(frame).window_high_low(date(2026, 6, 1), date(2026, 6, 3))
+        assert stats["high"] == 75.0 and stats["low"] == 70.0
+
+    def test_multi_lookback_scan_in_one_call(self):
+        frame = self._random_history()
+        end = frame.index[-1]
+        starts = [end - pd.DateOffset(months=m) for m in range(1, 25)]
+        scan = RangeExtremaIndex(frame).windows_high_low(starts, end)
+
+        assert len(scan) == 24
+        for row in scan.itertuples():
+            expected = self._masked_scan(frame, row.start, end)
+            assert (row.high, row.high_date.date()) == (expected["high"], expected["high_date"])
+            assert (row.low, row.low_date.date()) == (expected["low"], expected["low_date"])
+
+    def test_window_before_history_is_empty(self):
+        frame = self._random_history(n=10)
+        index = RangeExtremaIndex(frame)
+        assert index.window_high_low(date(2020, 1, 1), date(2020, 2, 1)) is None
+        scan = index.windows_high_low([pd.Timestamp("2020-01-01")], pd.Timestamp("2020-02-01"))
+        assert scan["high"].isna().all()
+
+    def test_window_of_nan_prints_is_empty(self):
+        frame = _open_high_low_close([
+            ("2026-06-01", 75.0, 70.0, 72.0),
+            ("2026-06-02", float("nan"), float("nan"), 72.0),
+            ("2026-06-03", float("nan"), float("nan"), 72.0),
+        ])
+        start, end = date(2026, 6, 2), date(2026, 6, 3)
+        assert RangeExtremaIndex(frame).window_high_low(start, end) is None
+        assert window_high_low(frame, start, end) is None
+        scan = RangeExtremaIndex(frame).windows_high_low([pd.Timestamp(start)], pd.Timestamp(end))
+        assert scan["high"].isna().all() and scan["low"].isna().all()
+        assert scan["high_date"].isna().all()
@@ -0,0 +1,150 @@
+"""Tests for the live CHUTE monitor (fentu.explatoryservices.live_chute)."""
+import tracemalloc
+from datetime import date, datetime, timedelta
+
+import pandas as pd
+import pytest
+
+from fentu.explatoryservices import live_chute as lc
+
+SESSION = date(2026, 10, 19)
+
+
+def _daily_close(mad=0.50, start=100.0, n=61, partial=None):
+    """Closes whose n-1 returns alternate +/-`mad` % (MAD == `mad`), ending
+    the day before SESSION; `partial` appends the session's own row."""
+    closes = [start]
+    for i in range(n - 1):
+        closes.append(closes[-1] * (1 + (mad if i % 2 == 0 else -mad) / 100))
+    index = pd.bdate_range(end=SESSION - timedelta(days=3), periods=n)
+    close = pd.Series(closes, index=index)
+    if partial is not None:
+        close[pd.Timestamp(SESSION)] = partial
+    return close
+
+
+def _minute(m):
+    return datetime(2026, 10, 19, 9, 30) + timedelta(minutes=m)
+
+
+def _tracker(prior=100.0, mad=0.50):
+    return lc.ChuteTracker("QQQ", prior, mad)
+
+
+class TestCalibration:
+    def test_prior_close_and_mad_come_from_completed_sessions_only(self):
+        close = _daily_close(partial=50.0)  # a -50% partial row must not leak
+        tracker = lc.calibrate("QQQ", close, SESSION)
+        assert tracker.prior_close == pytest.approx(close.iloc[-2])
+        assert tracker.mad == pytest.approx(0.50)
+
+    def test_too_short_a_history_is_not_calibrated(self):
+        assert lc.calibrate("QQQ", _daily_close(n=2).iloc[:1], SESSION) is None
+
+    def test_chute_price_is_threshold_mads_below_the_prior_close(self):
+        assert _tracker().chute_price == pytest.approx(100.0 * (1 - 2.5 * 0.005))
+
+
+class TestChuteTracker:
+    def test_signed_mad_multiple_per_tick(self):
+        tracker = _tracker()
+        tracker.update(100.40, _minute(0))
+        assert tracker.mad_multiple == pytest.approx(0.8)
+        tracker.update(99.0, _minute(1))
+        assert tracker.mad_multiple == pytest.approx(-2.0)
+
+    def test_alert_on_the_crossing_tick_only_then_re_arms(self):
+        tracker = _tracker()
+        prices = [99.0, 98.70, 98.50, 99.5, 98.6]  # -2.0, -2.6, -3.0, -1.0, -2.8 MAD
+        alerts = [tracker.update(p, _minute(i)) for i, p in enumerate(prices)]
+        fired = [i for i, alert in enumerate(alerts) if alert is not None]
+        assert fired == [1, 4]
+        assert alerts[1].mad_multiple == pytest.approx(-2.6)
+        assert alerts[1].pct == pytest.approx(-1.30)
+
+    def test_up_moves_never_alert(self):
+        tracker = _tracker()
+        assert tracker.update(110.0, _minute(0)) is None
+
+    def test_alert_reads_like_the_brief(self):
+        alert = _tracker().update(98.70, _minute(61))
+        assert str(alert) == "10:31 QQQ 98.70 (-1.30% vs prior close, -2.6 MAD over 60d — CHUTE)"
+
+
+class FakeRepository:
+    def __init__(self, bars, daily=None):
+        self.bars, self.daily = bars, daily or {}
+        self.fetched = []
+
+    def try_fetch_intraday_bars(self, ticker, interval):
+        self.fetched.append(ticker)
+        return self.bars.get(ticker)
+
+    def try_fetch_open_high_low_close(self, ticker):
+        close = self.daily.get(ticker)
+        return None if close is None else pd.DataFrame({"Close": close})
+
+
+def _bars(prices, first_minute=0):
+    index = [_minute(first_minute + i) for i in range(len(prices))]
+    return pd.DataFrame({"Close": prices}, index=pd.DatetimeIndex(index))
+
+
+class TestLiveChuteMonitor:
+    def test_calibrated_skips_tickers_without_history(self):
+        repository = FakeRepository({}, daily={"QQQ": _daily_close()})
+        monitor, skipped = lc.LiveChuteMonitor.calibrated(["QQQ", "USO"], repository, SESSION)
+        assert list(monitor.trackers) == ["QQQ"]
+        assert skipped == ["USO"]
+
+    def test_poll_scores_only_bars_not_yet_seen(self):
+        monitor = lc.LiveChuteMonitor([_tracker()])
+        repository = FakeRepository({"QQQ": _bars([99.5, 98.6])})
+        assert [a.at for a in monitor.poll(repository)] == [_minute(1)]
+
+        # Next poll: the still-forming minute 1 and a new minute 2 arrive.
+        repository.bars["QQQ"] = _bars([99.5, 98.6, 98.0])
+        assert monitor.poll(repository) == []  # still in the chute: no repeat
+        assert monitor.trackers["QQQ"].last_seen == _minute(2)
+
+    def test_a_failed_poll_leaves_the_tracker_untouched(self):
+        monitor = lc.LiveChuteMonitor([_tracker()])
+        assert monitor.poll(FakeRepository({"QQQ": None})) == []
+        assert monitor.trackers["QQQ"].last_seen is None
+
+    def test_replay_streams_a_csv(self, tmp_path):
+        path = tmp_path / "bars.csv"
+        path.write_text("timestamp,ticker,close\n"
+                        "2026-10-19T09:30:00,QQQ,99.0\n"
+                        "2026-10-19T09:31:00,USO,50.0\n"
+                        "2026-10-19T09:32:00,QQQ,98.5\n")
+        monitor = lc.LiveChuteMonitor([_tracker()])
+        alerts = list(monitor.replay(lc.read_ticks(path)))
+        assert [(a.ticker, a.at) for a in alerts] == [("QQQ", _minute(2))]
+
+    def test_memory_is_constant_over_a_long_session(self):
+        monitor = lc.LiveChuteMonitor([_tracker()])
+
+        def ticks(first, n):
+            for i in range(first, first + n):
+                yield _minute(i), "QQQ", 98.0 if i % 7 == 0 else 100.0
+
+        tracemalloc.start()
+        for _ in monitor.replay(ticks(0, 2_000)):
+            pass
+        baseline = tracemalloc.get_traced_memory()[0]
+        for _ in monitor.replay(ticks(2_000, 50_000)):
+            pass
+        grown = tracemalloc.get_traced_memory()[0] - baseline
+        tracemalloc.stop()
+        assert grown < 10_000
+
+    def test_run_emits_alerts_and_sleeps_between_polls(self):
+        monitor = lc.LiveChuteMonitor([_tracker()])
+        repository = FakeRepository({"QQQ": _bars([98.0])})
+        emitted, slept = [], []
+        lc.run(monitor, repository, every=30, polls=2, sleep=slept.append,
+               emit=emitted.append)
+        assert len(emitted) == 1 and "CHUTE" in emitted[0]
+        assert slept == [30]
+        assert repository.fetched == ["QQQ", "QQQ"]
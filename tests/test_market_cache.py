@@ -0,0 +1,164 @@
+"""Tests for the local market cache (fentu.explatoryservices.market_cache)."""
+from datetime import datetime, timezone
+
+import pandas as pd
+import pytest
+
+from fentu.explatoryservices import market_cache as mc
+from fentu.explatoryservices.volcalculator import ReturnsRepository
+
+
+def utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+class Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _frame():
+    index = pd.bdate_range("2026-01-01", periods=5)
+    return pd.DataFrame({"Open": 1.0, "High": 2.0, "Low": 0.5, "Close": 1.5,
+                         "Volume": 10}, index=index)
+
+
+@pytest.mark.parametrize("now, expected", [
+    (utc(2026, 10, 19, 21, 0), utc(2026, 10, 19, 20, 0)),   # Mon after the EDT close
+    (utc(2026, 10, 19, 19, 59), utc(2026, 10, 16, 20, 0)),  # Mon before it -> Fri
+    (utc(2026, 10, 18, 12, 0), utc(2026, 10, 16, 20, 0)),   # Sunday -> Fri
+    (utc(2026, 1, 14, 22, 0), utc(2026, 1, 14, 21, 0)),     # EST close is 21:00 UTC
+])
+def test_last_us_close(now, expected):
+    assert mc.last_close("US", now) == expected
+
+
+@pytest.mark.parametrize("now, expected", [
+    # Mon 2026-03-09 after the spring-forward: Friday still closed at 21:00 UTC.
+    (utc(2026, 3, 9, 14, 0), utc(2026, 3, 6, 21, 0)),
+    (utc(2026, 3, 9, 20, 30), utc(2026, 3, 9, 20, 0)),
+    # Mon 2026-11-02 after the fall-back: Friday closed at 20:00 UTC.
+    (utc(2026, 11, 2, 14, 0), utc(2026, 10, 30, 20, 0)),
+    (utc(2026, 11, 2, 21, 30), utc(2026, 11, 2, 21, 0)),
+])
+def test_last_us_close_takes_dst_from_the_close_date(now, expected):
+    assert mc.last_close("US", now) == expected
+
+
+def test_next_us_close_across_the_spring_forward():
+    assert mc.next_close("US", utc(2026, 3, 6, 22, 0)) == utc(2026, 3, 9, 20, 0)
+
+
+@pytest.mark.parametrize("now, market, expected", [
+    (utc(2026, 10, 19, 13, 29), "US", False),  # 09:29 EDT
+    (utc(2026, 10, 19, 13, 30), "US", True),
+    (utc(2026, 10, 19, 19, 59), "US", True),
+    (utc(2026, 10, 19, 20, 0), "US", False),   # the close
+    (utc(2026, 10, 17, 15, 0), "US", False),   # Saturday
+    (utc(2026, 10, 19, 2, 0), "HK", True),     # 10:00 HKT
+    (utc(2026, 10, 19, 9, 0), "HK", False),
+])
+def test_is_open(now, market, expected):
+    assert mc.is_open(market, now) is expected
+
+
+def test_hk_close_is_0800_utc_and_next_close_skips_the_weekend():
+    assert mc.last_close("HK", utc(2026, 10, 19, 9, 0)) == utc(2026, 10, 19, 8, 0)
+    assert mc.next_close("HK", utc(2026, 10, 16, 9, 0)) == utc(2026, 10, 19, 8, 0)
+
+
+def test_market_of():
+    assert mc.market_of("^HSI") == "HK"
+    assert mc.market_of("0700.HK") == "HK"
+    assert mc.market_of("QQQ") == "US"
+    assert mc.market_of("^N225") == "HK"
+    assert mc.market_of("EURUSD=X") == mc.LIVE
+    assert mc.latest_market(["HK", "US"]) == "US"
+
+
+def test_live_markets_are_never_cached(tmp_path):
+    cache = mc.MarketCache(str(tmp_path), now=Clock(utc(2026, 10, 19, 21, 0)))
+    cache.get_or_fetch(("ohlc", "EURUSD=X"), mc.LIVE, _frame)
+    assert cache.fetched_at(("ohlc", "EURUSD=X")) is None
+
+
+def test_entry_is_fresh_until_the_next_close(tmp_path):
+    clock = Clock(utc(2026, 10, 19, 20, 30))  # just after the US close
+    cache = mc.MarketCache(str(tmp_path), now=clock)
+    cache.put(("ohlc", "QQQ"), _frame())
+
+    clock.now = utc(2026, 10, 20, 13, 0)  # next morning
+    assert cache.get(("ohlc", "QQQ"), "US") is not None
+    clock.now = utc(2026, 10, 20, 20, 1)  # after the next close
+    assert cache.get(("ohlc", "QQQ"), "US") is None
+
+
+def test_nothing_is_served_while_the_market_is_open(tmp_path):
+    clock = Clock(utc(2026, 10, 19, 20, 30))
+    cache = mc.MarketCache(str(tmp_path), now=clock)
+    cache.put(("ohlc", "QQQ"), _frame())
+    clock.now = utc(2026, 10, 20, 14, 0)  # 10:00 EDT, next day's session
+    assert cache.get(("ohlc", "QQQ"), "US") is None
+    assert not cache.is_fresh(("ohlc", "QQQ"), "US")
+
+    cache.put(("ohlc", "QQQ"), _frame())  # an intraday fetch
+    clock.now = utc(2026, 10, 20, 15, 0)
+    assert cache.get(("ohlc", "QQQ"), "US") is None
+    clock.now = utc(2026, 10, 20, 21, 0)  # after the close it is stale
+    assert cache.get(("ohlc", "QQQ"), "US") is None
+
+
+def test_get_or_fetch_serves_warm_entries_without_fetching(tmp_path):
+    cache = mc.MarketCache(str(tmp_path), now=Clock(utc(2026, 10, 19, 21, 0)))
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return _frame()
+
+    cache.get_or_fetch(("ohlc", "USO"), "US", fetch)
+    cache.get_or_fetch(("ohlc", "USO"), "US", fetch)
+    assert len(calls) == 1
+
+
+def test_empty_or_failed_fetches_are_not_stored(tmp_path):
+    cache = mc.MarketCache(str(tmp_path), now=Clock(utc(2026, 10, 19, 21, 0)))
+    assert cache.get_or_fetch(("ohlc", "X"), "US", pd.DataFrame).empty
+    assert cache.fetched_at(("ohlc", "X")) is None
+    with pytest.raises(ConnectionError):
+        cache.get_or_fetch(("ohlc", "X"), "US", lambda: (_ for _ in ()).throw(ConnectionError()))
+
+
+def test_from_env(monkeypatch, tmp_path):
+    monkeypatch.setenv(mc.ENV_VAR, "off")
+    assert mc.MarketCache.from_env() is None
+    monkeypatch.setenv(mc.ENV_VAR, str(tmp_path))
+    assert mc.MarketCache.from_env().root == str(tmp_path)
+
+
+def test_repository_serves_projected_frames_from_the_cache(tmp_path):
+    cache = mc.MarketCache(str(tmp_path), now=Clock(utc(2026, 10, 19, 21, 0)))
+    cache.put(("ohlc", "USO"), _frame())
+    repo = ReturnsRepository(columns=("Close",), cache=cache)
+    repo.fetch_open_high_low_close = lambda instrument: pytest.fail("network touched")
+
+    out = repo._raw_open_high_low_close("USO")
+    assert list(out.columns) == ["Close"]
+    assert len(repo.get_prices("USO")) == 5
+
+
+def test_repository_fills_a_cold_cache(tmp_path):
+    cache = mc.MarketCache(str(tmp_path))
+    repo = ReturnsRepository(cache=cache)
+    repo.fetch_open_high_low_close = lambda instrument: _frame()
+
+    repo.try_fetch_open_high_low_close("USO")
+    assert cache.fetched_at(("ohlc", "USO")) is not None
+
+
+def test_cached_is_a_plain_call_without_a_cache():
+    fetch = lambda: 42  # noqa: E731
+    assert mc.cached(None, ("k",), "US", fetch) is fetch
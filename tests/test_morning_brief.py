@@ -1,12 +1,15 @@
 """Morning brief — one-line overnight HK summary for a US-east based trader.
 """
+import time
+
 import pandas as pd
 import numpy as np
 import pytest
 from unittest.mock import MagicMock
 
+from fentu.explatoryservices import morning_brief as mb
 from fentu.explatoryservices.volcalculator import ReturnsRepository
-from fentu.explatoryservices.morning_brief import morning_brief
+from fentu.explatoryservices.morning_brief import morning_brief, overnight_brief
 
 
 HSI_TICKER = "^HSI"
@@ -184,4 +187,71 @@ class TestMorningBriefMadChute:
         # own denominator. (If it had, the multiple would be ~-19.7.)
         assert brief == (
             f"HSI {last:,.0f} (-10.00% o/n, -20.0 MAD over 60d — CHUTE)"
-        )
\ No newline at end of file
+        )
+
+
+class _SlowRepository:
+    """Close frames by ticker after `delay` seconds; raises for `broken`."""
+
+    def __init__(self, frames, delay=0.0, hang=(), broken=()):
+        self.frames, self.delay = frames, delay
+        self.hang, self.broken = set(hang), set(broken)
+
+    def try_fetch_open_high_low_close(self, ticker):
+        time.sleep(60 if ticker in self.hang else self.delay)
+        if ticker in self.broken:
+            raise ConnectionError(ticker)
+        return self.frames.get(ticker)
+
+
+class TestOvernightBrief:
+    """Several overnight markets, fetched concurrently, one line each."""
+
+    MARKETS = (("HSI", "^HSI", 0), ("Nikkei", "^N225", 0), ("EURUSD", "EURUSD=X", 4))
+
+    def _frames(self):
+        return {
+            "^HSI": _open_high_low_close([22000.0, 23000.0]),
+            "^N225": _open_high_low_close([38000.0, 37620.0]),
+            "EURUSD=X": _open_high_low_close([1.0800, 1.0854]),
+        }
+
+    def test_one_line_per_market_in_order_hsi_line_unchanged(self):
+        brief = overnight_brief(self.MARKETS, _SlowRepository(self._frames()))
+
+        assert brief.splitlines() == [
+            "HSI 23,000 (+4.55% o/n)",
+            "Nikkei 37,620 (-1.00% o/n)",
+            "EURUSD 1.0854 (+0.50% o/n)",
+        ]
+
+    def test_fetches_overlap_so_latency_is_the_slowest_not_the_sum(self):
+        started = time.perf_counter()
+        overnight_brief(self.MARKETS, _SlowRepository(self._frames(), delay=1.0))
+        assert time.perf_counter() - started < 2.5  # sequential would be 3s
+
+    def test_a_hung_market_times_out_without_holding_up_the_rest(self):
+        started = time.perf_counter()
+        brief = overnight_brief(self.MARKETS,
+                                _SlowRepository(self._frames(), hang={"^N225"}),
+                                timeout=0.3)
+        assert time.perf_counter() - started < 10.0  # the hung fetch sleeps 60s
+        assert brief.splitlines()[1] == "Nikkei unavailable"
+        assert brief.splitlines()[0] == "HSI 23,000 (+4.55% o/n)"
+
+    def test_a_failing_market_is_one_unavailable_line(self):
+        brief = overnight_brief(self.MARKETS,
+                                _SlowRepository(self._frames(), broken={"EURUSD=X"}))
+        assert brief.splitlines()[2] == "EURUSD unavailable"
+        assert len(brief.splitlines()) == 3
+
+    def test_main_briefs_the_requested_markets(self, monkeypatch, capsys):
+        frames = self._frames()
+        monkeypatch.setenv("FENTU_MARKET_CACHE", "off")
+        monkeypatch.setattr(mb.ReturnsRepository, "try_fetch_open_high_low_close",
+                            lambda repo, ticker: frames[ticker])
+
+        mb.main(["hsi", "Nikkei"])
+
+        assert capsys.readouterr().out.splitlines() == [
+            "HSI 23,000 (+4.55% o/n)", "Nikkei 37,620 (-1.00% o/n)"]
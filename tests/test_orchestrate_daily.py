@@ -9,16 +9,37 @@ All reused tools are mocked at their seams (no network, no GUI):
   ``_report_from_open_high_low_close`` the text and ``plot_high_low_levels``
   the chart for SIGNAL tickers only.
 - ``tail_plot.plot_tail_cheapness`` runs every day (unless ``--skip-tail``)
-  with ``show=`` matching the ``--no-show`` flag.
+  with ``show=`` matching the ``--no-show`` flag, on the chain quotes and
+  VXN/QQQ history fetched by their own (concurrent) phases.
 """
+import threading
+
 import pandas as pd
-from unittest.mock import patch
+import pytest
+from unittest.mock import ANY, patch
 
+from fentu.orchestrator import orchestrate_daily
 from fentu.orchestrator.orchestrate_daily import (
     format_panel_line,
     main,
     signal_panels,
 )
+from fentu.orchestrator.task_graph import TaskGraph
+
+QUOTES, HISTORY = object(), object()
+
+
+@pytest.fixture(autouse=True)
+def tail_fetches(monkeypatch, tmp_path):
+    """No network: the tail branches return canned inputs and count calls
+    (through an empty per-test market cache)."""
+    monkeypatch.setenv("FENTU_MARKET_CACHE", str(tmp_path / "market_cache"))
+    calls = []
+    monkeypatch.setattr(orchestrate_daily, "fetch_tail_quotes",
+                        lambda: calls.append("quotes") or QUOTES)
+    monkeypatch.setattr(orchestrate_daily, "fetch_tail_history",
+                        lambda: calls.append("history") or HISTORY)
+    return calls
 
 
 def _panel(label="TQQQ", available=True, signal=True, multiple=2.0,
@@ -118,7 +139,9 @@ def test_main_no_show_reports_levels_for_signal_only_and_runs_tail(capsys):
     fake_report.assert_called_once()
     assert fake_report.call_args[0][1] == "TQQQ"
     fake_plot.assert_not_called()
-    fake_tail.assert_called_once_with(show=False)
+    fake_tail.assert_called_once_with(show=False, inputs=ANY)
+    inputs = fake_tail.call_args[1]["inputs"]
+    assert (inputs.quotes, inputs.history) == (QUOTES, HISTORY)
     # 0.03 < q25 0.04 -> cheap, the reused tail_plot verdict.
     assert "CHEAP - buy the tail" in out
     assert "chart: figures/tail_cheapness_aug14_2026.png" in out
@@ -148,7 +171,7 @@ def test_main_shows_panel_level_plot_and_tail_chart(capsys):
     fake_plot.assert_called_once()
     assert fake_plot.call_args[0][1] == "TQQQ"
     assert fake_plot.call_args[1]["show"] is True
-    fake_tail.assert_called_once_with(show=True)
+    fake_tail.assert_called_once_with(show=True, inputs=ANY)
 
 
 def test_main_no_signal_still_runs_tail(capsys):
@@ -174,7 +197,7 @@ def test_main_no_signal_still_runs_tail(capsys):
     assert "NOT cheap - wait, let the strangles fund" in out
 
 
-def test_main_skip_tail_skips_option_chain(capsys):
+def test_main_skip_tail_skips_option_chain(capsys, tail_fetches):
     monitor = _FakeMonitor([_panel(label="USO", signal=False, multiple=0.5)])
     repository = _FakeRepository()
     with patch(
@@ -191,6 +214,7 @@ def test_main_skip_tail_skips_option_chain(capsys):
     out = capsys.readouterr().out
     assert "QQQ tail-to-body ratio" not in out
     fake_tail.assert_not_called()
+    assert tail_fetches == []  # no chain / history fetch either
 
 
 def test_main_survives_unusable_qqq_quotes(capsys):
@@ -214,3 +238,96 @@ def test_main_survives_unusable_qqq_quotes(capsys):
     out = capsys.readouterr().out
     assert "QQQ tail chart skipped" in out
     assert "straddle=0.00" in out
+
+
+def test_failed_tail_fetch_skips_the_chart_not_the_day(capsys, monkeypatch):
+    def no_chain():
+        raise RuntimeError("no QQQ option chain near the 3m tenor today")
+
+    monkeypatch.setattr(orchestrate_daily, "fetch_tail_quotes", no_chain)
+    monitor = _FakeMonitor([_panel(label="USO", signal=False, multiple=0.5)])
+    with patch(
+        "fentu.orchestrator.orchestrate_daily.PortfolioMonitor",
+        return_value=monitor,
+    ), patch(
+        "fentu.orchestrator.orchestrate_daily.ReturnsRepository",
+        return_value=_FakeRepository(),
+    ), patch(
+        "fentu.pricingservices.tail_plot.plot_tail_cheapness",
+    ) as fake_tail:
+        assert main(["--no-show"]) == 0
+
+    out = capsys.readouterr().out
+    assert "QQQ tail chart skipped: no QQQ option chain" in out
+    fake_tail.assert_not_called()
+
+
+def test_independent_branches_overlap_and_reports_keep_their_order(capsys, monkeypatch):
+    """The portfolio scan and both tail fetches wait on one barrier: run in
+    sequence they would deadlock (BrokenBarrierError); run as a graph they
+    meet, and the report still prints portfolio -> levels -> tail."""
+    barrier = threading.Barrier(3, timeout=5)
+
+    class _SlowMonitor(_FakeMonitor):
+        def prepare_panels(self):
+            barrier.wait()
+            return self.panels
+
+    monkeypatch.setattr(orchestrate_daily, "fetch_tail_quotes",
+                        lambda: (barrier.wait(), QUOTES)[1])
+    monkeypatch.setattr(orchestrate_daily, "fetch_tail_history",
+                        lambda: (barrier.wait(), HISTORY)[1])
+    monitor = _SlowMonitor([_panel(label="TQQQ", signal=True)])
+    with patch(
+        "fentu.orchestrator.orchestrate_daily.PortfolioMonitor",
+        return_value=monitor,
+    ), patch(
+        "fentu.orchestrator.orchestrate_daily.ReturnsRepository",
+        return_value=_FakeRepository({"TQQQ": _frame()}),
+    ), patch(
+        "fentu.orchestrator.orchestrate_daily._report_from_open_high_low_close",
+        return_value="TQQQ @ 101.00",
+    ), patch(
+        "fentu.pricingservices.tail_plot.plot_tail_cheapness",
+        return_value=("figures/tail_cheapness_aug14_2026.png", 0.03, 0.04),
+    ):
+        assert main(["--no-show"]) == 0
+
+    out = capsys.readouterr().out
+    order = [out.index(marker) for marker in (
+        "see_change daily portfolio", "TQQQ SIGNAL today", "QQQ tail-to-body ratio",
+        "phase timings:")]
+    assert order == sorted(order)
+    for phase in ("portfolio", "levels", "tail_quotes", "tail_history"):
+        assert f"{phase} " in out.splitlines()[-1]
+
+
+class TestTaskGraph:
+    def test_dependents_receive_their_inputs(self):
+        graph = TaskGraph().add("a", lambda: 2).add("b", lambda a: a * 10, after=["a"])
+        with graph:
+            assert graph.result("b") == 20
+        assert set(graph.timings) == {"a", "b"}
+
+    def test_wall_time_is_the_slowest_branch_not_the_sum(self):
+        # all three must be running at once to pass the barrier; in sequence
+        # the first would time out (BrokenBarrierError), however loaded the box
+        barrier = threading.Barrier(3, timeout=5)
+        graph = TaskGraph()
+        for name in ("x", "y", "z"):
+            graph.add(name, barrier.wait)
+        with graph:
+            assert sorted(graph.result(name) for name in ("x", "y", "z")) == [0, 1, 2]
+
+    def test_failure_propagates_to_dependents(self):
+        def boom():
+            raise RuntimeError("feed down")
+
+        graph = TaskGraph().add("fetch", boom).add("use", lambda x: x, after=["fetch"])
+        with graph:
+            with pytest.raises(RuntimeError, match="feed down"):
+                graph.result("use")
+
+    def test_unknown_dependency_is_rejected(self):
+        with pytest.raises(ValueError):
+            TaskGraph().add("b", lambda a: a, after=["a"])
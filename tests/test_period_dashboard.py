@@ -0,0 +1,107 @@
+"""
+Test the persistent percentage-change dashboard: the figure is built once,
+switching period updates the data artists in place, each period's fits are
+computed once, and a revisit blits over the cached background instead of a
+full redraw. Network I/O is faked through the injectable repository.
+"""
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+from fentu.explatoryservices import period_dashboard
+from fentu.explatoryservices.period_dashboard import PeriodDashboard
+from fentu.explatoryservices.volcalculator import VolatilityFacade
+
+
+class FakeRepository:
+    def __init__(self):
+        self.calls = []
+        rng = np.random.default_rng(3)
+        index = pd.bdate_range("2021-01-04", periods=800)
+        close = 100 * np.exp(np.cumsum(rng.standard_t(3, len(index)) * 0.01))
+        self.prices = pd.Series(close, index=index)
+        self.vix = pd.DataFrame({"Open": 20.0, "Close": 21.0}, index=index)
+
+    def get_returns(self, instrument, period_length):
+        self.calls.append(period_length)
+        return np.log(self.prices / self.prices.shift(period_length))[period_length:]
+
+    def get_vix_open_high_low_close(self):
+        return self.vix
+
+
+@pytest.fixture
+def dashboard():
+    repository = FakeRepository()
+    board = PeriodDashboard(VolatilityFacade("QQQ", repository=repository))
+    board.repository = repository
+    yield board
+    plt.close("all")
+
+
+def test_figure_is_built_once_and_vix_is_static(dashboard):
+    fig, vix_line = dashboard.fig, dashboard.axes[-1].get_lines()[0]
+    for period in ("weekly", "monthly", "yearly", "daily"):
+        dashboard.show_period(period)
+    assert plt.get_fignums() == [fig.number]
+    assert dashboard.axes[-1].get_lines()[0] is vix_line
+
+
+def test_switching_period_updates_data_artists_in_place(dashboard):
+    points = dashboard._qq[0]
+    daily_y = np.array(points.get_ydata())
+    dashboard.show_period("monthly")
+    assert dashboard._qq[0] is points
+    assert not np.array_equal(points.get_ydata(), daily_y)
+    assert dashboard._title.get_text() == "QQQ Monthly Returns"
+    assert sum(bar.get_height() for bar in dashboard._bars) == len(
+        dashboard.view("monthly")["qq"]["y"])
+
+
+def test_each_period_is_fetched_and_fitted_once(dashboard):
+    with patch.object(period_dashboard, "period_view",
+                      wraps=period_dashboard.period_view) as fit:
+        for period in ("weekly", "daily", "weekly", "daily", "weekly"):
+            dashboard.show_period(period)
+    assert fit.call_count == 1  # daily was built in __init__
+    assert dashboard.repository.calls == [1, 5]
+
+
+def test_revisit_blits_instead_of_full_redraw(dashboard):
+    canvas = dashboard.fig.canvas
+    dashboard.show_period("weekly")  # first visit: full draw, caches background
+    with patch.object(canvas, "draw", wraps=canvas.draw) as draw, \
+            patch.object(canvas, "blit") as blit:
+        dashboard.show_period("daily")
+        dashboard.show_period("weekly")
+    assert draw.call_count == 0
+    assert blit.call_count == 2
+
+
+def test_resize_invalidates_the_cached_background(dashboard):
+    dashboard.show_period("weekly")
+    dashboard.fig.set_size_inches(8, 8)
+    canvas = dashboard.fig.canvas
+    with patch.object(canvas, "draw", wraps=canvas.draw) as draw:
+        dashboard.show_period("daily")
+    assert draw.call_count == 1
+
+
+def test_keys_toggle_period(dashboard):
+    event = type("KeyEvent", (), {"key": "y"})()
+    dashboard._on_key(event)
+    assert dashboard.period == "yearly"
+    event.key = "x"
+    dashboard._on_key(event)
+    assert dashboard.period == "yearly"
+
+
+def test_unknown_period_is_rejected(dashboard):
+    with pytest.raises(ValueError):
+        dashboard.show_period("hourly")
@@ -23,11 +23,11 @@ import matplotlib.pyplot as plt
 from fentu.explatoryservices.portfolio_monitor import (
     DEFAULT_PORTFOLIO,
     PortfolioMonitor,
+    bar_color,
     is_signal,
     noise_multiple,
     plot_signal_panel,
     significance,
-    _bar_color,
 )
 
 
@@ -111,9 +111,9 @@ class TestNoiseFilter:
         assert is_signal(-1.1, 1.0)
 
     def test_bar_colors_gray_noise_red_down_green_up(self):
-        assert _bar_color(0.5, 1.0) == "0.75"   # noise -> gray
-        assert _bar_color(2.0, 1.0) == "green"  # up signal
-        assert _bar_color(-2.0, 1.0) == "red"   # down signal
+        assert bar_color(0.5, 1.0) == "0.75"   # noise -> gray
+        assert bar_color(2.0, 1.0) == "green"  # up signal
+        assert bar_color(-2.0, 1.0) == "red"   # down signal
 
 
 class TestPreparePanels:
@@ -0,0 +1,161 @@
+"""Tests for the streaming portfolio monitor (fentu.explatoryservices.portfolio_stream).
+
+The live state must agree with the batch view: seeding on a truncated
+history and streaming the missing closes gives the same panel as
+``PortfolioMonitor.prepare_panels`` on the full history.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+import matplotlib
+matplotlib.use("Agg")  # headless rendering for tests
+import matplotlib.pyplot as plt
+
+from fentu.explatoryservices import portfolio_stream as ps
+from fentu.explatoryservices.portfolio_monitor import DEFAULT_PORTFOLIO, PortfolioMonitor
+from fentu.explatoryservices.volcalculator import DailyVolatility
+
+
+def _prices(t3_closes, n=400):
+    return t3_closes(n_days=n)["T0"].rename("Close")
+
+
+class FakeRepository:
+    def __init__(self, prices_by_ticker, bars=None):
+        self._prices = prices_by_ticker
+        self.bars = bars or {}
+
+    def get_prices(self, ticker):
+        return self._prices[ticker]
+
+    def try_fetch_intraday_bars(self, ticker, interval):
+        return self.bars.get(ticker)
+
+
+def _monitor(prices, period="daily"):
+    repo = FakeRepository({ticker: prices for _label, ticker in DEFAULT_PORTFOLIO})
+    return PortfolioMonitor(period=period, repository=repo)
+
+
+@pytest.mark.parametrize("period", ["daily", "weekly", "monthly", "yearly"])
+def test_streamed_panel_matches_the_batch_panel(period, t3_closes):
+    prices = _prices(t3_closes, n=600)
+    live = ps.LivePortfolioMonitor.seed(_monitor(prices.iloc[:-45], period))
+    for at, price in prices.iloc[-45:].items():
+        for _label, ticker in DEFAULT_PORTFOLIO:
+            live.on_price(ticker, at, price)
+
+    expected = _monitor(prices, period).prepare_panels()[0]
+    got = live.panels()[0]
+    pd.testing.assert_series_equal(got["window"], expected["window"],
+                                   check_names=False, check_freq=False)
+    assert got["usual"] == pytest.approx(expected["usual"])
+    assert got["n_calibration"] == expected["n_calibration"]
+    assert got["last_move"] == pytest.approx(expected["last_move"])
+    assert got["last_date"] == expected["last_date"]
+
+
+def test_intraday_prices_move_only_the_open_bar(t3_closes):
+    prices = _prices(t3_closes)
+    live = ps.LivePortfolioMonitor.seed(_monitor(prices))
+    holding = live.holdings[0]
+    usual, n = holding.calibration.usual, len(holding.calibration)
+    today = prices.index[-1] + pd.offsets.BDay()
+
+    assert live.on_price("TQQQ", today + pd.Timedelta(hours=10), 101.0) == ps.PERIOD
+    assert live.on_price("TQQQ", today + pd.Timedelta(hours=11), 99.0) == ps.BAR
+    assert holding.last_move == pytest.approx(np.log(99.0 / prices.iloc[-1]) * 100)
+    assert len(holding.calibration) == n + 1  # yesterday joined, once
+    assert holding.calibration.usual != usual
+    assert len(holding.window) == 60
+    assert live.on_price("TQQQ", prices.index[-2], 50.0) is None  # stale
+
+
+def test_calibration_accumulator_grows_and_matches_mad():
+    moves = list(np.linspace(-2, 2, 20))
+    accumulator = ps.CalibrationAccumulator(moves, DailyVolatility())
+    for move in [5.0] * 30:
+        accumulator.add(move)
+        moves.append(move)
+    assert len(accumulator) == 50
+    expected = pd.Series(moves).sub(np.mean(moves)).abs().mean()
+    assert accumulator.usual == pytest.approx(expected)
+
+
+def test_unavailable_holding_is_skipped(t3_closes):
+    prices = _prices(t3_closes)
+    repo = FakeRepository({"TQQQ": prices, "USO": pd.Series(dtype=float),
+                           "IAU": prices, "BRK-B": prices})
+    live = ps.LivePortfolioMonitor.seed(PortfolioMonitor(repository=repo))
+    assert live.panels()[1] == {"label": "USO", "available": False}
+    assert live.on_price("USO", prices.index[-1], 1.0) is None
+
+
+class TestIncrementalRender:
+    def _rendered(self, t3_closes):
+        prices = _prices(t3_closes)
+        live = ps.LivePortfolioMonitor.seed(_monitor(prices))
+        fig = live.render()
+        draws = []
+        original = fig.canvas.draw
+        fig.canvas.draw = lambda: draws.append(1) or original()
+        return live, prices, fig, draws
+
+    def test_a_tick_rewrites_only_the_last_bar(self, t3_closes):
+        live, prices, fig, draws = self._rendered(t3_closes)
+        bars = live.monitor.panel_artists[0][0]
+        before = [patch.get_height() for patch in bars.patches]
+        last_day = prices.index[-1] + pd.Timedelta(hours=15)
+
+        live.on_price("TQQQ", last_day, prices.iloc[-2] * 0.999)
+
+        after = [patch.get_height() for patch in bars.patches]
+        plt.close(fig)
+        assert draws == []  # blitted, no full canvas draw
+        assert after[:-1] == before[:-1]
+        assert after[-1] == pytest.approx(np.log(0.999) * 100)
+        assert live.monitor.panel_artists[0][2].get_text() == ps.panel_note(live.panel(0))
+
+    def test_a_new_period_or_an_off_scale_move_redraws_the_panel(self, t3_closes):
+        live, prices, fig, draws = self._rendered(t3_closes)
+        next_day = prices.index[-1] + pd.offsets.BDay()
+
+        live.on_price("TQQQ", next_day, prices.iloc[-1])
+        assert len(draws) == 1
+        live.on_price("TQQQ", next_day + pd.Timedelta(hours=1), prices.iloc[-1] * 3)
+        plt.close(fig)
+        assert len(draws) == 2
+        low, high = fig.axes[0].get_ylim()
+        assert low <= live.holdings[0].last_move <= high
+
+
+def test_poll_folds_in_the_latest_bar_without_refetching_history(t3_closes):
+    prices = _prices(t3_closes)
+    monitor = _monitor(prices)
+    live = ps.LivePortfolioMonitor.seed(monitor)
+    monitor._repository._prices = {}  # any history refetch would KeyError
+    today = prices.index[-1] + pd.offsets.BDay()
+    bars = pd.DataFrame({"Close": [101.0, 102.0, np.nan]},
+                        index=today + pd.to_timedelta([570, 571, 572], unit="min"))
+    repository = FakeRepository({}, bars={"TQQQ": bars})
+
+    changes = live.poll(repository)
+
+    assert changes == {"TQQQ": ps.PERIOD}
+    assert live.holdings[0].last_price == 102.0
+
+
+def test_run_polls_through_the_shared_loop():
+    class Counting:
+        polled = 0
+
+        def poll(self, repository):
+            self.polled += 1
+
+    live, slept = Counting(), []
+    ps.run(live, repository=None, every=5, polls=3, sleep=slept.append)
+    assert live.polled == 3
+    assert slept == [5, 5]  # no sleep after the last poll
+    args = ps._parse_args(["weekly", "--every", "15", "--polls", "2"])
+    assert (args.period, args.every, args.polls) == ("weekly", 15.0, 2)
@@ -0,0 +1,74 @@
+"""Tests for the after-close prefetch (fentu.orchestrator.prefetch)."""
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+
+from fentu.explatoryservices.market_cache import MarketCache
+from fentu.orchestrator import orchestrate_daily, prefetch
+
+
+def utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+class FakeRepository:
+    def __init__(self, fail=()):
+        self.fail = set(fail)
+        self.fetched = []
+
+    def fetch_open_high_low_close(self, ticker):
+        self.fetched.append(ticker)
+        if ticker in self.fail:
+            raise ConnectionError(ticker)
+        return pd.DataFrame({"Close": [1.0, 2.0]},
+                            index=pd.bdate_range("2026-10-15", periods=2))
+
+
+def test_hk_prefetch_warms_the_asia_pacific_brief_markets(tmp_path):
+    cache = MarketCache(str(tmp_path), now=lambda: utc(2026, 10, 19, 8, 20))
+    repository = FakeRepository()
+    outcomes = prefetch.prefetch("HK", cache, repository)
+    assert set(repository.fetched) == {"^HSI", "^N225", "^KS11", "^AXJO"}
+    assert set(outcomes.values()) == {"ok"}
+    assert cache.get(("ohlc", "^HSI"), "HK") is not None
+
+
+def test_us_prefetch_warms_holdings_vix_and_tail_inputs(tmp_path, monkeypatch):
+    monkeypatch.setattr(orchestrate_daily, "fetch_tail_quotes", lambda: {"3m": {}})
+    monkeypatch.setattr(orchestrate_daily, "fetch_tail_history", lambda: "history")
+    cache = MarketCache(str(tmp_path), now=lambda: utc(2026, 10, 19, 20, 20))
+    repository = FakeRepository(fail={"USO"})
+
+    outcomes = prefetch.prefetch("US", cache, repository)
+
+    assert set(repository.fetched) == {"TQQQ", "USO", "IAU", "BRK-B", "^VIX"}
+    assert outcomes[("ohlc", "USO")].startswith("failed")
+    assert outcomes[orchestrate_daily.TAIL_QUOTES_KEY] == "ok"
+    assert cache.get(orchestrate_daily.TAIL_HISTORY_KEY, "US") == "history"
+    assert cache.get(("ohlc", "USO"), "US") is None
+
+
+def test_next_run_is_the_soonest_close_plus_delay():
+    # Monday 10:00 UTC: HK closed at 08:00 (+20min passed), US closes 20:00.
+    when, market = prefetch.next_run(utc(2026, 10, 19, 10, 0))
+    assert (when, market) == (utc(2026, 10, 19, 20, 20), "US")
+    # Inside the delay window after the HK close: HK still to come.
+    when, market = prefetch.next_run(utc(2026, 10, 19, 8, 5))
+    assert (when, market) == (utc(2026, 10, 19, 8, 20), "HK")
+
+
+def test_daemon_sleeps_until_the_close_then_prefetches(tmp_path, monkeypatch):
+    clock = {"now": utc(2026, 10, 19, 10, 0)}
+    slept, warmed = [], []
+
+    def sleep(seconds):
+        slept.append(seconds)
+        clock["now"] += timedelta(seconds=seconds)
+
+    monkeypatch.setattr(prefetch, "prefetch",
+                        lambda market, cache: warmed.append(market) or {})
+    prefetch.run_daemon(MarketCache(str(tmp_path)), runs=2, sleep=sleep,
+                        now=lambda: clock["now"])
+
+    assert warmed == ["US", "HK"]
+    assert slept[0] == timedelta(hours=10, minutes=20).total_seconds()
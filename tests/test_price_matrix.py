@@ -0,0 +1,121 @@
+"""Tests for the memory-mapped price matrix (fentu.explatoryservices.price_matrix)."""
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fentu.explatoryservices import price_matrix as pm
+
+
+def _wide(dates, tickers=("USO", "GLD"), seed=0):
+    rng = np.random.default_rng(seed)
+    close = pd.DataFrame(100 + np.cumsum(rng.normal(0, 1, (len(dates), len(tickers))), axis=0),
+                         index=dates, columns=list(tickers))
+    return pd.concat({"High": close + 1, "Low": close - 1, "Close": close}, axis=1)
+
+
+@pytest.fixture
+def dates():
+    return pd.bdate_range("2024-01-01", "2024-12-31")
+
+
+@pytest.fixture
+def matrix(tmp_path, dates):
+    return pm.PriceMatrix.create(str(tmp_path / "m"), _wide(dates))
+
+
+def test_create_round_trips_through_the_files(matrix, dates, tmp_path):
+    reopened = pm.PriceMatrix(str(tmp_path / "m"))
+    assert reopened.n_rows == len(dates)
+    assert reopened.tickers == ["USO", "GLD"]
+    np.testing.assert_allclose(reopened.column("GLD"), _wide(dates)["Close"]["GLD"], rtol=1e-6)
+    assert reopened.dates[0] == np.datetime64("2024-01-01")
+
+
+def test_column_and_rows_are_views_of_the_mapped_file(matrix):
+    close = matrix.field("Close")
+    assert isinstance(close, np.memmap)
+    assert np.shares_memory(matrix.column("USO"), close)
+    assert np.shares_memory(matrix.rows("2024-03-01", "2024-03-31"), close)
+
+
+def test_rows_are_bounded_by_dates_inclusive(matrix):
+    block = matrix.rows("2024-03-01", "2024-03-29")
+    assert block.shape == (21, 2)
+
+
+def test_append_adds_only_newer_dates(tmp_path, dates):
+    root = str(tmp_path / "m")
+    first = pm.PriceMatrix.create(root, _wide(dates[:100]))
+    grown = first.append(_wide(dates[50:]))  # overlaps 50 stored rows
+    assert grown.n_rows == len(dates)
+    assert np.all(np.diff(grown.dates.astype(np.int64)) > 0)
+    assert json.load(open(tmp_path / "m" / "meta.json"))["rows"] == len(dates)
+
+
+def test_append_matches_columns_by_ticker(tmp_path, dates):
+    matrix = pm.PriceMatrix.create(str(tmp_path / "m"), _wide(dates[:10]))
+    later = _wide(dates[10:20], tickers=("GLD", "SPY"))
+    grown = matrix.append(later)
+    np.testing.assert_allclose(grown.column("GLD")[10:], later["Close"]["GLD"], rtol=1e-6)
+    assert np.isnan(grown.column("USO")[10:]).all()
+
+
+def test_reader_ignores_rows_past_the_recorded_count(tmp_path, dates):
+    root = tmp_path / "m"
+    pm.PriceMatrix.create(str(root), _wide(dates[:10]))
+    with open(root / "Close.bin", "ab") as fh:  # a crash mid-append
+        fh.write(np.zeros(2, dtype=np.float32).tobytes())
+    assert pm.PriceMatrix(str(root)).n_rows == 10
+
+
+def test_append_after_a_partial_write_overwrites_the_leftover_bytes(tmp_path, dates):
+    root = tmp_path / "m"
+    matrix = pm.PriceMatrix.create(str(root), _wide(dates[:10]))
+    with open(root / "dates.i8", "ab") as fh:  # a crash mid-append
+        fh.write(np.zeros(3, dtype=np.int64).tobytes())
+    with open(root / "Close.bin", "ab") as fh:
+        fh.write(np.zeros(3, dtype=np.float32).tobytes())
+    later = _wide(dates[10:20])
+    grown = matrix.append(later)
+    assert grown.dates[10] == np.datetime64(dates[10].date())
+    np.testing.assert_allclose(grown.field("Close")[10:], later["Close"], rtol=1e-6)
+    assert (root / "Close.bin").stat().st_size == 20 * 2 * 4
+
+
+def test_batch_mad_matches_the_headline_calculator(matrix):
+    from fentu.explatoryservices.volcalculator import MeanAbsoluteDeviationVolatility
+
+    returns = pm.log_returns(matrix.field("Close"))
+    expected = MeanAbsoluteDeviationVolatility().calculate_volatility(
+        pd.Series(returns[:, 1]))
+    assert pm.batch_mad(returns)[1] == pytest.approx(expected)
+
+
+def test_monthly_period_returns_use_month_end_rows(matrix):
+    monthly = pm.period_returns(matrix, "M")
+    frame = matrix.frame("Close").astype(float)
+    expected = np.log(frame.resample("ME").last()).diff().dropna().to_numpy()
+    np.testing.assert_allclose(monthly, expected, rtol=1e-5)
+
+
+def test_window_high_low_per_ticker(matrix):
+    high, low = pm.window_high_low(matrix, "2024-06-01", "2024-06-30")
+    frame = matrix.frame("High", "2024-06-01", "2024-06-30")
+    np.testing.assert_allclose(high, frame.max().to_numpy())
+    assert (low < high).all()
+
+
+def test_build_and_update_through_the_repository(tmp_path, dates):
+    class FeedRepository:
+        def __init__(self, wide):
+            self.wide = wide
+
+        def get_wide_open_high_low_close(self, instruments):
+            return self.wide
+
+    root = str(tmp_path / "m")
+    pm.build(root, ["USO", "GLD"], repository=FeedRepository(_wide(dates[:200])))
+    updated = pm.update(root, repository=FeedRepository(_wide(dates)))
+    assert updated.n_rows == len(dates)
@@ -0,0 +1,115 @@
+"""
+Test the tail chart's pricing engines: the Student-t engine is a martingale
+on its quadrature grid, converges to BSM as df grows, prices the wing richer
+than BSM at df=3, and reconstruct_ratios switches between the two.
+"""
+import numpy as np
+import pytest
+from py_vollib.black_scholes import black_scholes
+
+from fentu.pricingservices import bsm
+from fentu.pricingservices.pricing_engines import (
+    BSMEngine,
+    StudentTEngine,
+    VOL_GRID,
+    pricing_engine,
+)
+from fentu.pricingservices.tail_plot import (
+    WING_LEVELS,
+    PriceHistory,
+    bsm_model_today_ratio,
+    reconstruct_ratios,
+)
+
+SKEW = {0.20: 6.0, 0.25: 8.0, 0.30: 10.0}
+T = 90 / 365.0
+VOLS = np.array([0.12, 0.2, 0.35, 0.6])
+
+
+def _py_vollib_ratio(vol, pct):
+    """The BSM wing/body ratio, one py_vollib call per option."""
+    wing = black_scholes("p", 1.0, 1.0 - pct, T, 0.0, vol + SKEW[pct] / 100.0)
+    body = black_scholes("c", 1.0, 1.0, T, 0.0, vol) + black_scholes("p", 1.0, 1.0, T, 0.0, vol)
+    return wing / body
+
+
+def _history(n=300):
+    import pandas as pd
+
+    idx = pd.bdate_range("2020-01-02", periods=n)
+    vxn = pd.DataFrame({"Close": 20.0 + 15.0 * np.sin(np.arange(n) / 20.0) ** 2}, index=idx)
+    qqq = pd.DataFrame({"Close": 300.0 + np.arange(n)}, index=idx)
+    qqq.iloc[5, 0] = np.nan  # a missing close is skipped
+    return PriceHistory(idx, vxn, qqq)
+
+
+def test_bsm_engine_is_the_vectorized_bsm():
+    engine = BSMEngine()
+    np.testing.assert_allclose(engine.put(0.75, VOLS, T), bsm.put(1.0, 0.75, VOLS, T))
+    np.testing.assert_allclose(engine.straddle(VOLS, T), bsm.straddle(1.0, VOLS, T))
+
+
+def test_student_t_is_a_martingale_and_tends_to_bsm():
+    thin = StudentTEngine(df=400)
+    # E[S_T] = S_0: call - put = 0 at the money, so the straddle is two puts.
+    np.testing.assert_allclose(thin.straddle(VOLS, T), 2 * thin.put(1.0, VOLS, T), rtol=1e-3)
+    np.testing.assert_allclose(thin.straddle(VOLS, T), bsm.straddle(1.0, VOLS, T), rtol=5e-3)
+    np.testing.assert_allclose(thin.put(0.75, VOLS + 0.1, T), bsm.put(1.0, 0.75, VOLS + 0.1, T),
+                               rtol=0.05)
+
+
+def test_fat_tails_price_the_deep_wing_richer_than_bsm():
+    # At equal variance the t carries more mass far out and less around one
+    # to two sigma: the wing is richer while it sits deep in the tail (low vol).
+    low = np.array([0.12, 0.2])
+    fat = StudentTEngine(df=3).wing_ratios(low, SKEW, T, WING_LEVELS)
+    normal = BSMEngine().wing_ratios(low, SKEW, T, WING_LEVELS)
+    for pct in WING_LEVELS:
+        assert (fat[pct] > normal[pct]).all()
+    assert fat[0.30][0] / normal[0.30][0] > fat[0.20][0] / normal[0.20][0]
+
+
+def test_cached_curve_matches_direct_integration_and_off_grid_vols():
+    engine = StudentTEngine()
+    vols = np.array([0.1, 0.2337, 0.9, 5.0, 0.0])
+    prices = engine.put(0.75, vols, T)
+    direct = engine._integrate("put", 0.75, vols[:4], T)
+    np.testing.assert_allclose(prices[:4], direct, rtol=2e-3)
+    assert prices[4] == 0.0 and vols[3] > VOL_GRID[-1]
+    assert ("put", 0.75, T) in engine._curves
+    engine.put(0.75, vols, T)
+    assert len(engine._curves) == 1
+
+
+def test_short_low_vol_wing_stays_inside_the_truncation():
+    # 30 days at 9% vol: the 25% put is ~13 sd out, yet priced (not zero).
+    engine = StudentTEngine()
+    t, vols = 30 / 365.0, np.array([0.085, 0.09, 0.15])
+    prices = engine.put(0.75, vols, t)
+    assert (prices > 0).all()
+    np.testing.assert_allclose(prices, engine._integrate("put", 0.75, vols, t), rtol=1e-3)
+    assert np.isfinite(engine._curves[("put", 0.75, t)]).all()
+    # A strike past the truncation has a zero curve: integrated directly, still 0.
+    np.testing.assert_array_equal(engine.put(0.01, vols, t), 0.0)
+
+
+def test_reconstruct_ratios_switches_engines():
+    history = _history()
+    bsm_rows = reconstruct_ratios(history, SKEW, T)
+    t_rows = reconstruct_ratios(history, SKEW, T, engine="student-t")
+    assert len(bsm_rows) == len(t_rows) == (300 - 1) * len(WING_LEVELS)
+    day, pct, ratio = bsm_rows[3 * 10 + 1]
+    vol = float(history.vxn.loc[str(day), "Close"]) / 100.0
+    assert ratio == pytest.approx(_py_vollib_ratio(vol, pct))
+    assert [(d, p) for d, p, _r in t_rows] == [(d, p) for d, p, _r in bsm_rows]
+    assert not np.allclose([r for *_k, r in t_rows], [r for *_k, r in bsm_rows])
+    quote = {"spot": 500.0, "atm_iv": 0.2, "skew_pts": SKEW, "dte": 90}
+    assert bsm_model_today_ratio(quote)[0.25] == pytest.approx(_py_vollib_ratio(0.2, 0.25))
+    assert bsm_model_today_ratio(quote, "student-t")[0.25] > bsm_model_today_ratio(quote)[0.25]
+
+
+def test_bad_engine_and_df_are_rejected():
+    with pytest.raises(ValueError, match="unknown pricing engine"):
+        pricing_engine("heston")
+    with pytest.raises(ValueError, match="df must exceed 2"):
+        StudentTEngine(df=2)
@@ -0,0 +1,109 @@
+"""
+Test the signal backtest: at every bar the calibration is exactly what the
+monitor would have seen that day (the moves before it), and forward returns
+after SIGNAL bars are split from those after noise bars.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from fentu.explatoryservices.portfolio_monitor import PortfolioMonitor
+from fentu.explatoryservices.signal_backtest import (
+    backtest,
+    calibration_mad,
+    format_summary,
+    forward_returns,
+    prefix_below,
+    replay,
+    signal_days,
+    summary,
+)
+
+
+@pytest.fixture
+def closes(t3_closes):
+    return t3_closes(3, 900, seed=7, start="2020-01-01",
+                     gaps={1: slice(None, 300)})  # a later listing
+
+
+def _brute_mad(r, t, window=None):
+    prior = r[:t] if window is None else r[max(t - window, 0):t]
+    return np.abs(prior - prior.mean()).mean() if len(prior) else np.nan
+
+
+def test_prefix_below_matches_direct_counting():
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=700)
+    lengths = rng.integers(0, 701, size=300)
+    thresholds = rng.normal(size=300)
+    counts, sums = prefix_below(values, lengths, thresholds, block=64)
+    for L, x, k, s in zip(lengths, thresholds, counts, sums):
+        prefix = values[:L]
+        assert k == (prefix < x).sum()
+        assert s == pytest.approx(prefix[prefix < x].sum())
+
+
+@pytest.mark.parametrize("window", [None, 60])
+def test_calibration_mad_uses_only_the_moves_before_each_bar(window):
+    r = np.random.default_rng(1).standard_t(3, size=600)
+    mad = calibration_mad(r, window)
+    assert np.isnan(mad[0])
+    for t in (1, 2, 59, 60, 61, 255, 256, 257, 599):
+        assert mad[t] == pytest.approx(_brute_mad(r, t, window))
+
+
+def test_every_bar_reads_as_the_monitor_read_it_that_day(closes):
+    bars = backtest(closes, [("T0", "T0")])
+    prices = closes["T0"]
+    for day in (prices.index[40], prices.index[500], prices.index[-1]):
+        monitor = PortfolioMonitor(holdings=[("T0", "T0")],
+                                   repository=_Upto(prices, day))
+        panel = monitor.prepare_panels()[0]
+        row = bars.loc[("T0", day)]
+        assert row.usual == pytest.approx(panel["usual"])
+        assert row.multiple == pytest.approx(panel["multiple"])
+        assert row.signal == panel["signal"]
+
+
+class _Upto:
+    def __init__(self, prices, day):
+        self.prices = prices.loc[:day]
+
+    def get_prices(self, ticker):
+        return self.prices
+
+
+def test_forward_returns_sum_the_next_h_moves():
+    r = np.array([1.0, 2.0, 3.0, 4.0])
+    ahead = forward_returns(r, (1, 2, 5))
+    np.testing.assert_allclose(ahead[1], [2.0, 3.0, 4.0, np.nan])
+    np.testing.assert_allclose(ahead[2], [5.0, 7.0, np.nan, np.nan])
+    assert np.isnan(ahead[5]).all()
+
+
+def test_replay_drops_the_uncalibrated_start_and_listing_gap(closes):
+    bars = backtest(closes)
+    assert len(bars.loc["T0"]) == len(closes) - 1 - 5
+    assert bars.loc["T1"].index[0] > closes.index[300]
+    assert set(bars["verdict"]) == {"signal up", "signal down", "noise"}
+
+
+def test_summary_splits_signal_from_noise_and_formats(closes):
+    bars = backtest(closes, horizons=(1, 5))
+    table = summary(bars, (1, 5))
+    assert table.loc[("T0", "noise"), "bars"] + table.loc[("T0", "signal up"), "bars"] \
+        + table.loc[("T0", "signal down"), "bars"] == len(bars.loc["T0"])
+    noise = bars.loc["T0"][bars.loc["T0"]["verdict"] == "noise"]
+    assert table.loc[("T0", "noise"), "mean_fwd_5"] == pytest.approx(noise["fwd_5"].mean())
+    assert signal_days(bars)["signal"].all()
+    text = format_summary(table, horizons=(1, 5))
+    assert "+5 days" in text.splitlines()[0]
+    assert len(text.splitlines()) == 1 + len(table)
+
+
+def test_rolling_window_changes_only_the_calibration():
+    returns = pd.Series(np.random.default_rng(2).standard_t(3, size=400),
+                        index=pd.bdate_range("2020-01-01", periods=400))
+    expanding, rolling = replay(returns), replay(returns, window=20)
+    pd.testing.assert_series_equal(expanding["move"], rolling["move"])
+    assert not np.allclose(expanding["usual"], rolling["usual"])
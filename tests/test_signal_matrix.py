@@ -0,0 +1,73 @@
+"""
+Test the cross-period signal matrix: one fetch, four calendar series derived
+from the same closes, and every cell equal to that period's own reading.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from fentu.explatoryservices.portfolio_monitor import DEFAULT_PORTFOLIO, PERIOD_INFO
+from fentu.explatoryservices.signal_matrix import (
+    PERIODS,
+    format_matrix,
+    matrix_report,
+    period_closes,
+    signal_matrix,
+)
+from fentu.explatoryservices.watchlist_monitor import signal_table
+
+
+@pytest.fixture
+def closes(t3_closes):
+    columns = [ticker for _label, ticker in DEFAULT_PORTFOLIO]
+    return t3_closes(4, 2000, seed=3, start="2018-01-01", columns=columns,
+                     gaps={1: slice(None, 700)})  # a later listing
+
+
+def test_period_closes_match_resampling_the_daily_closes(closes):
+    derived = period_closes(closes)
+    assert list(derived) == list(PERIODS)
+    for period, frame in derived.items():
+        rule = PERIOD_INFO[period]["resample"]
+        expected = closes if rule is None else closes.resample(rule).last()
+        pd.testing.assert_frame_equal(frame, expected.dropna(how="all"),
+                                      check_freq=False, check_index_type=False)
+
+
+def test_every_cell_matches_the_single_period_reading(closes):
+    matrix = signal_matrix(closes, DEFAULT_PORTFOLIO)
+    assert list(matrix.index) == [label for label, _ticker in DEFAULT_PORTFOLIO]
+    for period in PERIODS:
+        table = signal_table(closes, DEFAULT_PORTFOLIO, period)
+        np.testing.assert_allclose(matrix[(period, "multiple")], table["multiple"])
+        np.testing.assert_allclose(matrix[(period, "significance")], table["significance"])
+        expected = np.where(table["signal"], "SIGNAL", "noise")
+        assert list(matrix[(period, "verdict")]) == list(expected)
+
+
+def test_report_is_one_fetch_and_one_row_per_holding(closes):
+    calls = []
+
+    class Wide:
+        def try_fetch_wide_open_high_low_close(self, tickers):
+            calls.append(list(tickers))
+            return pd.concat({"Close": closes}, axis=1)
+
+    lines = matrix_report(repository=Wide()).splitlines()
+    assert calls == [["TQQQ", "USO", "IAU", "BRK-B"]]
+    assert lines[0].split() == list(PERIODS)
+    assert [line.split()[0] for line in lines[1:]] == ["TQQQ", "USO", "IAU", "BRKB"]
+
+
+def test_missing_holding_reads_n_a(closes):
+    matrix = signal_matrix(closes, [("TQQQ", "TQQQ"), ("GONE", "XXX")])
+    assert set(matrix.loc["GONE", (slice(None), "verdict")]) == {"n/a"}
+    assert format_matrix(matrix).splitlines()[2].split()[1:] == ["n/a"] * 4
+
+
+def test_failed_fetch_is_reported_not_raised():
+    class Down:
+        def try_fetch_wide_open_high_low_close(self, tickers):
+            return None
+
+    assert matrix_report(repository=Down()) == "signal matrix unavailable"
@@ -0,0 +1,138 @@
+"""
+Test the timing spans: free when disabled, thread-safe when enabled, and
+reported both as an aggregated JSON report and as a Chrome trace. Also checks
+that the wired stages (reconstruction, fits, orchestrator phases) show up.
+"""
+import json
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fentu.instrumentation import spans
+
+
+@pytest.fixture(autouse=True)
+def recording():
+    spans.reset()
+    spans.enable()
+    yield
+    spans.disable()
+    spans.reset()
+
+
+def test_disabled_span_is_a_shared_noop():
+    spans.disable()
+    assert spans.span("a") is spans.span("b")
+    with spans.span("fetch", "network"):
+        pass
+
+    @spans.spanned()
+    def work():
+        return 42
+
+    assert work() == 42
+    assert spans.records() == []
+
+
+def test_disabled_overhead_is_negligible():
+    spans.disable()
+    started = time.perf_counter()
+    for _ in range(100_000):
+        with spans.span("hot", "compute"):
+            pass
+    assert time.perf_counter() - started < 0.5
+
+
+def test_report_aggregates_by_name_and_category():
+    for _ in range(3):
+        with spans.span("fetch", "network", instrument="QQQ"):
+            time.sleep(0.01)
+    with spans.span("savefig", "render"):
+        pass
+
+    report = spans.report()
+    assert list(report["spans"]) == ["fetch", "savefig"]  # slowest first
+    fetch = report["spans"]["fetch"]
+    assert fetch["count"] == 3 and fetch["category"] == "network"
+    assert fetch["total_s"] >= 0.03 and fetch["max_s"] <= fetch["total_s"]
+    assert set(report["categories"]) == {"network", "render"}
+
+
+def test_decorator_records_and_tags_errors():
+    @spans.spanned("compute")
+    def boom():
+        raise ValueError("bad fit")
+
+    with pytest.raises(ValueError):
+        boom()
+    (record,) = spans.records()
+    assert record["name"].endswith("boom")
+    assert record["args"]["error"] == "ValueError"
+
+
+def test_spans_from_threads_land_on_their_own_rows(tmp_path):
+    def fetch(name):
+        with spans.span(name, "network"):
+            time.sleep(0.01)
+
+    threads = [threading.Thread(target=fetch, args=(f"t{i}",)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    trace = json.loads(open(spans.write_chrome_trace(tmp_path / "trace.json")).read())
+    events = trace["traceEvents"]
+    assert len(events) == 4
+    assert all(e["ph"] == "X" and e["dur"] > 0 for e in events)
+    assert len({e["tid"] for e in events}) == 4
+
+
+def test_json_report_file(tmp_path):
+    with spans.span("reconstruct", "compute"):
+        pass
+    report = json.loads(open(spans.write_report(tmp_path / "timing.json")).read())
+    assert report["spans"]["reconstruct"]["count"] == 1
+
+
+def test_wired_stages_are_recorded():
+    from fentu.explatoryservices import plotting_service
+    from fentu.pricingservices.tail_plot import PriceHistory, reconstruct_ratios
+
+    idx = pd.date_range("2020-01-02", periods=30, freq="B")
+    history = PriceHistory(idx, pd.DataFrame({"Close": 20.0}, index=idx),
+                           pd.DataFrame({"Close": 300.0}, index=idx))
+    reconstruct_ratios(history, {0.20: 5.0, 0.25: 5.0, 0.30: 5.0}, 0.25)
+    plotting_service.fit_student_t_distribution(np.random.default_rng(0).standard_t(3, 200))
+
+    names = set(spans.report()["spans"])
+    assert "reconstruct_ratios" in names
+    assert "fit_student_t_distribution" in names
+
+
+def test_orchestrator_writes_the_timing_report_and_trace(tmp_path, monkeypatch, capsys):
+    from fentu.orchestrator import orchestrate_daily
+
+    class _Monitor:
+        holdings = (("USO", "USO"),)
+
+        def prepare_panels(self):
+            return []
+
+    monkeypatch.setattr(orchestrate_daily, "PortfolioMonitor", lambda period, **_: _Monitor())
+    monkeypatch.setattr(orchestrate_daily, "ReturnsRepository", lambda **_: None)
+    spans.disable()  # the flag turns recording on
+    report_path, trace_path = tmp_path / "timing.json", tmp_path / "trace.json"
+
+    assert orchestrate_daily.main(["--skip-tail", "--no-show",
+                                   "--timing-report", str(report_path),
+                                   "--trace", str(trace_path)]) == 0
+
+    report = json.loads(report_path.read_text())
+    assert {"portfolio", "levels"} <= set(report["spans"])
+    assert report["spans"]["portfolio"]["category"] == "phase"
+    assert json.loads(trace_path.read_text())["traceEvents"]
+    assert f"timing report: {report_path}" in capsys.readouterr().out
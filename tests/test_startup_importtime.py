@@ -0,0 +1,74 @@
+"""
+Cold-start gate for the CLIs, measured with ``python -X importtime``.
+
+Each CLI path may import only what it uses: a ``see_change`` usage error
+loads nothing heavy at all, and the report-only paths (portfolio scan,
+morning brief, high/low levels, ``orchestrate_daily --skip-tail``) load
+pandas/numpy but never matplotlib, seaborn, scipy, yfinance or curl_cffi —
+those come in on the first fetch or the first plot.
+
+A new top-level import that drags one of them back in fails here, and so
+does a ``see_change`` import that grows past the sub-200ms budget.
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+HEAVY = {"yfinance", "matplotlib", "seaborn", "scipy", "curl_cffi", "py_vollib"}
+CLI_IMPORT_BUDGET_US = 200_000  # first useful output in < 200 ms
+
+
+def _importtime(code):
+    """{module: cumulative microseconds} for `python -X importtime -c code`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, cwd=REPO_ROOT, timeout=120,
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        modules[name.strip()] = int(cumulative)
+    return result, modules
+
+
+def _heavy_loaded(modules):
+    return sorted({name.split(".")[0] for name in modules} & HEAVY)
+
+
+def test_see_change_import_loads_nothing_heavy():
+    _, modules = _importtime("import fentu.explatoryservices.seechange")
+    assert _heavy_loaded(modules) == []
+    assert "pandas" not in modules
+    assert "fentu.explatoryservices.volcalculator" not in modules
+
+
+def test_see_change_import_is_within_budget():
+    _, modules = _importtime("import fentu.explatoryservices.seechange")
+    assert modules["fentu.explatoryservices.seechange"] < CLI_IMPORT_BUDGET_US
+
+
+def test_see_change_usage_error_exits_before_heavy_imports():
+    result, modules = _importtime(
+        "import sys; sys.argv = ['see_change']; "
+        "from fentu.explatoryservices.seechange import main; main()")
+    assert result.returncode == 1
+    assert "Usage: see_change" in result.stdout
+    assert _heavy_loaded(modules) == []
+
+
+@pytest.mark.parametrize("module", [
+    "fentu.explatoryservices.volcalculator",
+    "fentu.explatoryservices.portfolio_monitor",
+    "fentu.explatoryservices.morning_brief",
+    "fentu.explatoryservices.high_low_levels",
+    "fentu.orchestrator.orchestrate_daily",
+])
+def test_report_paths_defer_fetch_and_plot_dependencies(module):
+    _, modules = _importtime(f"import {module}")
+    assert module in modules
+    assert _heavy_loaded(modules) == []
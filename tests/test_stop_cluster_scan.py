@@ -0,0 +1,103 @@
+"""
+Test the watchlist stop-cluster scan: one bulk fetch, the same 2mo / 6mo /
+war levels high_low_levels reports per ticker, and the names ranked by
+distance from the last close to the nearest stop zone.
+"""
+from datetime import date
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fentu.explatoryservices.high_low_levels import levels_view
+from fentu.explatoryservices.stop_cluster_scan import scan, scan_report
+
+TODAY = date(2026, 7, 22)
+
+
+def _history(rows):
+    idx = pd.DatetimeIndex([r[0] for r in rows])
+    return pd.DataFrame({"High": [r[1] for r in rows], "Low": [r[2] for r in rows],
+                         "Close": [r[3] for r in rows]}, index=idx)
+
+
+USO = _history([
+    ("2026-01-15", 75.0, 70.0, 72.0),
+    ("2026-03-04", 90.0, 80.0, 82.0),  # war high
+    ("2026-04-08", 69.0, 66.0, 67.5),  # war low
+    ("2026-05-25", 88.0, 84.0, 86.0),  # 2mo high
+    ("2026-06-05", 72.0, 70.0, 71.0),  # 2mo low
+    ("2026-07-21", 78.0, 76.0, 77.0),  # close 77 -> 2mo low zone 69.30-70 is 9.1% away
+])
+SPY = _history([
+    ("2026-03-02", 600.0, 590.0, 595.0),  # 6mo low
+    ("2026-06-01", 650.0, 640.0, 645.0),  # 2mo + 6mo high
+    ("2026-07-01", 630.0, 620.0, 625.0),  # 2mo low
+    ("2026-07-21", 648.0, 642.0, 647.0),  # close 647 -> 650 buy stops 0.5% away
+])
+
+
+def _wide(frames):
+    """(field, ticker) columns on one shared index, as yf.download returns."""
+    return pd.concat(frames, axis=1, keys=list(frames), sort=True).swaplevel(axis=1).sort_index(axis=1)
+
+
+def _repository(wide):
+    repo = MagicMock()
+    repo.try_fetch_wide_open_high_low_close.return_value = wide
+    return repo
+
+
+def test_levels_match_the_single_ticker_view():
+    ranked = scan(_wide({"USO": USO, "SPY": SPY}), today=TODAY)
+    for ticker, frame in (("USO", USO), ("SPY", SPY)):
+        row = ranked.set_index("ticker").loc[ticker]
+        prices = {e["price"] for e in levels_view(frame, instrument=ticker, today=TODAY)}
+        assert row["price"] in prices
+
+
+def test_ranks_by_distance_to_the_nearest_stop_zone():
+    ranked = scan(_wide({"USO": USO, "SPY": SPY}), today=TODAY)
+
+    assert list(ranked["ticker"]) == ["SPY", "USO"]
+    spy, uso = ranked.iloc[0], ranked.iloc[1]
+    assert (spy["label"], spy["price"], spy["stop_side"]) == ("2mo high", 650.0, "buy")
+    assert spy["distance_pct"] == pytest.approx((650 - 647) / 647 * 100)
+    assert (uso["label"], uso["price"], uso["stop_side"]) == ("2mo low", 70.0, "sell")
+    assert uso["distance_pct"] == pytest.approx((77 - 70) / 77 * 100)
+
+
+def test_close_inside_a_zone_is_zero_distance():
+    inside = SPY.copy()
+    inside.loc["2026-07-21", "Close"] = 652.0  # inside the 650-656.50 buy-stop zone
+    ranked = scan(_wide({"SPY": inside}), today=TODAY)
+    assert ranked.loc[0, "distance_pct"] == 0.0
+
+
+def test_report_prints_only_the_approaching_names_off_one_fetch():
+    repo = _repository(_wide({"USO": USO, "SPY": SPY}))
+    report = scan_report(["USO", "SPY"], repository=repo, today=TODAY, within=3.0)
+
+    repo.try_fetch_wide_open_high_low_close.assert_called_once_with(["USO", "SPY"])
+    lines = report.splitlines()
+    assert len(lines) == 2  # header + SPY
+    assert lines[1].startswith("SPY") and "buy stops" in lines[1] and "0.5%" in lines[1]
+
+
+def test_missing_ticker_is_unavailable_not_a_crash():
+    wide = _wide({"SPY": SPY, "DEAD": SPY * np.nan})
+    report = scan_report(["SPY", "DEAD"], repository=_repository(wide), today=TODAY,
+                         show_all=True)
+    assert report.splitlines()[-1] == "DEAD unavailable"
+    assert "SPY" in report
+
+
+def test_failed_bulk_fetch_is_unavailable():
+    assert scan_report(["SPY"], repository=_repository(None)) == "watchlist unavailable"
+
+
+def test_nothing_close_says_so():
+    report = scan_report(["USO"], repository=_repository(_wide({"USO": USO})),
+                         today=TODAY, within=1.0)
+    assert report == "no names within 1.0% of a stop cluster"
@@ -0,0 +1,155 @@
+"""
+Test the tail-cheapness walk-forward: the vectorized BSM prices what
+py_vollib prices, each date's percentile uses only the ratios before it,
+and a CHEAP date buys a put that is settled at the close on its expiry.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+from py_vollib.black_scholes import black_scholes
+
+from fentu.pricingservices import bsm
+from fentu.pricingservices.order_statistics import (
+    RankTree,
+    percentile_at,
+    walk_forward_percentiles,
+)
+from fentu.pricingservices.pricing_engines import BSMEngine, StudentTEngine
+from fentu.pricingservices.tail_backtest import format_summary, summary, walk_forward
+from fentu.pricingservices.tail_plot import PriceHistory, _verdict
+
+SKEW = {0.20: 6.0, 0.25: 8.0, 0.30: 10.0}
+
+
+def _history(n=900, seed=5):
+    rng = np.random.default_rng(seed)
+    idx = pd.bdate_range("2010-01-04", periods=n)
+    vxn = pd.DataFrame({"^VXN": np.clip(25 + np.cumsum(rng.normal(0, 1, n)) * 0.4, 9, None)},
+                       index=idx)
+    qqq = pd.DataFrame({"QQQ": 100 * np.exp(np.cumsum(rng.standard_t(3, n) * 0.015))},
+                       index=idx)
+    return PriceHistory(idx, vxn, qqq)
+
+
+@pytest.mark.parametrize("vol,t_years", [(0.15, 0.25), (0.45, 0.1), (0.8, 1.0)])
+def test_vectorized_bsm_matches_py_vollib(vol, t_years):
+    spots = np.array([80.0, 100.0, 125.0])
+    np.testing.assert_allclose(bsm.put(spots, 100.0, vol, t_years),
+                               [black_scholes("p", s, 100.0, t_years, 0.0, vol) for s in spots],
+                               rtol=1e-9)
+    np.testing.assert_allclose(bsm.straddle(spots, vol, t_years),
+                               [black_scholes("c", s, s, t_years, 0.0, vol)
+                                + black_scholes("p", s, s, t_years, 0.0, vol) for s in spots],
+                               rtol=1e-9)
+    wing = black_scholes("p", 321.0, 0.75 * 321.0, t_years, 0.0, vol + SKEW[0.25] / 100.0)
+    body = (black_scholes("c", 321.0, 321.0, t_years, 0.0, vol)
+            + black_scholes("p", 321.0, 321.0, t_years, 0.0, vol))
+    ratio = BSMEngine().wing_ratios(vol, SKEW, t_years, [0.25])[0.25]
+    assert ratio == pytest.approx(wing / body)
+
+
+def test_degenerate_vol_or_tenor_prices_intrinsic():
+    np.testing.assert_allclose(bsm.put([90.0, 110.0], 100.0, 0.0, 0.25), [10.0, 0.0])
+    np.testing.assert_allclose(bsm.call([90.0, 110.0], 100.0, 0.2, 0.0), [0.0, 10.0])
+
+
+def test_rank_tree_counts_and_order_statistics():
+    tree = RankTree(10)
+    for rank in (3, 7, 3, 0, 9):
+        tree.add(rank)
+    assert tree.below(3) == 1 and tree.below(4) == 3 and tree.below(10) == 5
+    assert [tree.kth(k) for k in range(5)] == [0, 3, 3, 7, 9]
+    tree.add(3, -1)
+    assert [tree.kth(k) for k in range(4)] == [0, 3, 7, 9]
+    with pytest.raises(IndexError):
+        tree.kth(4)
+
+
+@pytest.mark.parametrize("window", [None, 50])
+def test_walk_forward_percentiles_match_sorting_the_prior_values(window):
+    values = np.random.default_rng(2).lognormal(size=400)
+    values[[10, 200]] = np.nan
+    values[300] = values[299]  # a tie
+    share, qs = walk_forward_percentiles(values, (25.0, 50.0), window)
+    prior_of = lambda t: values[:t][np.isfinite(values[:t])][-window if window else 0:]
+    for t in (1, 2, 49, 50, 51, 201, 300, 399):
+        prior = prior_of(t)
+        assert share[t] == pytest.approx((prior < values[t]).mean())
+        assert qs[25.0][t] == pytest.approx(np.percentile(prior, 25))
+        assert qs[50.0][t] == pytest.approx(np.percentile(prior, 50))
+    assert np.isnan(share[0]) and np.isnan(share[10]) and np.isnan(qs[25.0][200])
+
+
+def test_percentile_of_empty_tree_is_nan():
+    assert np.isnan(percentile_at(RankTree(3), np.arange(3.0), 25))
+
+
+def test_each_date_is_judged_against_the_prior_ratios_only():
+    history = _history()
+    days = walk_forward(history, SKEW[0.25], t_days=90, min_history=100)
+    for t in (100, 400, 899):
+        day = days.index[t]
+        prior = [r for d, r in zip(days.index, days["ratio"]) if d < day]
+        q25 = np.percentile(prior, 25)
+        assert days["q25"].iloc[t] == pytest.approx(q25)
+        assert days["cheap"].iloc[t] == (_verdict(days["ratio"].iloc[t], q25)
+                                         == "CHEAP - buy the tail")
+    assert not days["cheap"].iloc[:100].any()
+    assert days["cheap"].any() and not days["cheap"].all()
+
+
+def test_unpriced_ratios_do_not_count_toward_the_prior_sample():
+    class GappedEngine(BSMEngine):
+        def wing_ratios(self, atm_vols, skew, t_years, levels):
+            ratios = super().wing_ratios(atm_vols, skew, t_years, levels)
+            for ratio in ratios.values():
+                ratio[:50] = np.nan
+            return ratios
+
+    days = walk_forward(_history(), SKEW[0.25], min_history=100, engine=GappedEngine())
+    assert not days["scored"].iloc[:150].any()
+    assert days["scored"].iloc[150:].all()
+    prior = days["ratio"].iloc[50:150]
+    assert days["percentile"].iloc[150] == pytest.approx(
+        (prior < days["ratio"].iloc[150]).mean())
+
+
+def test_puts_settle_at_the_close_on_or_after_expiry():
+    history = _history()
+    days = walk_forward(history, SKEW[0.25], t_days=90)
+    first = days.iloc[0]
+    settle_day = days.index[days.index >= days.index[0] + pd.Timedelta(days=90)][0]
+    assert first["settle"] == pytest.approx(days.loc[settle_day, "spot"])
+    assert first["payoff"] == pytest.approx(max(first["strike"] - first["settle"], 0.0))
+    assert first["cost"] == pytest.approx(black_scholes(
+        "p", first["spot"], 0.75 * first["spot"], 90 / 365.0, 0.0, first["vol"] + 0.08))
+    assert not days["expired"].iloc[-1] and np.isnan(days["settle"].iloc[-1])
+
+
+def test_walk_forward_prices_with_the_chosen_engine():
+    history = _history()
+    engine = StudentTEngine()
+    bsm_days = walk_forward(history, SKEW[0.25])
+    t_days = walk_forward(history, SKEW[0.25], engine=engine)
+    t_years = 90 / 365.0
+    np.testing.assert_allclose(
+        t_days["ratio"], engine.wing_ratios(t_days["vol"], SKEW, t_years, [0.25])[0.25])
+    np.testing.assert_allclose(
+        t_days["cost"], t_days["spot"] * engine.put(0.75, t_days["vol"] + 0.08, t_years))
+    assert not np.allclose(t_days["ratio"], bsm_days["ratio"])
+    assert walk_forward(history, SKEW[0.25], engine="student-t")["ratio"].equals(t_days["ratio"])
+
+
+def test_summary_splits_the_rule_from_every_day_and_formats():
+    days = walk_forward(_history(), SKEW[0.25])
+    table = summary(days)
+    assert list(table.index) == ["CHEAP", "not cheap", "every day"]
+    assert table.loc["CHEAP", "trades"] + table.loc["not cheap", "trades"] \
+        == table.loc["every day", "trades"]
+    cheap = days[days["scored"] & days["cheap"] & days["expired"]]
+    assert table.loc["CHEAP", "hit_rate"] == pytest.approx((cheap["payoff"] > cheap["cost"]).mean())
+    assert table.loc["CHEAP", "payoff_per_premium"] == pytest.approx(
+        cheap["payoff"].sum() / cheap["cost"].sum())
+    lines = format_summary(table, days).splitlines()
+    assert len(lines) == 2 + 3
+    assert lines[2].startswith("CHEAP")
@@ -0,0 +1,112 @@
+"""
+Test the tail Monte Carlo: each draw method reproduces what it was fitted on,
+the paths depend only on the seed (not on the number of workers), and on
+Gaussian returns the simulated put and straddle land on BSM.
+"""
+import math
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from fentu.pricingservices import bsm
+from fentu.pricingservices.tail_montecarlo import (
+    Bootstrap,
+    PowerLawTails,
+    StudentT,
+    _chunks,
+    format_summary,
+    mle_alpha,
+    payoffs,
+    simulate_growth,
+    summarize,
+)
+
+
+def _returns(n=5000, seed=11):
+    return np.random.default_rng(seed).standard_t(3, size=n) * 0.011 + 0.0004
+
+
+def test_paths_depend_on_the_seed_not_on_the_workers():
+    method = Bootstrap.from_returns(_returns())
+    inline = simulate_growth(method, 10_000, 21, seed=7, chunk_size=3000, jobs=1)
+    pooled = simulate_growth(method, 10_000, 21, seed=7, chunk_size=3000, jobs=2)
+    np.testing.assert_array_equal(inline, pooled)
+    assert len(inline) == 10_000
+    other = simulate_growth(method, 10_000, 21, seed=8, chunk_size=3000, jobs=1)
+    assert not np.array_equal(inline, other)
+    assert _chunks(10_000, 3000) == [3000, 3000, 3000, 1000]
+
+
+@pytest.mark.parametrize("method", [Bootstrap, StudentT, PowerLawTails])
+def test_centered_growth_is_a_martingale(method):
+    fitted = method.from_returns(_returns(20_000))
+    growth = simulate_growth(fitted, 50_000, 63, seed=3, jobs=1)
+    assert growth.mean() == pytest.approx(1.0, abs=1e-12)
+    drifting = method.from_returns(_returns(20_000), center=False)
+    assert simulate_growth(drifting, 50_000, 63, seed=3, jobs=1).mean() > 1.01
+
+
+def test_bootstrap_resamples_the_centered_history():
+    returns = _returns()
+    method = Bootstrap.from_returns(returns)
+    draws = method.draw(np.random.default_rng(0), (200, 50))
+    assert np.isin(draws, returns - returns.mean()).all()
+    kept = Bootstrap.from_returns(returns, center=False)
+    assert np.isin(kept.draw(np.random.default_rng(0), (10,)), returns).all()
+
+
+def test_student_t_is_the_plotting_service_fit():
+    returns = _returns()
+    df, loc, scale = stats.t.fit(returns)
+    fitted = StudentT.from_returns(returns, center=False)
+    assert (fitted.df, fitted.loc, fitted.scale) == pytest.approx((df, loc, scale))
+    assert StudentT.from_returns(returns).loc == 0.0
+
+
+def test_student_t_draws_are_truncated():
+    method = StudentT(2.2, 0.0, 0.05)
+    draws = method.draw(np.random.default_rng(4), (200, 250))
+    assert np.abs(draws).max() == 1.0
+
+
+def test_mle_alpha_recovers_a_pareto_exponent():
+    rng = np.random.default_rng(3)
+    x = 0.02 * (1.0 - rng.random(50_000)) ** (-1.0 / 2.5)  # density ~ x^-3.5
+    assert mle_alpha(x, 0.02) == pytest.approx(3.5, abs=0.05)
+    assert math.isnan(mle_alpha([0.03], 0.02))
+
+
+def test_power_law_tails_beyond_the_quantiles():
+    method = PowerLawTails.from_returns(_returns(20_000))
+    assert 2.5 < method.alpha_left < 5.0 and 2.5 < method.alpha_right < 5.0
+    draws = method.draw(np.random.default_rng(1), (400, 250)).ravel()
+    left, right = draws < -method.left_threshold, draws > method.right_threshold
+    assert left.mean() == pytest.approx(0.05, abs=0.005)
+    assert right.mean() == pytest.approx(0.05, abs=0.005)
+    assert np.abs(draws).max() <= 1.0
+    with pytest.raises(ValueError):
+        PowerLawTails(method.body, 0.02, 0.02, 0.9, 3.0)
+
+
+def test_gaussian_paths_price_like_bsm():
+    vol, days = 0.25, 63
+    daily = np.random.default_rng(5).normal(-0.5 * vol ** 2 / 252, vol / math.sqrt(252), 200_000)
+    growth = simulate_growth(Bootstrap.from_returns(daily, center=False), 200_000, days,
+                             seed=2, jobs=1)
+    rows, ratio = summarize(growth, vol, days)
+    assert rows["straddle"]["mean"] == pytest.approx(bsm.straddle(1.0, vol, days / 252), rel=0.02)
+    assert rows["put"]["mean"] == pytest.approx(bsm.put(1.0, 0.75, vol, days / 252), rel=0.1)
+    assert ratio["simulated"] == pytest.approx(ratio["bsm"], rel=0.1)
+
+
+def test_payoffs_and_report():
+    growth = np.array([0.5, 0.75, 1.0, 1.4])
+    out = payoffs(growth)
+    np.testing.assert_allclose(out["put"], [0.25, 0.0, 0.0, 0.0])
+    np.testing.assert_allclose(out["straddle"], [0.5, 0.25, 0.0, 0.4])
+    rows, ratio = summarize(growth, 0.3)
+    assert rows["put"]["itm"] == 0.25
+    lines = format_summary(rows, ratio, "bootstrap", 4, 0.3).splitlines()
+    assert lines[2].startswith("25% put") and lines[3].startswith("straddle")
+    assert lines[-1].startswith("wing / body ratio")
@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 ANNUAL_RATIOS_2016_2026 = [0.05 + 0.01 * i for i in range(10)]
 
@@ -8,4 +9,44 @@ def test_percentile_25th_known_series():
 
 
 def test_percentile_75th_known_series():
-    assert round(np.percentile(ANNUAL_RATIOS_2016_2026, 75), 4) == 0.1175
\ No newline at end of file
+    assert round(np.percentile(ANNUAL_RATIOS_2016_2026, 75), 4) == 0.1175
+
+def test_sorted_sample_tracks_np_percentile_as_dates_are_appended():
+    from fentu.pricingservices.order_statistics import SortedSample
+
+    values = np.random.default_rng(4).lognormal(-3, 0.5, size=300)
+    sample = SortedSample()
+    for t, value in enumerate(values, start=1):
+        sample.append(value)
+        if t in (1, 2, 3, 10, 99, 300):
+            for q in (25, 50, 75):
+                assert sample.percentile(q) == pytest.approx(np.percentile(values[:t], q))
+            today = values[t - 1] * 0.9
+            assert sample.rank_share(today) == pytest.approx((values[:t] < today).mean())
+    sample.append(float("nan"))
+    assert len(sample) == 300
+
+
+def test_decision_bands_and_rank_come_from_one_sample():
+    from unittest.mock import MagicMock
+
+    from fentu.pricingservices.tail_plot import (
+        DECISION_LEVEL,
+        _plot_decision_annotations,
+        _rank_display,
+        decision_sample,
+    )
+
+    ratios = [0.03, float("nan")] + ANNUAL_RATIOS_2016_2026
+    series = {DECISION_LEVEL: [(i, r) for i, r in enumerate(ratios)]}
+    ax = MagicMock()
+    q25 = _plot_decision_annotations(ax, series)
+    assert q25 == pytest.approx(np.percentile([0.03] + ANNUAL_RATIOS_2016_2026, 25))
+    assert [c.args[0] for c in ax.axhline.call_args_list][1:] == pytest.approx(
+        [np.percentile([0.03] + ANNUAL_RATIOS_2016_2026, q) for q in (50, 75)])
+    rank = decision_sample(series).rank_share(0.065)
+    assert rank == pytest.approx(3 / 11)
+    assert _rank_display(rank) == "pct rank 27%"
+    assert _rank_display(float("nan")) == "pct rank n/a"
+    nan_rank = decision_sample(series).rank_share(float("nan"))  # a NaN live quote
+    assert _rank_display(nan_rank) == "pct rank n/a"
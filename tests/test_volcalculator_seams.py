@@ -27,6 +27,7 @@ from fentu.explatoryservices.volcalculator import (
     ReturnsRepository,
     MarketClock,
     VolatilityDashboard,
+    project_columns,
 )
 
 
@@ -118,6 +119,69 @@ class TestReturnsRepositoryWindowing:
         assert (out.index > pd.Timestamp("2025-06-01")).any()
 
 
+class TestReturnsRepositoryProjection:
+    """columns= / dtype=: keep only what the caller reads, compactly."""
+
+    @pytest.fixture
+    def history(self):
+        index = pd.bdate_range("2024-01-01", periods=300, tz="America/New_York")
+        rng = np.random.default_rng(1)
+        close = 100 + np.cumsum(rng.normal(0, 1, len(index)))
+        return pd.DataFrame({
+            "Open": close, "High": close + 1, "Low": close - 1, "Close": close,
+            "Volume": rng.integers(1, 10**6, len(index)),
+            "Dividends": 0.0, "Stock Splits": 0.0,
+        }, index=index)
+
+    def _fetch(self, repo, frame):
+        with patch("fentu.explatoryservices.volcalculator.requests.Session"):
+            with patch("fentu.explatoryservices.volcalculator.yf.Ticker") as m:
+                m.return_value = MagicMock(history=MagicMock(return_value=frame))
+                return repo._raw_open_high_low_close("FAKE")
+
+    def test_default_keeps_the_full_feed_frame(self, history):
+        out = self._fetch(ReturnsRepository(), history)
+        assert list(out.columns) == list(history.columns)
+
+    def test_projection_keeps_only_requested_columns_as_float32(self, history):
+        repo = ReturnsRepository(columns=("High", "Low", "Close"), dtype="float32")
+        out = self._fetch(repo, history)
+        assert list(out.columns) == ["High", "Low", "Close"]
+        assert (out.dtypes == np.float32).all()
+        assert out.index.tz is None
+        np.testing.assert_allclose(out["Close"], history["Close"], rtol=1e-6)
+
+    def test_projection_owns_its_data(self, history):
+        frame = history.drop(columns=["Volume"])
+        out = project_columns(frame, ("Close",))
+        assert not np.shares_memory(out.to_numpy(), frame["Close"].to_numpy())
+
+    def test_get_prices_through_a_close_only_repository(self, history):
+        repo = ReturnsRepository(columns=("Close",))
+        with patch("fentu.explatoryservices.volcalculator.requests.Session"):
+            with patch("fentu.explatoryservices.volcalculator.yf.Ticker") as m:
+                m.return_value = MagicMock(history=MagicMock(return_value=history))
+                prices = repo.get_prices("FAKE")
+        assert len(prices) == len(history)
+
+    def test_wide_projection_picks_fields_on_one_shared_index(self):
+        index = pd.bdate_range("2024-01-01", periods=10)
+        wide = pd.concat({
+            field: pd.DataFrame({"USO": np.arange(10.0), "GLD": np.arange(10.0) * 2},
+                                index=index)
+            for field in ("Open", "High", "Low", "Close", "Volume")}, axis=1)
+        out = project_columns(wide, ("High", "Low", "Close"), "float32")
+        assert list(out.columns.get_level_values(0).unique()) == ["High", "Low", "Close"]
+        assert list(out["Close"].columns) == ["USO", "GLD"]
+        assert out.index.equals(index)
+        assert out.to_numpy().dtype == np.float32
+
+    def test_projection_of_an_empty_failed_response(self):
+        empty = pd.DataFrame({"Close": pd.Series(dtype=float)},
+                             index=pd.Index([], dtype=object))
+        assert project_columns(empty, ("Close",), "float32").empty
+
+
 class TestFacadeReturnsAreLazy:
     """Returns are computed on first access, not in __init__."""
 
@@ -54,7 +54,7 @@ class TestTimeRange:
 
     def test_seechange_cli_passes_date_range(self):
         """Test that seechange CLI correctly parses and passes date range"""
-        with patch('fentu.explatoryservices.seechange.VolatilityFacade') as mock_facade_class:
+        with patch('fentu.explatoryservices.volcalculator.VolatilityFacade') as mock_facade_class:
             mock_instance = MagicMock()
             mock_facade_class.return_value = mock_instance
 
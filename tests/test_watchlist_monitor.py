@@ -0,0 +1,124 @@
+"""
+Test the watchlist monitor: one vectorized pass over a wide closes frame gives
+every name the reading its 2x2 PortfolioMonitor panel would, the ranking is a
+table, and the heat grid keeps the names in their fixed positions.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+import matplotlib
+matplotlib.use("Agg")  # headless rendering for tests
+import matplotlib.pyplot as plt
+
+from fentu.explatoryservices.portfolio_monitor import PortfolioMonitor
+from fentu.explatoryservices.watchlist_monitor import (
+    format_table,
+    grid_shape,
+    plot_heat_grid,
+    ranked,
+    signal_table,
+    watchlist_report,
+)
+
+
+def _watchlist(t3_closes, n_tickers=6, n_days=500):
+    # T1 listed later, T2 through a two-week suspension
+    gaps = {1: slice(None, 200), 2: slice(300, 310)} if n_tickers > 2 else None
+    return t3_closes(n_tickers, n_days, seed=1, gaps=gaps)
+
+
+class OneTicker:
+    def __init__(self, closes):
+        self.closes = closes
+
+    def get_prices(self, ticker):
+        return self.closes[ticker].dropna()
+
+
+@pytest.mark.parametrize("period", ["daily", "weekly", "monthly", "yearly"])
+def test_rows_match_the_per_holding_panels(period, t3_closes):
+    closes = _watchlist(t3_closes)
+    table = signal_table(closes, period=period)
+    monitor = PortfolioMonitor(holdings=[(t, t) for t in closes.columns],
+                               period=period, repository=OneTicker(closes))
+    for panel in monitor.prepare_panels():
+        row = table.loc[panel["label"]]
+        assert row.last_move == pytest.approx(panel["last_move"])
+        assert row.usual == pytest.approx(panel["usual"], nan_ok=True)
+        assert row.n_calibration == panel["n_calibration"]
+        assert row.signal == panel["signal"]
+        assert row.last_price == pytest.approx(panel["last_price"])
+
+
+def test_labels_order_and_unavailable_names(t3_closes):
+    closes = _watchlist(t3_closes, n_tickers=2)
+    table = signal_table(closes, [("B", "T1"), ("GONE", "XXX"), ("A", "T0")])
+    assert list(table.index) == ["B", "GONE", "A"]  # fixed positions, not ranked
+    assert np.isnan(table.loc["GONE", "multiple"])
+    assert not table.loc["GONE", "signal"]
+
+
+def test_significance_is_quadratic_and_ranking_is_by_significance(t3_closes):
+    closes = _watchlist(t3_closes, n_tickers=12)
+    table = signal_table(closes)
+    assert np.allclose(table["significance"], table["multiple"] ** 2, equal_nan=True)
+    order = ranked(table, show_all=True)["significance"].dropna().to_numpy()
+    assert (np.diff(order) <= 0).all()
+    assert ranked(table)["signal"].all()
+
+
+def test_format_table_lists_signals_first(t3_closes):
+    closes = _watchlist(t3_closes, n_tickers=2, n_days=60)
+    closes.iloc[-1] = closes.iloc[-2] * [1.20, 1.0001]  # T0 jumps, T1 flat
+    text = format_table(signal_table(closes))
+    assert text.splitlines()[1].startswith("T0 ")
+    assert "SIGNAL" in text
+    assert "T1" not in text
+
+
+def test_heat_grid_is_one_image_with_a_label_per_cell(t3_closes):
+    table = signal_table(_watchlist(t3_closes, n_tickers=41))
+    fig, ax = plt.subplots()
+    plot_heat_grid(ax, table)
+    plt.close(fig)
+    assert grid_shape(41) == (6, 7)
+    assert len(ax.images) == 1 and ax.images[0].get_array().shape[:2] == (6, 7)
+    assert [t.get_text().split("\n")[0] for t in ax.texts] == list(table.index)
+
+
+def test_report_never_raises_on_a_failed_fetch():
+    class Down:
+        def try_fetch_wide_open_high_low_close(self, tickers):
+            return None
+
+    assert watchlist_report(repository=Down()) == ("watchlist unavailable", None)
+
+
+def test_report_reads_one_bulk_fetch(t3_closes):
+    closes = _watchlist(t3_closes, n_tickers=3)
+    calls = []
+
+    class Wide:
+        def try_fetch_wide_open_high_low_close(self, tickers):
+            calls.append(list(tickers))
+            return pd.concat({"Close": closes}, axis=1)
+
+    report, table = watchlist_report([("T0", "T0"), ("T2", "T2"), ("X", "X")],
+                                     repository=Wide(), show_all=True)
+    assert calls == [["T0", "T2", "X"]]
+    assert report.splitlines()[-1] == "X unavailable"
+    assert list(table.index) == ["T0", "T2", "X"]
+
+
+def test_pages_keep_each_name_in_a_fixed_cell(t3_closes):
+    from fentu.explatoryservices.watchlist_monitor import pages, render
+
+    table = signal_table(_watchlist(t3_closes, n_tickers=100, n_days=80))
+    assert pages(100, 48) == 3
+    fig = render(table, page=2, page_size=48)
+    plt.close(fig)
+    ax = fig.axes[0]
+    assert ax.images[0].get_array().shape[:2] == grid_shape(48)
+    assert [t.get_text().split("\n")[0] for t in ax.texts] == list(table.index[96:])
+    assert "(page 3/3)" in ax.get_title()
@@ -0,0 +1,191 @@
+"""
+Test the xingjian warm pool: a saved file runs in a fork of a warm parent and
+the verdict contract is unchanged — exit 0 is green, anything else is red, a
+hung file is killed after RUN_TIMEOUT with 124 (the cold runner's code).
+
+The pool forks the test process itself; WARM_MODULES is emptied so the warm
+parents start instantly (what they pre-import does not change any verdict).
+"""
+import os
+import threading
+
+import pytest
+
+import xingjian
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork")
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    monkeypatch.setattr(xingjian, "WARM_MODULES", ())
+    warm = xingjian.WarmPool(size=1)
+    yield warm
+    warm.close()
+
+
+def _script(tmp_path, name, body):
+    path = tmp_path / name
+    path.write_text(body)
+    return path
+
+
+def test_passing_asserts_are_green(pool, tmp_path):
+    path = _script(tmp_path, "ok.py", "assert 1 + 1 == 2\n")
+    assert pool.run(path) == 0
+
+
+def test_failing_assert_is_red(pool, tmp_path):
+    path = _script(tmp_path, "bad.py", "assert 1 + 1 == 3\n")
+    assert pool.run(path) == 1
+
+
+def test_sys_exit_code_is_preserved(pool, tmp_path):
+    path = _script(tmp_path, "exit3.py", "import sys\nsys.exit(3)\n")
+    assert pool.run(path) == 3
+
+
+def test_file_runs_as_main_from_its_own_directory(pool, tmp_path):
+    _script(tmp_path, "sibling.py", "VALUE = 7\n")
+    path = _script(
+        tmp_path, "main.py",
+        "import sibling\nassert __name__ == '__main__'\nassert sibling.VALUE == 7\n")
+    assert pool.run(path) == 0
+
+
+def test_each_run_starts_from_the_warm_parent_not_the_last_run(pool, tmp_path):
+    _script(tmp_path, "mod.py", "VALUE = 1\n")
+    first = _script(tmp_path, "first.py",
+                    "import mod\nassert mod.VALUE == 1\nmod.VALUE = 2\n")
+    second = _script(tmp_path, "second.py", "import mod\nassert mod.VALUE == 1\n")
+    assert pool.run(first) == 0
+    assert pool.run(second) == 0
+
+
+def test_hung_file_is_killed_with_124(monkeypatch, tmp_path):
+    monkeypatch.setattr(xingjian, "WARM_MODULES", ())
+    monkeypatch.setattr(xingjian, "RUN_TIMEOUT", 0.3)
+    warm = xingjian.WarmPool(size=1)
+    try:
+        path = _script(tmp_path, "hang.py", "import time\ntime.sleep(30)\n")
+        assert warm.run(path) == 124
+    finally:
+        warm.close()
+
+
+def test_dead_worker_falls_back_to_a_cold_run(pool, tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(xingjian, "run_file_cold",
+                        lambda path, as_main=True: calls.append(path) or 0)
+    os.kill(pool._workers[0].pid, 9)
+    os.waitpid(pool._workers[0].pid, 0)
+    path = _script(tmp_path, "ok.py", "assert True\n")
+    assert pool.run(path) == 0
+    assert calls == [path]
+
+
+# ---------------------------------------------------------------------------
+# Dependency-aware, concurrent verdicts
+# ---------------------------------------------------------------------------
+
+
+def _tree(tmp_path, files):
+    for name, body in files.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(body)
+    return xingjian.snapshot(tmp_path)
+
+
+def test_dependents_are_transitive_importers(tmp_path):
+    modification_times = _tree(tmp_path, {
+        "pkg/__init__.py": "",
+        "pkg/a.py": "X = 1\n",
+        "pkg/b.py": "from pkg.a import X\n",
+        "c.py": "import pkg.b\n",
+        "unrelated.py": "import os\n",
+    })
+    graph = xingjian.ImportGraph(tmp_path)
+    dependents = graph.dependents(
+        [tmp_path / "pkg/a.py"], modification_times, tmp_path / "xingjian.py")
+    assert dependents == [tmp_path / "c.py", tmp_path / "pkg/b.py"]
+
+
+def test_relative_and_submodule_imports_resolve(tmp_path):
+    modification_times = _tree(tmp_path, {
+        "pkg/__init__.py": "",
+        "pkg/a.py": "X = 1\n",
+        "pkg/b.py": "from . import a\n",
+        "pkg/c.py": "from .a import X\n",
+    })
+    graph = xingjian.ImportGraph(tmp_path)
+    dependents = graph.dependents(
+        [tmp_path / "pkg/a.py"], modification_times, tmp_path / "xingjian.py")
+    assert dependents == [tmp_path / "pkg/b.py", tmp_path / "pkg/c.py"]
+
+
+def test_package_init_change_rechecks_its_importers(tmp_path):
+    modification_times = _tree(tmp_path, {
+        "pkg/__init__.py": "",
+        "pkg/a.py": "X = 1\n",
+        "user.py": "from pkg.a import X\n",
+    })
+    graph = xingjian.ImportGraph(tmp_path)
+    dependents = graph.dependents(
+        [tmp_path / "pkg/__init__.py"], modification_times,
+        tmp_path / "xingjian.py")
+    assert tmp_path / "user.py" in dependents
+
+
+def test_dependent_runs_its_body_but_not_its_main_block(pool, tmp_path):
+    path = _script(
+        tmp_path, "cli.py",
+        "assert True\nif __name__ == '__main__':\n    raise SystemExit(1)\n")
+    assert pool.run(path, as_main=False) == 0
+    assert pool.run(path, as_main=True) == 1
+
+
+def test_cold_dependent_runs_its_body_but_not_its_main_block(tmp_path):
+    path = _script(
+        tmp_path, "cli.py",
+        "assert True\nif __name__ == '__main__':\n    raise SystemExit(1)\n")
+    assert xingjian.run_file_cold(path, as_main=False) == 0
+    assert xingjian.run_file_cold(path, as_main=True) == 1
+
+
+def test_one_red_file_makes_the_whole_save_red(monkeypatch, tmp_path):
+    verdicts = {"a.py": 0, "b.py": 1, "c.py": 0}
+    monkeypatch.setattr(xingjian, "run_file",
+                        lambda path, pool, as_main: verdicts[path.name])
+    reverted, committed = [], []
+    monkeypatch.setattr(xingjian, "revert_red", lambda: reverted.append(True))
+    monkeypatch.setattr(xingjian, "commit_green", committed.append)
+    paths = [tmp_path / name for name in verdicts]
+
+    xingjian.long_convexity_commit_revert_cycle(
+        paths[:1], dependents=paths[1:], jobs=3)
+
+    assert reverted == [True] and committed == []
+
+
+def test_all_green_commits_once(monkeypatch, tmp_path):
+    monkeypatch.setattr(xingjian, "run_file", lambda path, pool, as_main: 0)
+    committed = []
+    monkeypatch.setattr(xingjian, "commit_green", committed.append)
+
+    xingjian.long_convexity_commit_revert_cycle(
+        [tmp_path / "a.py"], dependents=[tmp_path / "b.py"], jobs=2)
+
+    assert len(committed) == 1
+
+
+def test_concurrent_runs_overlap(monkeypatch, tmp_path):
+    barrier = threading.Barrier(3, timeout=5)
+
+    def run_file(path, pool, as_main):
+        barrier.wait()  # deadlocks (BrokenBarrierError) if runs are serial
+        return 0
+
+    monkeypatch.setattr(xingjian, "run_file", run_file)
+    runs = [(tmp_path / f"{i}.py", True) for i in range(3)]
+    assert xingjian.run_concurrently(runs, jobs=3) == []
@@ -3,7 +3,8 @@
 Xingjian: assertion watcher.
 
 Run this in a terminal while you edit. On every save of a .py file it executes
-that file so its top-level `assert` statements are checked:
+that file — plus every file that imports it, directly or transitively — so
+their top-level `assert` statements are checked, concurrently across cores:
 
     all pass -> git add -A && git commit      (green: keep the work)
     any fail -> git reset --hard HEAD         (red: DELETE the change)
@@ -11,25 +12,50 @@ that file so its top-level `assert` statements are checked:
 The revert is the point: failing work is destroyed, forcing tiny steps.
 Ctrl-C to stop. No dependencies, no editor extensions.
 
+Saved files run in a fork of a warm parent that has already imported the heavy
+modules (numpy, pandas, matplotlib, ...), so a verdict costs a fork, not a
+fresh interpreter. Same contract: a non-zero exit is red, and one red file
+turns the whole save red.
+
     uv run xingjian.py              # foreground
     uv run xingjian.py --detach     # background; logs to .xingjian.log
     uv run xingjian.py --stop       # stop the background watcher
+    uv run xingjian.py --cold       # fresh interpreter per file (no warm pool)
+    uv run xingjian.py --jobs 4     # cap concurrent runs (default: all cores)
 """
 
 from __future__ import annotations
 
 import argparse
+import ast
+import importlib
 import os
+import queue
+import runpy
 import signal
 import subprocess
 import sys
 import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 
 IGNORE_DIRS = {".git", ".venv", "__pycache__", ".pytest_cache", ".mypy_cache"}
 POLL_SECONDS = 0.5
 SETTLE_SECONDS = 0.8
 RUN_TIMEOUT = 15.0
+WAIT_POLL_SECONDS = 0.005
+# Imported once by each warm parent so a saved file only pays for a fork.
+# Third-party only: project modules must be re-read from disk on every save.
+WARM_MODULES = ("numpy", "pandas", "scipy.stats", "matplotlib.pyplot")
+# Dependents are re-checked as modules, not scripts: importing a changed module
+# must not fire an importer's CLI (seechange with no argv exits 1 = false red).
+DEPENDENT_RUN_NAME = "__xingjian_dependent__"
+DEPENDENT_RUNNER = (
+    "import os, runpy, sys; path = sys.argv[1]; sys.argv = [path]; "
+    "sys.path[0] = os.path.dirname(os.path.abspath(path)); "
+    f"runpy.run_path(path, run_name={DEPENDENT_RUN_NAME!r})"
+)
 COMMIT_MESSAGE = "xingjian: working %H:%M:%S"
 PID_FILE = Path(".xingjian.pid")
 LOG_FILE = Path(".xingjian.log")
@@ -59,19 +85,309 @@ def snapshot(root: Path) -> dict:
     return modification_times
 
 
-def run_file(path: Path) -> int:
-    """Execute a saved file so its top-level asserts are checked."""
-    print(f"xingjian: scanning assertions in {path.name} ...")
+def run_file(path: Path, pool=None, as_main=True) -> int:
+    """Execute a saved file so its top-level asserts are checked.
+
+    With a `WarmPool` the file runs in a fork of a warm parent; without one
+    (``--cold``, or no fork on this OS) it runs in a fresh interpreter.
+    `as_main=False` re-checks a dependent: its body runs, its
+    ``if __name__ == "__main__"`` block does not.
+    """
+    role = "" if as_main else " (dependent)"
+    print(f"xingjian: scanning assertions in {path.name}{role} ...")
+    if pool is not None:
+        return pool.run(path, as_main)
+    return run_file_cold(path, as_main)
+
+
+def run_file_cold(path: Path, as_main=True) -> int:
+    """Execute `path` in a fresh `sys.executable` (full interpreter startup)."""
+    command = ([sys.executable, str(path)] if as_main
+               else [sys.executable, "-c", DEPENDENT_RUNNER, str(path)])
     try:
-        return subprocess.run(
-            [sys.executable, str(path)],
-            timeout=RUN_TIMEOUT,
-        ).returncode
+        return subprocess.run(command, timeout=RUN_TIMEOUT).returncode
     except subprocess.TimeoutExpired:
-        print(f"xingjian: {path.name} did not exit within {RUN_TIMEOUT:g}s")
+        report_timeout(path)
         return 124
 
 
+def report_timeout(path: Path):
+    print(f"xingjian: {path.name} did not exit within {RUN_TIMEOUT:g}s")
+
+
+# ---------------------------------------------------------------------------
+# Warm pool: heavy imports paid once, every run is a fork of a warm parent.
+# ---------------------------------------------------------------------------
+
+
+def preimport(modules):
+    """Import what we can; a missing optional module just stays cold."""
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            pass
+
+
+def exit_code(status: int) -> int:
+    """subprocess-style return code from an os.waitpid status."""
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+def system_exit_code(exc: SystemExit) -> int:
+    """The interpreter's own mapping of sys.exit(arg) to a process exit code."""
+    if exc.code is None:
+        return 0
+    if isinstance(exc.code, int):
+        return exc.code
+    print(exc.code, file=sys.stderr)
+    return 1
+
+
+def execute_as_script(path: Path, run_name="__main__"):
+    """Child side of a warm run: behave like `python path`, then _exit."""
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    sys.argv = [str(path)]
+    sys.path[0] = str(path.parent)  # what `python path` puts first on sys.path
+    code = 0
+    try:
+        runpy.run_path(str(path), run_name=run_name)
+    except SystemExit as exc:
+        code = system_exit_code(exc)
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(code)
+
+
+def wait_with_timeout(pid: int, path: Path) -> int:
+    """Reap the forked run, killing it after RUN_TIMEOUT (exit 124, as cold)."""
+    deadline = time.monotonic() + RUN_TIMEOUT
+    while time.monotonic() < deadline:
+        done, status = os.waitpid(pid, os.WNOHANG)
+        if done:
+            return exit_code(status)
+        time.sleep(WAIT_POLL_SECONDS)
+    os.kill(pid, signal.SIGKILL)
+    os.waitpid(pid, 0)
+    report_timeout(path)
+    return 124
+
+
+def run_forked(path: Path, run_name="__main__") -> int:
+    pid = os.fork()
+    if pid == 0:
+        execute_as_script(path, run_name)
+    return wait_with_timeout(pid, path)
+
+
+def serve_warm(requests, replies):
+    """Warm-parent loop: one "<run_name>\\t<path>" per line in, one return
+    code per line out. Exits when the watcher closes the request pipe.
+    """
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)  # never unlink the watcher's pid file
+    signal.signal(signal.SIGINT, signal.SIG_IGN)   # Ctrl-C is the watcher's to handle
+    for line in requests:
+        run_name, _, path = line.rstrip("\n").partition("\t")
+        replies.write(f"{run_forked(Path(path), run_name)}\n")
+        replies.flush()
+    os._exit(0)
+
+
+class WarmWorker:
+    """One pre-forked warm parent, driven over a pair of pipes."""
+
+    def __init__(self, inherited_fds=()):
+        request_read, request_write = os.pipe()
+        reply_read, reply_write = os.pipe()
+        sys.stdout.flush()  # flush BEFORE fork so the child doesn't re-emit buffered lines
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:
+            # drop every watcher-side pipe end so EOF reaches each worker
+            for fd in (request_write, reply_read, *inherited_fds):
+                os.close(fd)
+            serve_warm(os.fdopen(request_read), os.fdopen(reply_write, "w"))
+        os.close(request_read)
+        os.close(reply_write)
+        self.pid = pid
+        self._requests = os.fdopen(request_write, "w", buffering=1)
+        self._replies = os.fdopen(reply_read)
+
+    def fds(self):
+        return (self._requests.fileno(), self._replies.fileno())
+
+    def run(self, path: Path, as_main=True) -> int:
+        run_name = "__main__" if as_main else DEPENDENT_RUN_NAME
+        self._requests.write(f"{run_name}\t{path}\n")
+        return int(self._replies.readline())  # '' (dead worker) -> ValueError
+
+    def close(self):
+        for pipe in (self._requests, self._replies):
+            try:
+                pipe.close()
+            except OSError:
+                pass
+        try:
+            os.waitpid(self.pid, 0)
+        except ChildProcessError:
+            pass
+
+
+class WarmPool:
+    """Pre-forked warm parents; `run` borrows an idle one per file, so up to
+    `size` files run at once (`run` is safe to call from several threads).
+
+    The heavy modules are imported here, BEFORE forking, so every worker
+    shares those pages copy-on-write instead of paying for its own copy.
+    A worker that dies is replaced by a cold slot (fresh interpreter), so a
+    broken pool degrades to the old behaviour instead of a wrong verdict.
+    """
+
+    def __init__(self, size=1):
+        preimport(WARM_MODULES)
+        self._workers = []
+        for _ in range(size):
+            inherited = [fd for worker in self._workers for fd in worker.fds()]
+            self._workers.append(WarmWorker(inherited))
+        self._idle = queue.Queue()
+        for worker in self._workers:
+            self._idle.put(worker)
+
+    def run(self, path: Path, as_main=True) -> int:
+        worker = self._idle.get()
+        try:
+            if worker is not None:
+                return worker.run(path, as_main)
+        except (OSError, ValueError):
+            print("xingjian: warm worker died; running this file cold")
+            worker.close()
+            worker = None
+        finally:
+            self._idle.put(worker)
+        return run_file_cold(path, as_main)
+
+    def close(self):
+        for worker in self._workers:
+            worker.close()
+
+
+def start_warm_pool(args):
+    """A WarmPool with one worker per job, or None when --cold or the OS
+    cannot fork."""
+    if args.cold or not hasattr(os, "fork"):
+        return None
+    return WarmPool(size=args.jobs)
+
+
+# ---------------------------------------------------------------------------
+# Reverse import graph: who must be re-checked when a module changes.
+# ---------------------------------------------------------------------------
+
+
+def module_name(path: Path, root: Path) -> str | None:
+    """Dotted module name of `path` relative to `root` (package -> __init__)."""
+    try:
+        parts = list(path.relative_to(root).with_suffix("").parts)
+    except ValueError:
+        return None
+    if parts and parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts) or None
+
+
+def resolve_import_from(node: ast.ImportFrom, package: str) -> str | None:
+    """Absolute base module of `from ... import ...` (relative levels resolved)."""
+    if node.level == 0:
+        return node.module
+    parts = package.split(".") if package else []
+    if node.level - 1 > len(parts):
+        return None
+    base = parts[:len(parts) - (node.level - 1)]
+    if node.module:
+        base.append(node.module)
+    return ".".join(base) or None
+
+
+def with_parent_packages(names):
+    """Importing a.b.c also executes a/__init__ and a/b/__init__."""
+    expanded = set()
+    for name in names:
+        parts = name.split(".")
+        expanded.update(".".join(parts[:i]) for i in range(1, len(parts) + 1))
+    return expanded
+
+
+def imported_modules(path: Path, name: str) -> set:
+    """Every module name `path` may import ("from a import b" may mean a.b)."""
+    try:
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    except (OSError, SyntaxError, UnicodeDecodeError, ValueError):
+        return set()
+    package = name if path.name == "__init__.py" else name.rpartition(".")[0]
+    found = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            found.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = resolve_import_from(node, package)
+            if base:
+                found.add(base)
+                found.update(f"{base}.{alias.name}" for alias in node.names)
+    return with_parent_packages(found)
+
+
+class ImportGraph:
+    """Reverse import graph of the watched tree.
+
+    Files are re-parsed only when their mtime moved, so a save costs one
+    parse per edited file, not one per file in the tree.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self._imports = {}  # path -> (mtime, imported module names)
+
+    def _imports_of(self, path: Path, mtime: int) -> set:
+        cached = self._imports.get(path)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, imported_modules(path, module_name(path, self.root) or ""))
+            self._imports[path] = cached
+        return cached[1]
+
+    def importers(self, modification_times: dict) -> dict:
+        """Map of path -> set of paths that import it directly."""
+        by_module = {}
+        for path in modification_times:
+            name = module_name(path, self.root)
+            if name:
+                by_module[name] = path
+        reverse = {}
+        for path, mtime in modification_times.items():
+            for name in self._imports_of(path, mtime):
+                target = by_module.get(name)
+                if target is not None and target != path:
+                    reverse.setdefault(target, set()).add(path)
+        return reverse
+
+    def dependents(self, changed, modification_times: dict, self_path: Path):
+        """Files importing any of `changed`, transitively; never the watcher
+        itself and never a file that is already in `changed`."""
+        reverse = self.importers(modification_times)
+        seen = set(changed)
+        frontier = list(changed)
+        while frontier:
+            for importer in reverse.get(frontier.pop(), ()):
+                if importer not in seen and importer.resolve() != self_path:
+                    seen.add(importer)
+                    frontier.append(importer)
+        return sorted(seen - set(changed))
+
+
 def git(*args: str) -> subprocess.CompletedProcess:
     return subprocess.run(["git", *args], capture_output=True, text=True)
 
@@ -103,13 +419,42 @@ def revert_red():
     print("   back to last green commit. take a smaller step!")
 
 
-def long_convexity_commit_revert_cycle(changed_files):
+def run_concurrently(runs, pool=None, jobs=1):
+    """Run every (path, as_main) at once, up to `jobs` in flight. Returns the
+    paths that went red; after the first red, runs not yet started are
+    cancelled — the verdict is already decided."""
+    failed = []
+    if not runs:
+        return failed
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        pending = {executor.submit(run_file, path, pool, as_main): path
+                   for path, as_main in runs}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                path = pending.pop(future)
+                if future.result() != 0:
+                    failed.append(path)
+            if failed:
+                for future in pending:
+                    future.cancel()
+    return failed
+
+
+def long_convexity_commit_revert_cycle(changed_files, pool=None,
+                                       dependents=(), jobs=1):
     print("\n--- save detected, scanning assertions ---")
-    for path in changed_files:
-        if run_file(path) != 0:
-            print(f"❌ red ({path.name} failed an assertion) → REVERTING your change")
-            revert_red()
-            return
+    if dependents:
+        names = ", ".join(path.name for path in dependents)
+        print(f"xingjian: also re-checking {len(dependents)} dependent(s): {names}")
+    runs = ([(path, True) for path in changed_files]
+            + [(path, False) for path in dependents])
+    failed = run_concurrently(runs, pool, jobs)
+    if failed:
+        names = ", ".join(path.name for path in failed)
+        print(f"❌ red ({names} failed an assertion) → REVERTING your change")
+        revert_red()
+        return
     commit_green(time.strftime(COMMIT_MESSAGE))
 
 
@@ -200,6 +545,17 @@ def parse_args():
         action="store_true",
         help="stop a background xingjian.py started with --detach",
     )
+    parser.add_argument(
+        "--cold",
+        action="store_true",
+        help="run each saved file in a fresh interpreter (no warm pool)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="files checked at once (default: one per core)",
+    )
     return parser.parse_args()
 
 
@@ -236,6 +592,8 @@ def main():
     print("xingjian: GREEN → auto-commit | RED → reset --hard")
     print("xingjian: Ctrl-C to stop")
 
+    pool = start_warm_pool(args)
+    graph = ImportGraph(Path.cwd())
     before = snapshot(Path.cwd())
     try:
         while True:
@@ -244,11 +602,16 @@ def main():
             if after != before:
                 after = wait_until_settled(after)
                 changed = detect_changed(before, after, self_path)
-                long_convexity_commit_revert_cycle(changed)
+                dependents = graph.dependents(changed, after, self_path)
+                long_convexity_commit_revert_cycle(
+                    changed, pool, dependents, args.jobs)
                 # absorb any changes the watcher itself made (a revert rewrites files)
                 before = snapshot(Path.cwd())
     except KeyboardInterrupt:
         print("\nxingjian: stopped. your last commit is the truth.")
+    finally:
+        if pool is not None:
+            pool.close()
 
 if __name__ == "__main__": 
     main()